@@ -0,0 +1,329 @@
+"""bench_matrices.py
+Micro-benchmarks de las rutinas de matrices.py.
+
+Uso:
+    python bench_matrices.py            # ejecuta todos los benchmarks
+    python bench_matrices.py exacto     # sólo uno de ellos
+
+Cada benchmark imprime una tabla con el tiempo medio por llamada.
+"""
+
+import random
+import sys
+import time
+from fractions import Fraction
+
+import matrices
+
+
+def _medir(func, repeticiones=3):
+    """Devuelve el mejor tiempo (segundos) de varias ejecuciones de func()."""
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        func()
+        mejor = min(mejor, time.perf_counter() - t0)
+    return mejor
+
+
+def _requiere_numpy(nombre):
+    """True (y un aviso) si falta NumPy: el benchmark 'nombre' se omite, como hace matrices.py."""
+    if matrices.np is None:
+        print(f"{nombre}: omitido (requiere NumPy)")
+        print()
+        return True
+    return False
+
+
+def _matriz_entera(n, m, lo=-9, hi=9, semilla=0):
+    rnd = random.Random(semilla)
+    return [[rnd.randint(lo, hi) for _ in range(m)] for _ in range(n)]
+
+
+# -------------------- MODO EXACTO --------------------
+def _gauss_jordan_fraction_ingenuo(datos):
+    """Gauss-Jordan directo sobre Fraction (la alternativa ingenua al modo exacto)."""
+    A = [[Fraction(x) for x in fila] for fila in datos]
+    n, m = len(A), len(A[0])
+    fila = 0
+    for col in range(m - 1):
+        pr = next((r for r in range(fila, n) if A[r][col] != 0), None)
+        if pr is None:
+            continue
+        A[fila], A[pr] = A[pr], A[fila]
+        p = A[fila][col]
+        A[fila] = [x / p for x in A[fila]]
+        for r in range(n):
+            if r != fila and A[r][col] != 0:
+                f = A[r][col]
+                A[r] = [A[r][k] - f * A[fila][k] for k in range(m)]
+        fila += 1
+        if fila >= n:
+            break
+    return A
+
+
+def bench_exacto(tamanos=(5, 10, 20, 40)):
+    print("Gauss-Jordan exacto: Fraction ingenuo vs Bareiss")
+    print(f"{'n':>5} {'Fraction (s)':>14} {'Bareiss (s)':>14} {'aceleración':>12}")
+    for n in tamanos:
+        datos = _matriz_entera(n, n + 1, semilla=n)
+        t_frac = _medir(lambda: _gauss_jordan_fraction_ingenuo(datos))
+        t_bar = _medir(lambda: matrices.Matriz(datos).gauss_jordan(exacto=True))
+        print(f"{n:>5} {t_frac:>14.5f} {t_bar:>14.5f} {t_frac / t_bar:>11.1f}x")
+    print()
+
+
+# -------------------- PRODUCTO MATRICIAL --------------------
+def _multiplicar_ingenuo(A, B):
+    """Triple bucle i-j-k con acceso por columnas a B (la formulación original)."""
+    n, m, p = len(A), len(B), len(B[0])
+    C = [[0.0 for _ in range(p)] for __ in range(n)]
+    for i in range(n):
+        for j in range(p):
+            s = 0.0
+            for k in range(m):
+                s += A[i][k] * B[k][j]
+            C[i][j] = s
+    return C
+
+
+def _matriz_real(n, m, semilla=0):
+    rnd = random.Random(semilla)
+    return [[rnd.uniform(-1, 1) for _ in range(m)] for _ in range(n)]
+
+
+def bench_multiplicar(tamanos=(64, 128, 256, 384), procesos=4):
+    print(f"Producto n x n: ingenuo vs bloques vs bloques + {procesos} procesos")
+    print(f"{'n':>5} {'ingenuo (s)':>12} {'bloques (s)':>12} {'paralelo (s)':>13} {'bloq/ing':>9} {'par/ing':>8}")
+    for n in tamanos:
+        A = _matriz_real(n, n, semilla=1)
+        B = _matriz_real(n, n, semilla=2)
+        t_ing = _medir(lambda: _multiplicar_ingenuo(A, B), repeticiones=1)
+        t_blo = _medir(lambda: matrices.multiplicar_bloques(A, B))
+        t_par = _medir(lambda: matrices.multiplicar_bloques(A, B, procesos=procesos))
+        print(f"{n:>5} {t_ing:>12.4f} {t_blo:>12.4f} {t_par:>13.4f} {t_ing / t_blo:>8.1f}x {t_ing / t_par:>7.1f}x")
+    print()
+
+
+def bench_strassen(tamanos=(128, 256, 384, 512)):
+    cal = matrices.calibrar_strassen(aplicar=False)
+    print(f"Calibración Strassen: umbral = {cal['umbral']}")
+    for med in cal["mediciones"]:
+        print(f"  n={med['n']:>4}  bloques {med['bloques']:.4f} s  strassen {med['strassen']:.4f} s")
+    print(f"{'n':>5} {'bloques (s)':>12} {'strassen (s)':>13} {'aceleración':>12}")
+    for n in tamanos:
+        A = _matriz_real(n, n, semilla=3)
+        B = _matriz_real(n, n, semilla=4)
+        t_blo = _medir(lambda: matrices.multiplicar_bloques(A, B), repeticiones=1)
+        t_str = _medir(lambda: matrices.multiplicar_strassen(A, B), repeticiones=1)
+        print(f"{n:>5} {t_blo:>12.4f} {t_str:>13.4f} {t_blo / t_str:>11.2f}x")
+    print()
+
+
+def bench_modular(tamanos=(16, 32, 64, 96)):
+    print("Determinante exacto: Bareiss vs multimodular (CRT)")
+    print(f"{'n':>5} {'Bareiss (s)':>12} {'modular (s)':>12} {'aceleración':>12}")
+    for n in tamanos:
+        datos = _matriz_entera(n, n, semilla=n)
+        t_bar = _medir(lambda: matrices._determinante_bareiss(datos), repeticiones=1)
+        t_mod = _medir(lambda: matrices.determinante_modular(datos), repeticiones=1)
+        print(f"{n:>5} {t_bar:>12.4f} {t_mod:>12.4f} {t_bar / t_mod:>11.2f}x")
+    print()
+
+
+# -------------------- MATRICES PEQUEÑAS --------------------
+def _det_eliminacion(A):
+    """Determinante por eliminación con pivoteo parcial (el bucle general, sin despacho)."""
+    M = [list(map(float, fila)) for fila in A]
+    n = len(M)
+    det = 1.0
+    for i in range(n):
+        p = max(range(i, n), key=lambda r: abs(M[r][i]))
+        if abs(M[p][i]) < 1e-12:
+            return 0.0
+        if p != i:
+            M[i], M[p] = M[p], M[i]
+            det = -det
+        det *= M[i][i]
+        for r in range(i + 1, n):
+            f = M[r][i] / M[i][i]
+            M[r] = [a - f * b for a, b in zip(M[r], M[i])]
+    return det
+
+
+def _inversa_eliminacion(A):
+    n = len(A)
+    aug = [list(map(float, f)) + [float(i == j) for j in range(n)] for i, f in enumerate(A)]
+    for c in range(n):
+        p = max(range(c, n), key=lambda r: abs(aug[r][c]))
+        aug[c], aug[p] = aug[p], aug[c]
+        piv = aug[c][c]
+        aug[c] = [x / piv for x in aug[c]]
+        for r in range(n):
+            if r != c:
+                f = aug[r][c]
+                aug[r] = [a - f * b for a, b in zip(aug[r], aug[c])]
+    return [f[n:] for f in aug]
+
+
+def _cramer_eliminacion(A, b):
+    detA = _det_eliminacion(A)
+    return [_det_eliminacion([f[:j] + [bi] + f[j + 1:] for f, bi in zip(A, b)]) / detA for j in range(len(A))]
+
+
+def bench_pequenas(repeticiones=2000):
+    print(f"Latencia por llamada (µs, {repeticiones} llamadas): bucle general vs fórmula cerrada")
+    print(f"{'n':>3} {'operación':>10} {'general':>10} {'cerrada':>10} {'aceleración':>12}")
+    for n in (2, 3, 4):
+        A = _matriz_real(n, n, semilla=n)
+        b = [1.0] * n
+        casos = [
+            ("det", lambda: _det_eliminacion(A), lambda: matrices.determinante_pequeno(A)),
+            ("inversa", lambda: _inversa_eliminacion(A), lambda: matrices.inversa_pequena(A)),
+            ("cramer", lambda: _cramer_eliminacion(A, b), lambda: matrices.cramer_pequeno(A, b)),
+        ]
+        for nombre, general, cerrada in casos:
+            t_gen = _medir(lambda: [general() for _ in range(repeticiones)]) / repeticiones * 1e6
+            t_cer = _medir(lambda: [cerrada() for _ in range(repeticiones)]) / repeticiones * 1e6
+            print(f"{n:>3} {nombre:>10} {t_gen:>10.2f} {t_cer:>10.2f} {t_gen / t_cer:>11.1f}x")
+    print()
+
+
+# -------------------- EXPRESIONES PEREZOSAS --------------------
+def bench_perezosa(tamanos=(50, 100, 200)):
+    print("A + B - C + 2*A - B: operadores inmediatos vs expresión perezosa (fusionada)")
+    print(f"{'n':>5} {'inmediato (s)':>14} {'perezosa (s)':>13} {'aceleración':>12}")
+    for n in tamanos:
+        A, B, C = (matrices.Matriz(_matriz_real(n, n, semilla=s)) for s in (5, 6, 7))
+        t_inm = _medir(lambda: A + B - C + 2 * A - B)
+        t_per = _medir(lambda: (A.perezosa() + B - C + 2 * A - B).evaluar())
+        print(f"{n:>5} {t_inm:>14.4f} {t_per:>13.4f} {t_inm / t_per:>11.2f}x")
+    print()
+
+
+# -------------------- MEMORIA --------------------
+def bench_memoria(n=1000):
+    import tracemalloc
+    rnd = random.Random(0)
+
+    def medir(crear):
+        tracemalloc.start()
+        antes = tracemalloc.get_traced_memory()[0]
+        obj = crear()
+        despues = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del obj
+        return (despues - antes) / 1e6
+
+    # Las entradas se generan dentro de la medición: cada float "boxed" cuenta como propio
+    listas = medir(lambda: [[rnd.random() for _ in range(n)] for _ in range(n)])
+    compacta = medir(lambda: matrices.Matriz([[rnd.random() for _ in range(n)] for _ in range(n)]))
+    print(f"Memoria de una matriz {n}x{n}")
+    print(f"  lista de listas de float : {listas:8.2f} MB")
+    print(f"  Matriz (array('d') plano): {compacta:8.2f} MB  ({listas / compacta:.1f}x menos)")
+    print()
+
+
+# -------------------- OPERACIONES EN SITIO --------------------
+def bench_en_sitio(n=200, k=30):
+    import tracemalloc
+    mats = [matrices.Matriz(_matriz_real(n, n, semilla=s)) for s in range(k)]
+
+    def reducir_copiando():
+        r = mats[0]
+        for M in mats[1:]:
+            r = r + M
+        return r
+
+    def reducir_en_sitio():
+        r = matrices.Matriz(mats[0].to_list())
+        for M in mats[1:]:
+            r += M
+        return r
+
+    print(f"Suma de {k} matrices {n}x{n}: operador + vs acumulador en sitio (+=)")
+    print(f"{'variante':>10} {'tiempo (s)':>11} {'pico extra (MB)':>16}")
+    for nombre, func in (("copiando", reducir_copiando), ("en sitio", reducir_en_sitio)):
+        t = _medir(func)
+        tracemalloc.start()
+        func()
+        pico = tracemalloc.get_traced_memory()[1] / 1e6
+        tracemalloc.stop()
+        print(f"{nombre:>10} {t:>11.4f} {pico:>16.2f}")
+    print()
+
+
+# -------------------- PRECISIÓN MIXTA --------------------
+def bench_precision_mixta(tamanos=(256, 512, 1024)):
+    if _requiere_numpy("precision_mixta"):
+        return
+    print("Sistema denso n x n: LU en float64 vs LU float32 + refinamiento float64")
+    print(f"{'n':>5} {'float64 (s)':>12} {'mixta (s)':>10} {'pasos':>6} {'error rel.':>11}")
+    for n in tamanos:
+        A = _matriz_real(n, n, semilla=8)
+        for i in range(n):
+            A[i][i] += n ** 0.5  # bien condicionada: el refinamiento converge
+        b = [1.0] * n
+        t_dob = _medir(lambda: matrices._lu_bloques(matrices.np.asarray(A, dtype=float)), repeticiones=1)
+        t_mix = _medir(lambda: matrices.resolver_precision_mixta(A, b), repeticiones=1)
+        res = matrices.resolver_precision_mixta(A, b)
+        print(f"{n:>5} {t_dob:>12.4f} {t_mix:>10.4f} {res['iteraciones']:>6} {res['residuos'][-1]:>11.2e}")
+    print()
+
+
+# -------------------- FUERA DE MEMORIA --------------------
+def bench_fuera_de_memoria(n=2000, memoria=8 * 2 ** 20):
+    if _requiere_numpy("fuera_de_memoria"):
+        return
+    import os
+    import tempfile
+    rnd = random.Random(9)
+    with tempfile.TemporaryDirectory() as tmp:
+        ruta = os.path.join(tmp, "A.f64")
+        with open(ruta, "wb") as f:
+            for i in range(n):
+                fila = [rnd.uniform(-1, 1) for _ in range(n + 1)]
+                fila[i] += n ** 0.5
+                matrices.array("d", fila).tofile(f)
+        t = time.perf_counter()
+        res = matrices.resolver_fuera_de_memoria(ruta, n, memoria=memoria)
+        t = time.perf_counter() - t
+    print(f"Resolución fuera de memoria n={n}, {memoria / 2 ** 20:.0f} MB de RAM, panel de {res['tam_panel']} columnas: {t:.2f} s")
+    print(f"{'fase':>14} {'leídos (MB)':>12} {'escritos (MB)':>14} {'tiempo (s)':>11}")
+    for fase, io in res["io"].items():
+        print(f"{fase:>14} {io['leidos'] / 1e6:>12.1f} {io['escritos'] / 1e6:>14.1f} {io['segundos']:>11.3f}")
+    print()
+
+
+# -------------------- ELIMINACIÓN PARALELA --------------------
+def bench_paralelo(n=2048, hilos=None):
+    if _requiere_numpy("paralelo"):
+        return
+    res = matrices.medir_escalado_paralelo(n=n, hilos=hilos)
+    print(f"LU paralela por bloques n={n}: escalado de 1 a {len(res['mediciones'])} hilos")
+    print(f"{'hilos':>6} {'tiempo (s)':>11} {'aceleración':>12} {'eficiencia':>11}")
+    for med in res["mediciones"]:
+        print(f"{med['hilos']:>6} {med['segundos']:>11.4f} {med['aceleracion']:>11.2f}x {med['eficiencia']:>10.0%}")
+    print()
+
+
+BENCHMARKS = {
+    "exacto": bench_exacto,
+    "multiplicar": bench_multiplicar,
+    "strassen": bench_strassen,
+    "modular": bench_modular,
+    "pequenas": bench_pequenas,
+    "perezosa": bench_perezosa,
+    "memoria": bench_memoria,
+    "en_sitio": bench_en_sitio,
+    "precision_mixta": bench_precision_mixta,
+    "fuera_de_memoria": bench_fuera_de_memoria,
+    "paralelo": bench_paralelo,
+}
+
+
+if __name__ == "__main__":
+    nombres = sys.argv[1:] or list(BENCHMARKS)
+    for nombre in nombres:
+        BENCHMARKS[nombre]()
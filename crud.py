@@ -55,19 +55,71 @@ def eliminar_matriz(nombre):
     else:
         print(f"Error: No se pudo eliminar la matriz '{nombre}'. ¿Existe?")
 
+def _es_sistema_grande(datos):
+    """Sistemas densos desde UMBRAL_FUERA_DE_MEMORIA ecuaciones se resuelven en disco (requiere NumPy).
+    'datos' ya viene de ARCHIVO_MATRICES, que json.load lee completo: el límite de memoria sólo
+    vale para la eliminación, no para la primera exportación a binario."""
+    return matrices.np is not None and isinstance(datos, list) and len(datos) >= matrices.UMBRAL_FUERA_DE_MEMORIA
+
+def _resolver_fuera_de_memoria(nombre, meta):
+    """Resuelve la aumentada binaria 'meta' (persistencia.guardar_matriz_binaria) sin cargarla en RAM."""
+    resultado = matrices.resolver_fuera_de_memoria(meta["archivo"], meta["n"], meta["m"])
+    print(f"Solución del sistema para la matriz '{nombre}' (eliminación fuera de memoria):")
+    if resultado["x"] is not None:
+        for i, valor in enumerate(resultado["x"]):
+            print(f"x{i+1} = {valor}")
+    print(resultado["mensaje"])
+    return resultado
+
 def resolver_matriz(nombre):
+    """Resuelve la matriz aumentada guardada. Si hay una copia binaria (o el sistema es grande y
+    se exporta a binario) se usa la eliminación fuera de memoria; si no, Gauss en memoria.
+
+    Límite: la primera vez, un sistema grande guardado en JSON se carga entero (json.load de
+    ARCHIVO_MATRICES) antes de exportarlo, así que ese paso sí necesita la matriz en RAM. Para
+    no cargarla nunca, guárdela directamente con persistencia.guardar_matriz_binaria."""
+    try:
+        meta = persistencia.cargar_matriz_binaria(nombre)
+        if meta is not None:
+            return _resolver_fuera_de_memoria(nombre, meta)
+        matriz = persistencia.cargar_matriz(nombre)
+        if matriz is None:
+            print(f"Error: No se encontró la matriz '{nombre}'.")
+            return None
+        if _es_sistema_grande(matriz['datos']):
+            meta = persistencia.exportar_matriz_binaria(nombre)
+            if meta is not None:
+                return _resolver_fuera_de_memoria(nombre, meta)
+        # como_matriz elige la eliminación dispersa (Markowitz) si la matriz es grande y rala
+        resultado = matrices.como_matriz(matriz['datos']).gauss()
+        print(f"Solución del sistema para la matriz '{nombre}':")
+        if isinstance(resultado["solucion"], dict):
+            for variable, valor in resultado["solucion"].items():
+                print(f"{variable} = {valor}")
+        print(resultado["mensaje"])
+        return resultado
+    except Exception as e:
+        print(f"Error durante la resolución: {e}")
+        return None
+
+def resolver_matriz_iterativo(nombre, metodo="jacobi", tol=1e-10, max_iter=500, omega=1.25):
+    """Resuelve la matriz aumentada guardada con un método iterativo
+    ("jacobi", "gauss-seidel", "sor" o "cg")."""
     matriz = persistencia.cargar_matriz(nombre)
     if matriz is None:
         print(f"Error: No se encontró la matriz '{nombre}'.")
-        return
-    
+        return None
+
     try:
-        solucion = matrices.resolver_gauss_jordan(matriz['datos'])
+        resultado = matrices.Matriz(matriz['datos']).iterativo(metodo, tol, max_iter, omega, mostrar_pasos=False)
         print(f"Solución del sistema para la matriz '{nombre}':")
-        for i, valor in enumerate(solucion):
-            print(f"x{i+1} = {valor}")
+        for variable, valor in resultado["solucion"].items():
+            print(f"{variable} = {valor}")
+        print(resultado["mensaje"])
+        return resultado
     except Exception as e:
         print(f"Error durante la resolución: {e}")
+        return None
 
 # --- Funciones CRUD para Conjuntos de Vectores ---
 
@@ -76,7 +128,8 @@ def crear_conjunto_vectores(nombre, num_vectores, dimension, datos):
         "nombre": nombre,
         "num_vectores": num_vectores,
         "dimension": dimension,
-        "datos": datos
+        "datos": datos,
+        "rastreador": _rastreador_conjunto(datos)
     }
     if persistencia.guardar_conjunto_vectores(nombre, nuevo_conjunto):
         print(f"Conjunto de vectores '{nombre}' creado y guardado exitosamente.")
@@ -85,12 +138,47 @@ def crear_conjunto_vectores(nombre, num_vectores, dimension, datos):
         print(f"Error: No se pudo guardar el conjunto de vectores '{nombre}'.")
         return False
 
+def _rastreador_conjunto(datos, previo=None):
+    """Estado del rastreador de independencia para 'datos'. Si 'previo' (el conjunto guardado)
+    es un prefijo de 'datos', sólo se agregan los vectores nuevos; si no, se reconstruye.
+    No imprime nada: los mensajes de dependencia los arma quien llama a partir de "dependencias"."""
+    if not datos:
+        return None
+    if previo and previo.get("rastreador") and previo["datos"] == datos[:len(previo["datos"])] \
+            and previo["rastreador"]["dimension"] == len(datos[0]):
+        rastreador = matrices.RastreadorIndependencia.desde_dict(previo["rastreador"])
+        for v in datos[len(previo["datos"]):]:
+            rastreador.agregar(v)
+    else:
+        rastreador = matrices.RastreadorIndependencia.desde_vectores(datos)
+    return rastreador.a_dict()
+
+def agregar_vector_conjunto(nombre, vector):
+    """Agrega un vector al conjunto y retorna el informe de dependencia (None si falla)."""
+    conjunto = persistencia.cargar_conjunto_vectores(nombre)
+    if not conjunto:
+        print(f"Error: No se encontró el conjunto de vectores '{nombre}'.")
+        return None
+    if conjunto.get("rastreador"):
+        rastreador = matrices.RastreadorIndependencia.desde_dict(conjunto["rastreador"])
+    else:
+        rastreador = matrices.RastreadorIndependencia.desde_vectores(conjunto["datos"])
+    informe = rastreador.agregar(vector)
+    conjunto["datos"].append(list(vector))
+    conjunto["num_vectores"] = len(conjunto["datos"])
+    conjunto["rastreador"] = rastreador.a_dict()
+    if persistencia.actualizar_conjunto_vectores(nombre, conjunto):
+        return informe
+    print(f"Error: No se pudo actualizar el conjunto de vectores '{nombre}'.")
+    return None
+
 def actualizar_conjunto_vectores(nombre, nuevos_datos, nuevo_num_vectores, nueva_dimension):
     conjunto_actualizado = {
         "nombre": nombre,
         "num_vectores": nuevo_num_vectores,
         "dimension": nueva_dimension,
-        "datos": nuevos_datos
+        "datos": nuevos_datos,
+        "rastreador": _rastreador_conjunto(nuevos_datos, persistencia.cargar_conjunto_vectores(nombre))
     }
     if persistencia.actualizar_conjunto_vectores(nombre, conjunto_actualizado):
         return True
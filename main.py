@@ -1,6 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import math
+import os
 from crud import (
     crear_matriz,
     actualizar_matriz,
@@ -322,6 +323,12 @@ class MatrixCRUDApp:
                 "Inversa",
                 "Determinante",
                 "Independencia",
+                "Jacobi",
+                "Gauss-Seidel",
+                "SOR",
+                "Gradiente conjugado",
+                "Mínimos cuadrados",
+                "Varios lados derechos",
             ],
             state="readonly",
             width=16,
@@ -342,6 +349,13 @@ class MatrixCRUDApp:
         # Botón crear matriz
         ttk.Button(main_frame, text="Crear matriz", command=self.create_matrix, style='Dark.TButton').grid(row=3, column=0, columnspan=4, pady=(10, 20), sticky="ew")
 
+        # Modo exacto (Bareiss): resultados racionales sin redondeo
+        self.exact_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(main_frame, text="Modo exacto (fracciones)", variable=self.exact_var, bg="#23272e", fg="#e0e0e0",
+                       selectcolor="#393e46", activebackground="#23272e", activeforeground="#00adb5",
+                       font=('Segoe UI', 11), highlightthickness=0, bd=0)\
+            .grid(row=4, column=0, columnspan=4, sticky="w", pady=(0, 10))
+
         # Lista de matrices
         # --- Lista de Matrices en panel lateral izquierdo (Calculadora) ---
         # Etiqueta en esquina superior izquierda
@@ -520,6 +534,13 @@ class MatrixCRUDApp:
 
         ttk.Button(container, text="Crear Conjunto de Vectores", style='Dark.TButton', command=self.create_vector_set_ui).grid(row=3, column=0, columnspan=4, pady=(10, 20), sticky='ew')
 
+        # Modo exacto: rango y relaciones por aritmética multimodular (sin tolerancias)
+        self.ind_exact_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(container, text="Modo exacto (aritmética modular)", variable=self.ind_exact_var, bg="#23272e", fg="#e0e0e0",
+                       selectcolor="#393e46", activebackground="#23272e", activeforeground="#00adb5",
+                       font=('Segoe UI', 11), highlightthickness=0, bd=0)\
+            .grid(row=4, column=0, columnspan=4, sticky='w', pady=(0, 10))
+
         # --- Lista de Conjuntos y Acciones (distribución similar a matrices) ---
         # --- Lista de Conjuntos de Vectores en panel lateral izquierdo (Vectores) ---
         ttk.Label(self.vec_left_panel, text="Conjuntos de Vectores Almacenados:", style='Dark.TLabel')\
@@ -1914,11 +1935,23 @@ class MatrixCRUDApp:
         # Selector de operación al lado derecho de Filas y Columnas
         ttk.Label(container, text="Operación:", style='Dark.TLabel').grid(row=2, column=6, sticky='e', padx=(10,5))
         self.ops_method_var = tk.StringVar(value=" ")
-        self.ops_method_combobox = ttk.Combobox(container, textvariable=self.ops_method_var, values=["Suma", "Resta", "Multiplicación"], state="readonly", width=16)
+        self.ops_method_combobox = ttk.Combobox(container, textvariable=self.ops_method_var, values=["Suma", "Resta", "Multiplicación", "Potencia", "Polinomio"], state="readonly", width=16)
         self.ops_method_combobox.grid(row=2, column=7, sticky='w')
 
         ttk.Button(container, text="Crear Conjunto de Matrices", style='Dark.TButton', command=self.create_matrix_set_ui).grid(row=3, column=0, columnspan=8, pady=(10, 20), sticky='ew')
 
+        # Sin pasos, las operaciones se calculan en lote (una sola pasada vectorizada)
+        self.ops_show_steps_var = tk.BooleanVar(value=True)
+        tk.Checkbutton(container, text="Mostrar pasos", variable=self.ops_show_steps_var, bg="#23272e", fg="#e0e0e0",
+                       selectcolor="#393e46", activebackground="#23272e", activeforeground="#00adb5",
+                       font=('Segoe UI', 11), highlightthickness=0, bd=0)\
+            .grid(row=4, column=0, columnspan=4, sticky='w', pady=(0, 10))
+
+        # Potencia: exponente k (se aplica a M1). Polinomio: coeficientes de mayor a menor grado
+        ttk.Label(container, text="Exponente / coeficientes:", style='Dark.TLabel').grid(row=4, column=4, columnspan=2, sticky='e', pady=(0, 10))
+        self.ops_param_entry = ttk.Entry(container, width=18, style='Entry.TEntry')
+        self.ops_param_entry.grid(row=4, column=6, columnspan=2, sticky='w', pady=(0, 10))
+
         # Lista de conjuntos + acciones
         # --- Lista de Conjuntos de Matrices en panel lateral izquierdo (Operadores) ---
         ttk.Label(self.ops_left_panel, text="Conjuntos de Matrices Almacenados:", style='Dark.TLabel')\
@@ -2168,17 +2201,54 @@ class MatrixCRUDApp:
                 self.ops_steps_text.insert(tk.END, self._format_matrix_for_display(mat_list))
                 self.ops_steps_text.insert(tk.END, "\n")
 
+            # Potencia y polinomio operan sobre M1 (exponenciación binaria / Horner)
+            if op in ("Potencia", "Polinomio"):
+                texto = self.ops_param_entry.get().strip()
+                if not texto:
+                    raise ValueError("Ingresa el exponente (Potencia) o los coeficientes separados por comas (Polinomio).")
+                A = mats[0]
+                show_matrix_block("A = M1:", A.to_list())
+                if op == "Potencia":
+                    k = int(texto)
+                    resultado = A.potencia(k, mostrar_pasos=self.ops_show_steps_var.get())
+                    titulo = f"Resultado de A^{k}:"
+                else:
+                    coefs = [float(c) for c in texto.replace(";", ",").split(",") if c.strip()]
+                    resultado = A.polinomio(coefs, mostrar_pasos=self.ops_show_steps_var.get())
+                    titulo = "Resultado de p(A):"
+                for idx, paso in enumerate(resultado["pasos"], start=1):
+                    show_matrix_block(f"Paso {idx}: {paso['descripcion']}", paso["matriz"])
+                self.ops_steps_text.insert(tk.END, resultado["mensaje"] + "\n")
+                self.ops_result_text.insert(tk.END, titulo + "\n")
+                self.ops_result_text.insert(tk.END, self._format_matrix_for_display([[fmt_val(x) for x in fila] for fila in resultado["resultado"].to_list()]))
+                return
+
+            # Sin pasos: todo el conjunto se opera como un único lote (k, n, m)
+            if not self.ops_show_steps_var.get() and op in ("Suma", "Resta", "Multiplicación"):
+                lote = matrices.LoteMatrices(data['datos'])
+                if op == "Suma":
+                    res, titulo = lote.suma(), "Resultado de la suma:"
+                elif op == "Resta":
+                    res, titulo = lote.resta(), "Resultado de la resta (M1 - M2 - ...):"
+                else:
+                    res, titulo = lote.producto(), "Resultado de la multiplicación (M1 @ M2 @ ...):"
+                self.ops_result_text.insert(tk.END, titulo + "\n")
+                self.ops_result_text.insert(tk.END, self._format_matrix_for_display([[fmt_val(x) for x in fila] for fila in res.to_list()]))
+                return
+
             if op == "Suma":
                 # Mostrar matrices iniciales
                 for idx, m in enumerate(mats, start=1):
                     show_matrix_block(f"M{idx}:", m.to_list())
 
-                res = mats[0]
+                # Acumulador en sitio: una sola matriz de trabajo para todo el conjunto
+                res = matrices.Matriz(data['datos'][0])
                 paso = 1
                 for idx, M in enumerate(mats[1:], start=2):
                     A = res.to_list()
                     B = M.to_list()
-                    R = res.sumar(M).to_list()
+                    res += M
+                    R = res.to_list()
                     self.ops_steps_text.insert(tk.END, f"Paso {paso}: R{paso} = {'R'+str(paso-1) if paso>1 else 'M1'} + M{idx}\n")
                     # Detalle elemento a elemento
                     for i in range(len(A)):
@@ -2188,7 +2258,6 @@ class MatrixCRUDApp:
                                 f"  r[{i+1},{j+1}] = {fmt_val(A[i][j])} + {fmt_val(B[i][j])} = {fmt_val(R[i][j])}\n",
                             )
                     show_matrix_block("\nResultado parcial:", R)
-                    res = matrices.Matriz(R)
                     paso += 1
 
                 self.ops_result_text.insert(tk.END, "Resultado de la suma:\n")
@@ -2198,12 +2267,14 @@ class MatrixCRUDApp:
                 for idx, m in enumerate(mats, start=1):
                     show_matrix_block(f"M{idx}:", m.to_list())
 
-                res = mats[0]
+                # Acumulador en sitio: una sola matriz de trabajo para todo el conjunto
+                res = matrices.Matriz(data['datos'][0])
                 paso = 1
                 for idx, M in enumerate(mats[1:], start=2):
                     A = res.to_list()
                     B = M.to_list()
-                    R = res.restar(M).to_list()
+                    res -= M
+                    R = res.to_list()
                     self.ops_steps_text.insert(tk.END, f"Paso {paso}: R{paso} = {'R'+str(paso-1) if paso>1 else 'M1'} - M{idx}\n")
                     for i in range(len(A)):
                         for j in range(len(A[0])):
@@ -2212,7 +2283,6 @@ class MatrixCRUDApp:
                                 f"  r[{i+1},{j+1}] = {fmt_val(A[i][j])} - {fmt_val(B[i][j])} = {fmt_val(R[i][j])}\n",
                             )
                     show_matrix_block("\nResultado parcial:", R)
-                    res = matrices.Matriz(R)
                     paso += 1
 
                 self.ops_result_text.insert(tk.END, "Resultado de la resta (M1 - M2 - ...):\n")
@@ -2223,17 +2293,26 @@ class MatrixCRUDApp:
                 for idx, m in enumerate(mats, start=1):
                     show_matrix_block(f"M{idx}:", m.to_list())
 
+                # Compatibilidad de toda la cadena y orden óptimo de los productos
+                for idx in range(len(mats) - 1):
+                    if mats[idx].m != mats[idx+1].n:
+                        raise ValueError(f"Dimensiones incompatibles para multiplicación: {mats[idx].n}x{mats[idx].m} * {mats[idx+1].n}x{mats[idx+1].m}")
+                plan = matrices.plan_cadena([mats[0].n] + [M.m for M in mats])
+                self.ops_steps_text.insert(
+                    tk.END,
+                    f"Orden planificado: {plan['orden']} — {plan['flops']} multiplicaciones escalares "
+                    f"(izquierda a derecha: {plan['flops_secuencial']})\n\n",
+                )
+
+                operandos = {f"M{i}": m.to_list() for i, m in enumerate(mats, start=1)}
                 res = mats[0]
                 paso = 1
-                for idx, M in enumerate(mats[1:], start=2):
-                    A = res.to_list()
-                    B = M.to_list()
-                    # Compatibilidad
-                    if len(A[0]) != len(B):
-                        raise ValueError(f"Dimensiones incompatibles para multiplicación: {len(A)}x{len(A[0])} * {len(B)}x{len(B[0])}")
+                for prod in plan["productos"]:
+                    A = operandos[prod["izq"]]
+                    B = operandos[prod["der"]]
                     n, p, mcols = len(A), len(B[0]), len(A[0])
                     R = [[0.0 for _ in range(p)] for __ in range(n)]
-                    self.ops_steps_text.insert(tk.END, f"Paso {paso}: R{paso} = {'R'+str(paso-1) if paso>1 else 'M1'} @ M{idx}\n")
+                    self.ops_steps_text.insert(tk.END, f"Paso {paso}: {prod['res']} = {prod['izq']} @ {prod['der']} ({n * mcols * p} mult.)\n")
                     for i in range(n):
                         for j in range(p):
                             terms = []
@@ -2247,10 +2326,11 @@ class MatrixCRUDApp:
                                 f"  r[{i+1},{j+1}] = " + " + ".join(terms) + f" = {fmt_val(s)}\n",
                             )
                     show_matrix_block("\nResultado parcial:", R)
+                    operandos[prod["res"]] = R
                     res = matrices.Matriz(R)
                     paso += 1
 
-                self.ops_result_text.insert(tk.END, "Resultado de la multiplicación (M1 @ M2 @ ...):\n")
+                self.ops_result_text.insert(tk.END, f"Resultado de la multiplicación {plan['orden']}:\n")
                 self.ops_result_text.insert(tk.END, self._format_matrix_for_display(res.to_list()))
             else:
                 messagebox.showerror("Operación desconocida", op)
@@ -2320,7 +2400,7 @@ class MatrixCRUDApp:
         try:
             # Se necesita una instancia de Matriz para llamar al método.
             dummy_matrix = matrices.Matriz([[1]])
-            resultado = dummy_matrix.independencia_vectores(vectores)
+            resultado = dummy_matrix.independencia_vectores(vectores, exacto=self.ind_exact_var.get())
 
             # Limpiar áreas de texto
             self.independence_result_text.delete(1.0, tk.END)
@@ -2347,6 +2427,18 @@ class MatrixCRUDApp:
         except Exception as e:
             messagebox.showerror("Error", f"Ocurrió un error inesperado: {e}")
 
+    def _format_salud(self, salud):
+        """Texto del informe numérico (condición, crecimiento de pivotes, error hacia atrás)."""
+        lineas = [f"Número de condición (cond₁, estimado): {salud['condicion']:.3e}"
+                  f" (≈ {salud['digitos_perdidos']:.1f} dígitos perdidos)"]
+        if salud.get("crecimiento_pivotes") is not None:
+            lineas.append(f"Crecimiento de pivotes: {salud['crecimiento_pivotes']:.3g}")
+        if salud.get("error_atras") is not None:
+            lineas.append(f"Error relativo hacia atrás: {salud['error_atras']:.3e}")
+        if salud.get("advertencia"):
+            lineas.append(f"Advertencia: {salud['advertencia']}")
+        return "\n".join(lineas) + "\n"
+
     def _format_matrix_for_display(self, matrix_data):
         if not matrix_data or not any(matrix_data):
             return ""
@@ -2515,12 +2607,22 @@ class MatrixCRUDApp:
 
         try:
             matriz_obj = matrices.Matriz(matrix_data['datos'])
-            resultado = matriz_obj.inversa()
+            exacto = self.exact_var.get()
+            # Si la matriz sólo cambió en unas pocas filas, se actualiza la inversa en caché (O(n²·k))
+            resultado = None if exacto else matrices.cache_resultados.inversa(matrix_name, matrix_data['datos'])
+            if resultado is None:
+                resultado = matriz_obj.inversa(exacto=exacto, hilos=os.cpu_count())
+                if not exacto:
+                    matrices.cache_resultados.registrar(matrix_name, matrix_data['datos'], resultado.get("valores"), resultado.get("determinante"))
 
             self.result_text.delete(1.0, tk.END)
             self.steps_text.delete(1.0, tk.END)
 
             self.result_text.insert(tk.END, resultado.get("mensaje", "No se generó mensaje.") + "\n")
+            if "metodo" in resultado:
+                self.result_text.insert(tk.END, f"Método: {resultado['metodo']}\n")
+            if resultado.get("salud"):
+                self.result_text.insert(tk.END, self._format_salud(resultado["salud"]))
             if resultado.get("inversa"):
                 formatted_inv = self._format_matrix_for_display(resultado["inversa"])
                 self.result_text.insert(tk.END, "\nInversa:\n" + formatted_inv)
@@ -2555,7 +2657,7 @@ class MatrixCRUDApp:
 
         # Si es aumentada n x (n+1), tomar sólo los coeficientes
         if m == n + 1:
-            A = [fila[:-1] for fila in datos]
+            A = matrices.bloque_coeficientes(datos)
             note = " (se usó sólo la matriz de coeficientes)."
         elif m == n:
             A = datos
@@ -2565,10 +2667,18 @@ class MatrixCRUDApp:
             return
 
         try:
-            resultado = matrices.determinante_por_gauss_con_pasos(A, mostrar_pasos=True)
+            # Con una inversa en caché, el determinante se actualiza con el lema del determinante
+            resultado = None
+            if not self.exact_var.get() and m == n:
+                resultado = matrices.cache_resultados.determinante(matrix_name, A)
+            if resultado is None:
+                resultado = matrices.determinante_por_gauss_con_pasos(A, mostrar_pasos=True, exacto=self.exact_var.get())
 
             det = resultado.get("determinante", 0.0)
-            det_fmt = f"{int(round(det))}" if abs(det - round(det)) < 1e-10 else f"{det:.4f}"
+            if isinstance(det, matrices.Fraction):
+                det_fmt = str(det)
+            else:
+                det_fmt = f"{int(round(det))}" if abs(det - round(det)) < 1e-10 else f"{det:.4f}"
 
             self.result_text.delete(1.0, tk.END)
             self.steps_text.delete(1.0, tk.END)
@@ -2577,6 +2687,8 @@ class MatrixCRUDApp:
             self.result_text.insert(tk.END, f"det(A) = {det_fmt}{note}\n")
             if "mensaje" in resultado:
                 self.result_text.insert(tk.END, resultado["mensaje"] + "\n")
+            if resultado.get("salud"):
+                self.result_text.insert(tk.END, self._format_salud(resultado["salud"]))
 
             # Mostrar A utilizada
             formatted_A = self._format_matrix_for_display(A)
@@ -2601,6 +2713,7 @@ class MatrixCRUDApp:
             matrix_name = self.matrix_listbox.get(selection[0])
             if messagebox.askyesno("Confirmar", f"¿Estás seguro de que quieres eliminar la matriz '{matrix_name}'?"):
                 if persistencia.eliminar_matriz(matrix_name):
+                    matrices.cache_resultados.invalidar(matrix_name)
                     messagebox.showinfo("Éxito", f"Matriz '{matrix_name}' eliminada exitosamente.")
                     self.update_matrix_list()
                 else:
@@ -2635,7 +2748,9 @@ class MatrixCRUDApp:
         if not metodo:
             messagebox.showwarning(
                 "Selección requerida",
-                "Selecciona un método: Gauss-Jordan, Gauss, Cramer, Transponer, Inversa, Determinante o Independencia.",
+                "Selecciona un método: Gauss-Jordan, Gauss, Cramer, Transponer, Inversa, Determinante, Independencia, "
+                "Mínimos cuadrados, Varios lados derechos o un método iterativo (Jacobi, Gauss-Seidel, SOR, "
+                "Gradiente conjugado).",
             )
             return
 
@@ -2665,6 +2780,9 @@ class MatrixCRUDApp:
             if metodo == "Independencia":
                 self.check_independence()
                 return
+            if metodo == "Varios lados derechos":
+                self.solve_multiple_rhs(datos)
+                return
 
             if metodo == "Cramer":
                 # Requiere matriz aumentada n×(n+1)
@@ -2672,8 +2790,8 @@ class MatrixCRUDApp:
                     messagebox.showerror("Dimensiones inválidas", "Para Cramer se requiere una matriz aumentada n×(n+1).")
                     return
 
-                A = [fila[:-1] for fila in datos]
-                b = [fila[-1] for fila in datos]
+                A = matrices.bloque_coeficientes(datos)
+                b = matrices.columna(datos, -1)
 
                 try:
                     resultado = matrices.cramer_con_pasos(A, b, mostrar_pasos=True)
@@ -2701,12 +2819,35 @@ class MatrixCRUDApp:
                         self.steps_text.insert(tk.END, formatted + "\n")
                 return
 
-            # Gauss / Gauss-Jordan
+            # Métodos iterativos (Jacobi, Gauss-Seidel, SOR, Gradiente conjugado)
+            iterativos = {"Jacobi": "jacobi", "Gauss-Seidel": "gauss-seidel", "SOR": "sor", "Gradiente conjugado": "cg"}
+            if metodo in iterativos:
+                if m != n + 1:
+                    messagebox.showerror("Dimensiones inválidas", f"Para {metodo} se requiere una matriz aumentada n×(n+1).")
+                    return
+                resultado = matrices.Matriz(datos).iterativo(iterativos[metodo])
+
+                self.result_text.delete(1.0, tk.END)
+                self.steps_text.delete(1.0, tk.END)
+                self.result_text.insert(tk.END, resultado["mensaje"] + "\n\n")
+                for variable, valor in resultado["solucion"].items():
+                    self.result_text.insert(tk.END, f"{variable} = {valor}\n")
+                # Historial de residuos por iteración
+                for paso in resultado.get("pasos", []):
+                    self.steps_text.insert(tk.END, f"{paso['descripcion']}\n")
+                return
+
+            # Gauss / Gauss-Jordan / Mínimos cuadrados
             matriz_obj = matrices.Matriz(datos)
-            if metodo == "Gauss":
-                resultado = matriz_obj.gauss()
+            if metodo == "Mínimos cuadrados":
+                if m < 2:
+                    messagebox.showerror("Dimensiones inválidas", "Para mínimos cuadrados se requiere una matriz aumentada [A | b].")
+                    return
+                resultado = matriz_obj.minimos_cuadrados()
+            elif metodo == "Gauss":
+                resultado = matriz_obj.gauss(exacto=self.exact_var.get(), precision="auto")
             elif metodo == "Gauss-Jordan":
-                resultado = matriz_obj.gauss_jordan()
+                resultado = matriz_obj.gauss_jordan(exacto=self.exact_var.get(), hilos=os.cpu_count())
             else:
                 messagebox.showerror("Error", f"Método de resolución desconocido: {metodo}")
                 return
@@ -2715,6 +2856,19 @@ class MatrixCRUDApp:
             # Mostrar el mensaje principal del resultado
             if "mensaje" in resultado:
                 self.result_text.insert(tk.END, resultado["mensaje"] + "\n\n")
+            # Ruta de resolución elegida según la estructura de la matriz
+            if "metodo" in resultado:
+                self.result_text.insert(tk.END, f"Método: {resultado['metodo']}\n\n")
+            # Condicionamiento y estabilidad de la eliminación
+            if resultado.get("salud"):
+                self.result_text.insert(tk.END, self._format_salud(resultado["salud"]) + "\n")
+            # Mínimos cuadrados: solución y reporte del residuo
+            if "norma_residuo" in resultado:
+                for variable, valor in resultado["solucion"].items():
+                    self.result_text.insert(tk.END, f"{variable} = {valor}\n")
+                self.result_text.insert(tk.END, f"Rango: {resultado['rango']}\n")
+                residuo = ", ".join(matriz_obj._format_number(r) for r in resultado["residuo"])
+                self.result_text.insert(tk.END, f"Residuo b - A·x: [{residuo}]\n\n")
             # Mostrar los pasos si existen
             if "pasos" in resultado and resultado["pasos"]:
                 for idx, paso in enumerate(resultado["pasos"]):
@@ -2725,6 +2879,31 @@ class MatrixCRUDApp:
         except Exception as e:
             messagebox.showerror("Error", f"Error durante la resolución de la matriz: {e}")
     
+    def solve_multiple_rhs(self, datos):
+        """Resuelve A X = B para una matriz guardada como [A | B] de n×(n+k), eliminando una sola vez."""
+        n, m = len(datos), len(datos[0])
+        if m <= n:
+            messagebox.showerror("Dimensiones inválidas", "Se requiere una matriz [A | B] de n×(n+k) con k ≥ 1.")
+            return
+        resultado = matrices.Matriz(datos).resolver_multiple(mostrar_pasos=True, hilos=os.cpu_count())
+
+        self.result_text.delete(1.0, tk.END)
+        self.steps_text.delete(1.0, tk.END)
+        self.result_text.insert(tk.END, resultado["mensaje"] + "\n")
+        self.result_text.insert(tk.END, f"Método: {resultado['metodo']}\n\n")
+        if resultado.get("salud"):
+            self.result_text.insert(tk.END, self._format_salud(resultado["salud"]) + "\n")
+        for j, (solucion, mensaje) in enumerate(zip(resultado["soluciones"], resultado["mensajes"]), start=1):
+            self.result_text.insert(tk.END, f"Columna b{j}: {mensaje}\n")
+            if isinstance(solucion, dict):
+                for variable, valor in solucion.items():
+                    self.result_text.insert(tk.END, f"  {variable} = {valor}\n")
+            self.result_text.insert(tk.END, "\n")
+        for idx, paso in enumerate(resultado["pasos"]):
+            self.steps_text.insert(tk.END, f"Paso {idx+1}: {paso['descripcion']}\n")
+            if 'matriz' in paso:
+                self.steps_text.insert(tk.END, self._format_matrix_for_display(paso['matriz']) + "\n")
+
     def check_independence(self):
         matrix_name = getattr(self, 'selected_matrix', None)
 
@@ -2755,7 +2934,7 @@ class MatrixCRUDApp:
             vectores_columna = [[datos[i][j] for i in range(num_filas)] for j in range(num_columnas)]
 
             # Llamar a la función independencia_vectores con los vectores columna
-            resultado = matriz_obj.independencia_vectores(vectores_columna)
+            resultado = matriz_obj.independencia_vectores(vectores_columna, exacto=self.exact_var.get())
 
             self.result_text.delete(1.0, tk.END)
             self.steps_text.delete(1.0, tk.END)
@@ -2998,7 +3177,16 @@ class MatrixCRUDApp:
                 return
 
             if actualizar_conjunto_vectores(name, datos, num_vectores, dimension):
-                messagebox.showinfo("Éxito", f"Conjunto '{name}' actualizado.")
+                mensaje = f"Conjunto '{name}' actualizado."
+                conjunto = persistencia.cargar_conjunto_vectores(name) or {}
+                if conjunto.get("rastreador"):
+                    rastreador = matrices.RastreadorIndependencia.desde_dict(conjunto["rastreador"])
+                    mensaje += f"\nRango actual: {rastreador.rango}"
+                    for i in sorted(rastreador.dependencias):
+                        if i >= len(original['datos']):
+                            terminos = " + ".join(f"({c:.6g})·v{s+1}" for s, c in sorted(rastreador.dependencias[i].items())) or "0"
+                            mensaje += f"\nv{i+1} es dependiente: v{i+1} = {terminos}"
+                messagebox.showinfo("Éxito", mensaje)
                 self.update_vector_set_list()
                 self.clear_vector_entries_frame()
             else:
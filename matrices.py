@@ -1,513 +1,4163 @@
 # matrices.py
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from fractions import Fraction
+import heapq
+from itertools import chain
+from math import isfinite, isqrt, lcm, log10
+from operator import add, mul, sub
+import os
+import random
+import time
 
-# Clase de matriz para algebra lineal
-class Matriz:
-    def __init__(self, datos):
-        # Validaciones básicas
-        # - Datos no vacíos
-        #
-        if not datos or not all(datos):
-            raise ValueError("La matriz no puede estar vacía.")
-        cols = len(datos[0])
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él se usan los kernels en Python puro
+    np = None
 
-        # - Todas las filas, igual cantidad de columnas
-        for fila in datos:
-            if len(fila) != cols:
-                raise ValueError("Todas las filas deben tener la misma cantidad de columnas")
-        
-        # Guardo mi matriz(A), numero de filas y columnas tambn
-        
-        self.A = [row[:] for row in datos]
-        self.n = len(datos)
-        self.m = cols
-        
-        # Me crea el nombre de las variables x1, x2, ..., x(m-1)
-        self.variables = [f"x{i+1}" for i in range(self.m-1)]
 
-    """ Si es un numero entero, asi se muestra. Si tiene decimales, se muestra con 4 decimales"""
-    def _format_number(self, x):
-        if abs(x - int(x)) < 1e-10:
-            return str(int(x))
-        else:
-            return f"{x:.4f}"
-    # utiliza la funcion de arriba, pero la aplica a toda la matriz
-    def _mat_str(self, mat):
-        return [[self._format_number(x) for x in row] for row in mat]
-    
-    
+# -------------------- UTILIDADES MODO EXACTO (BAREISS) --------------------
+def _a_fraccion(x):
+    """Convierte un valor a Fraction. Los float se leen por su representación decimal
+    (0.1 -> 1/10) y no por su valor binario, que es lo que el usuario escribió."""
+    if isinstance(x, Fraction):
+        return x
+    if isinstance(x, float):
+        return Fraction(repr(x))
+    return Fraction(x)
 
-    """ -------------------- MÉTODO GAUSS-JORDAN -------------------- """
-    def gauss_jordan(self):
-        A = [row[:] for row in self.A]  # trabajar sobre copia (para hacer distintas operaciones)
-        n, m = self.n, self.m
-        pasos = []
-        pivotes = {}
-        libres = set()
-        fila = 0
 
-        pasos.append({"descripcion": "Matriz inicial", "matriz": self._mat_str(A)})
+def _filas_a_enteros(M):
+    """Escala cada fila por el mcm de sus denominadores para obtener una matriz entera.
+    Retorna (matriz_entera, escalas) con escalas[i] = factor aplicado a la fila i.
+    """
+    enteras = []
+    escalas = []
+    for fila in M:
+        fr = [_a_fraccion(x) for x in fila]
+        d = lcm(*(f.denominator for f in fr)) if fr else 1
+        enteras.append([int(f * d) for f in fr])
+        escalas.append(d)
+    return enteras, escalas
 
-        for col in range(m-1):
-            pivot_row = None
-            for r in range(fila, n):
-                if abs(A[r][col]) > 1e-10:
-                    pivot_row = r
-                    break
-            if pivot_row is None:
-                libres.add(col)
-                pasos.append({"descripcion": f"{self.variables[col]}: variable libre (columna {col+1})", "matriz": self._mat_str(A)})
+
+def _bareiss(M, num_cols, reducida=False, pasos=None, mat_str=None):
+    """Eliminación de Bareiss libre de fracciones sobre una matriz entera M (in-place).
+
+    - num_cols: número de columnas en las que se buscan pivotes (las restantes sólo se transforman).
+    - reducida: si True también se eliminan las entradas por encima del pivote (variante Gauss-Jordan).
+    - pasos / mat_str: si se pasa una lista, se registran los pasos en el formato habitual.
+
+    Cada actualización es F_r → (p·F_r - a·F_f) / p_anterior, con división exacta, de modo que
+    todas las entradas son menores de la matriz original (acotadas por Hadamard).
+    Retorna (pivotes {col: fila}, signo de los intercambios, último pivote).
+    """
+    n = len(M)
+    m = len(M[0]) if n else 0
+    pivotes = {}
+    signo = 1
+    prev = 1
+    fila = 0
+    for col in range(num_cols):
+        if fila >= n:
+            break
+        pivot_row = None
+        for r in range(fila, n):
+            if M[r][col] != 0:
+                pivot_row = r
+                break
+        if pivot_row is None:
+            continue
+        if pivot_row != fila:
+            M[fila], M[pivot_row] = M[pivot_row], M[fila]
+            signo = -signo
+            if pasos is not None:
+                pasos.append({"descripcion": f"F{fila+1} ↔ F{pivot_row+1}", "matriz": mat_str(M)})
+        p = M[fila][col]
+        pf = M[fila]
+        for r in (range(n) if reducida else range(fila + 1, n)):
+            if r == fila:
                 continue
+            a = M[r][col]
+            fr = M[r]
+            M[r] = [(p * fr[k] - a * pf[k]) // prev for k in range(m)]
+        if pasos is not None:
+            filas_txt = f"r ≠ {fila+1}" if reducida else f"r > {fila+1}"
+            pasos.append({"descripcion": f"(*Pivote*, Fila: {fila+1}; Columna: {col+1}; Valor: {p})\n"
+                                         f"F_r → ({p}·F_r - a_r·F{fila+1}) / {prev}  ({filas_txt})",
+                          "matriz": mat_str(M)})
+        pivotes[col] = fila
+        prev = p
+        fila += 1
+    return pivotes, signo, prev
 
-            if pivot_row != fila:
-                A[fila], A[pivot_row] = A[pivot_row], A[fila]
-                valor_pivote = self._format_number(A[fila][col])
-                pasos.append({"descripcion": f"(*Pivote*, Fila: {fila+1}; Columna: {col+1}; Valor: {valor_pivote})\nF{fila+1} ↔ F{pivot_row+1}", "matriz": self._mat_str(A)})
 
-            pivot = A[fila][col]
-            # Solo agrego pivote en los pasos que ya existen
-            if abs(pivot - 1) > 1e-10:
-                A[fila] = [x/pivot for x in A[fila]]
-                valor_pivote = self._format_number(pivot)
-                pasos.append({"descripcion": f"(*Pivote*, Fila: {fila+1}; Columna: {col+1}; Valor: {valor_pivote})\nF{fila+1} → F{fila+1} / {valor_pivote}", "matriz": self._mat_str(A)})
+# -------------------- ARITMÉTICA MULTIMODULAR (RANGO Y DETERMINANTE EXACTOS) --------------------
+PRIMOS_RANGO = 3  # primos independientes que deben concordar para fijar el rango
+UMBRAL_MODULAR = 48  # desde este n el determinante exacto usa primos en lugar de Bareiss
+_PRIMOS = []
 
-            for r in range(n):
-                if r != fila and abs(A[r][col]) > 1e-10:
-                    factor = A[r][col]
-                    A[r] = [A[r][k] - factor*A[fila][k] for k in range(m)]
-                    valor_pivote = self._format_number(A[fila][col])
-                    pasos.append({"descripcion": f"(*Pivote*, Fila: {fila+1}; Columna: {col+1}; Valor: {valor_pivote})\nF{r+1} → F{r+1} - ({self._format_number(factor)})*F{fila+1}", "matriz": self._mat_str(A)})
 
-            pivotes[col] = fila
-            fila += 1
+def _es_primo(p):
+    """Miller-Rabin determinista para p < 3.4e14 (bases 2..17)."""
+    if p < 2:
+        return False
+    for b in (2, 3, 5, 7, 11, 13, 17):
+        if p % b == 0:
+            return p == b
+    d, s = p - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for b in (2, 3, 5, 7, 11, 13, 17):
+        x = pow(b, d, p)
+        if x in (1, p - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % p
+            if x == p - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _primos_modulares(cantidad):
+    """Primos de palabra (< 2^31, para que los productos quepan en int64) en orden descendente."""
+    p = _PRIMOS[-1] - 2 if _PRIMOS else 2**31 - 1
+    while len(_PRIMOS) < cantidad:
+        if _es_primo(p):
+            _PRIMOS.append(p)
+        p -= 2
+    return _PRIMOS[:cantidad]
+
+
+def _rref_modular(M, q, reducida=True):
+    """RREF de la matriz entera M sobre el cuerpo F_q (sólo escalonada si reducida=False).
+
+    Retorna (pivotes {col: fila}, R reducida mod q, det mod q de las primeras filas/columnas
+    pivote). Con NumPy cada eliminación es una actualización vectorizada de rango 1.
+    """
+    n, m = len(M), len(M[0]) if M else 0
+    pivotes = {}
+    det = 1
+    fila = 0
+    if np is not None:
+        R = np.array([[x % q for x in f] for f in M], dtype=np.int64)
+        for col in range(m):
             if fila >= n:
                 break
+            nz = np.nonzero(R[fila:, col])[0]
+            if nz.size == 0:
+                continue
+            r = fila + int(nz[0])
+            if r != fila:
+                R[[fila, r]] = R[[r, fila]]
+                det = -det
+            p = int(R[fila, col])
+            det = det * p % q
+            R[fila] = R[fila] * pow(p, -1, q) % q
+            inicio = 0 if reducida else fila + 1
+            factores = R[inicio:, col].copy()
+            if reducida:
+                factores[fila] = 0
+            R[inicio:] = (R[inicio:] - np.outer(factores, R[fila])) % q
+            pivotes[col] = fila
+            fila += 1
+        return pivotes, R.tolist(), det % q
+    R = [[x % q for x in f] for f in M]
+    for col in range(m):
+        if fila >= n:
+            break
+        r = next((i for i in range(fila, n) if R[i][col]), None)
+        if r is None:
+            continue
+        if r != fila:
+            R[fila], R[r] = R[r], R[fila]
+            det = -det
+        p = R[fila][col]
+        det = det * p % q
+        inv = pow(p, -1, q)
+        R[fila] = [x * inv % q for x in R[fila]]
+        piv = R[fila]
+        for i in range(0 if reducida else fila + 1, n):
+            f = R[i][col]
+            if i != fila and f:
+                R[i] = [(x - f * y) % q for x, y in zip(R[i], piv)]
+        pivotes[col] = fila
+        fila += 1
+    return pivotes, R, det % q
 
-        # Detectar inconsistencia
-        for r in range(n):
-            if all(abs(A[r][c]) < 1e-10 for c in range(m-1)) and abs(A[r][-1]) > 1e-10:
-                return {"pasos": pasos, "solucion": "Sin solución"}
 
-        # Variables libres
-        for col in range(m-1):
-            if col not in pivotes:
-                libres.add(col)
+def _crt(residuos, primos):
+    """Reconstrucción china: entero x con |x| < Π primos / 2 y x ≡ residuos (mod primos)."""
+    x, mod = 0, 1
+    for a, q in zip(residuos, primos):
+        t = (a - x) * pow(mod, -1, q) % q
+        x += mod * t
+        mod *= q
+    return x - mod if x > mod // 2 else x
 
-        # Construir solución
-        solucion = {}
-        if libres:
-            for i in range(m-1):
-                if i in libres:
-                    solucion[self.variables[i]] = "libre"
-                else:
-                    fila = pivotes[i]
-                    expr = self._format_number(A[fila][-1])
-                    for j in sorted(libres):
-                        coef = -A[fila][j]
-                        if abs(coef) > 1e-10:
-                            expr += f" + ({self._format_number(coef)})*{self.variables[j]}"
-                    solucion[self.variables[i]] = expr
-        else:
-            for i in range(m-1):
-                val = A[pivotes[i]][-1]
-                solucion[self.variables[i]] = self._format_number(val)
 
-        # Mensaje sobre el tipo de solución
-        if libres:
-            tipo_sol = "El sistema tiene infinitas soluciones (variables libres presentes)."
-        else:
-            tipo_sol = "El sistema tiene solución única."
-        return {"pasos": pasos, "solucion": solucion, "mensaje": tipo_sol}
+def _reconstruccion_racional(a, mod):
+    """Fracción n/d con |n|, d <= sqrt(mod/2) y n ≡ a·d (mod mod), por Euclides extendido."""
+    limite = isqrt(mod // 2)
+    r0, r1, s0, s1 = mod, a % mod, 0, 1
+    while r1 > limite:
+        c = r0 // r1
+        r0, r1 = r1, r0 - c * r1
+        s0, s1 = s1, s0 - c * s1
+    if s1 == 0 or abs(s1) > limite:
+        return None
+    return Fraction(r1, s1)
 
-    # -------------------- MÉTODO GAUSS --------------------
-    def gauss(self):
-        A = [row[:] for row in self.A]  # trabajar sobre copia
-        pasos = []
-        # (Evitar duplicar "Matriz inicial": lo agrega _forward_elimination)
-        # Reutilizar el forward elimination privado
-        A, pivotes, pasos_elim = self._forward_elimination(A)
-        pasos.extend(pasos_elim)
 
-        sol = self._resolver_sustitucion(A)
-        # Mensaje coherente con Gauss-Jordan
-        if isinstance(sol, str):
-            mensaje = "El sistema es inconsistente (no tiene solución)."
-        else:
-            if any(v == "libre" for v in sol.values()):
-                mensaje = "El sistema tiene infinitas soluciones (variables libres presentes)."
-            else:
-                mensaje = "El sistema tiene solución única."
-        return {"pasos": pasos, "solucion": sol, "mensaje": mensaje}
+def _cota_hadamard(M):
+    """Cota de cualquier menor de la matriz entera M: Π max(1, ||fila||).
 
-    def _forward_elimination(self, A):
-        """Realiza eliminación hacia adelante (como en Gauss), retorna la matriz transformada,
-        el dict de pivotes (col -> fila) y la lista de pasos (mismo formato que gauss/gauss_jordan).
-        """
-        n, m = self.n, self.m
-        pasos = []
-        pivotes = {}
-        fila = 0
+    La raíz es entera (isqrt): con entradas grandes la suma de cuadrados no cabe en un float."""
+    cota = 1
+    for f in M:
+        cota *= max(1, isqrt(sum(x * x for x in f)) + 1)
+    return cota
 
-        pasos.append({"descripcion": "Matriz inicial", "matriz": self._mat_str(A)})
 
-        for col in range(min(n, m-1)):
-            pivot_row = None
-            for r in range(fila, n):
-                if abs(A[r][col]) > 1e-10:
-                    pivot_row = r
-                    break
-            if pivot_row is None:
-                pasos.append({"descripcion": f"{self.variables[col]}: columna sin pivote (variable libre)", "matriz": self._mat_str(A)})
+def _primos_para(cota):
+    """Primos necesarios para que su producto supere 'cota'."""
+    k, prod = 0, 1
+    while prod <= cota:
+        k += 1
+        prod *= _primos_modulares(k)[-1]
+    return _primos_modulares(k)
+
+
+def _eliminacion_multimodular(M, primos):
+    """Elimina M sobre cada primo y conserva los que concuerdan con el rango verdadero.
+
+    Sobre F_q el rango nunca supera al racional y un primo "desafortunado" da menos rango o
+    pivotes más tardíos; por eso se elige el mayor rango con el conjunto de pivotes más temprano.
+    Retorna (pivotes, [(q, R, det mod q) de los primos concordantes]).
+    """
+    resultados = [(q,) + _rref_modular(M, q) for q in primos]
+    clave = lambda res: (len(res[1]), [-c for c in sorted(res[1])])
+    mejor = max(resultados, key=clave)[1]
+    concordantes = [(q, R, d) for q, piv, R, d in resultados if piv == mejor]
+    return mejor, concordantes
+
+
+def rango_modular(A, primos=PRIMOS_RANGO):
+    """Rango exacto de A (entera o racional) por eliminación sobre varios primos de palabra.
+
+    Retorna {"rango", "pivotes" (columnas, 1-based), "primos", "concordantes"}.
+    """
+    M, _ = _filas_a_enteros(A)
+    pivotes, concordantes = _eliminacion_multimodular(M, _primos_modulares(primos))
+    return {"rango": len(pivotes), "pivotes": [c + 1 for c in sorted(pivotes)],
+            "primos": primos, "concordantes": len(concordantes)}
+
+
+def determinante_modular(A):
+    """Determinante exacto de A (entera o racional, cuadrada) por CRT sobre primos de palabra.
+
+    Se usan tantos primos como exige la cota de Hadamard (|det| < Π ||fila||), así el resultado
+    no depende de ninguna tolerancia. Retorna {"determinante": Fraction, "primos": k}.
+    """
+    M, escalas = _filas_a_enteros(A)
+    primos = _primos_para(2 * _cota_hadamard(M))
+    residuos = []
+    for q in primos:
+        pivotes, _, d = _rref_modular(M, q, reducida=False)
+        residuos.append(d if len(pivotes) == len(M) else 0)
+    escala_total = 1
+    for e in escalas:
+        escala_total *= e
+    return {"determinante": Fraction(_crt(residuos, primos), escala_total), "primos": len(primos)}
+
+
+def independencia_modular(vectores):
+    """Independencia exacta de 'vectores' por aritmética multimodular.
+
+    Rango y pivotes salen de la concordancia de los primos; los coeficientes de dependencia
+    (entradas de la RREF, cocientes de menores) se recuperan por CRT y reconstrucción racional.
+    Retorna el mismo dict que la clave "solucion" de Matriz.independencia_vectores.
+    """
+    k = len(vectores)
+    n = len(vectores[0])
+    M, _ = _filas_a_enteros([[vectores[c][r] for c in range(k)] for r in range(n)])
+    cota = _cota_hadamard(M)
+    pivotes, concordantes = _eliminacion_multimodular(M, _primos_modulares(PRIMOS_RANGO))
+    libres = [c for c in range(k) if c not in pivotes]
+    R = [[0] * k for _ in range(n)]
+    if libres and pivotes:
+        # La reconstrucción racional requiere Π primos > 2·N·D, con N, D <= cota; los primos
+        # desafortunados (otros pivotes) se descartan y se reemplazan por el siguiente primo
+        primos = [q for q, _, _ in concordantes]
+        tablas = [R_q for _, R_q, _ in concordantes]
+        mod = 1
+        for q in primos:
+            mod *= q
+        cantidad = 0
+        while mod <= 2 * cota * cota:
+            cantidad += 1
+            q = _primos_modulares(cantidad)[-1]
+            if q in primos:
                 continue
+            piv_q, R_q, _ = _rref_modular(M, q)
+            if piv_q == pivotes:
+                primos.append(q)
+                tablas.append(R_q)
+                mod *= q
+        for c, fila in pivotes.items():
+            for f in libres:
+                x = _crt([T[fila][f] for T in tablas], primos) % mod
+                R[fila][f] = _reconstruccion_racional(x, mod)
+        if any(R[fila][f] is None for fila in pivotes.values() for f in libres):
+            # Respaldo exacto: RREF de Bareiss, cada fila pivote dividida por su pivote
+            B = [fila[:] for fila in M]
+            pivotes, _, _ = _bareiss(B, k, reducida=True)
+            for c, fila in pivotes.items():
+                for f in libres:
+                    R[fila][f] = Fraction(B[fila][f], B[fila][c])
+    return _solucion_independencia(R, pivotes, libres, k, tol=0)
+
+
+# -------------------- PRODUCTO POR BLOQUES --------------------
+# Tamaño de bloque por defecto (entradas por lado) y filas mínimas para repartir entre procesos
+TAM_BLOQUE = 64
+UMBRAL_PARALELO = 128
+
+
+def _multiplicar_bloques(A, Bt, tam_bloque=TAM_BLOQUE):
+    """Producto C = A · B por bloques, recibiendo B ya traspuesta (Bt, fila-mayor).
+
+    Recorre bloques de filas de A, de filas de Bt (columnas de B) y del índice interno k;
+    cada producto parcial es un sum(map(mul, ...)) sobre dos filas contiguas.
+    """
+    n = len(A)
+    p = len(Bt)
+    kdim = len(A[0]) if n else 0
+    C = [[0.0] * p for _ in range(n)]
+    for k0 in range(0, kdim, tam_bloque):
+        k1 = min(k0 + tam_bloque, kdim)
+        # Trozos de la franja k0:k1 (se cortan una vez por bloque k)
+        if k0 == 0 and k1 == kdim:
+            A_k, Bt_k = A, Bt
+        else:
+            A_k = [fila[k0:k1] for fila in A]
+            Bt_k = [fila[k0:k1] for fila in Bt]
+        for i0 in range(0, n, tam_bloque):
+            i1 = min(i0 + tam_bloque, n)
+            for j0 in range(0, p, tam_bloque):
+                j1 = min(j0 + tam_bloque, p)
+                bloque_bt = Bt_k[j0:j1]
+                for i in range(i0, i1):
+                    a = A_k[i]
+                    Ci = C[i]
+                    for j, b in enumerate(bloque_bt, start=j0):
+                        Ci[j] += sum(map(mul, a, b))
+    return C
+
+
+# Estado por proceso del pool: B traspuesta se envía una sola vez en el initializer
+_BT_PROCESO = None
+_TAM_BLOQUE_PROCESO = TAM_BLOQUE
+
+
+def _iniciar_proceso(Bt, tam_bloque):
+    global _BT_PROCESO, _TAM_BLOQUE_PROCESO
+    _BT_PROCESO = Bt
+    _TAM_BLOQUE_PROCESO = tam_bloque
+
+
+def _multiplicar_filas_proceso(filas_A):
+    return _multiplicar_bloques(filas_A, _BT_PROCESO, _TAM_BLOQUE_PROCESO)
+
+
+def multiplicar_bloques(A, B, tam_bloque=TAM_BLOQUE, procesos=None):
+    """
+    Producto A · B (listas de listas) con el kernel por bloques.
+    - B se traspone una vez a fila-mayor.
+    - procesos: si es > 1 y A tiene al menos UMBRAL_PARALELO filas, las filas de A se reparten
+      por bloques entre un pool de procesos (None o 1 = secuencial).
+    """
+    Bt = [list(col) for col in zip(*B)]
+    n = len(A)
+    if not procesos or procesos <= 1 or n < UMBRAL_PARALELO:
+        return _multiplicar_bloques(A, Bt, tam_bloque)
+    procesos = min(procesos, os.cpu_count() or 1)
+    paso = max(tam_bloque, -(-n // procesos))
+    trozos = [A[i:i + paso] for i in range(0, n, paso)]
+    with ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_proceso, initargs=(Bt, tam_bloque)) as pool:
+        partes = pool.map(_multiplicar_filas_proceso, trozos)
+        return [fila for parte in partes for fila in parte]
+
+
+# -------------------- PRODUCTO DE STRASSEN-WINOGRAD --------------------
+# Tamaño a partir del cual __matmul__ usa Strassen (ajustable con calibrar_strassen)
+UMBRAL_STRASSEN = 256
+# Por debajo de este tamaño la recursión cae al kernel por bloques
+CORTE_STRASSEN = 64
+
+
+def _sumar_listas(X, Y):
+    return [[a + b for a, b in zip(fx, fy)] for fx, fy in zip(X, Y)]
+
+
+def _restar_listas(X, Y):
+    return [[a - b for a, b in zip(fx, fy)] for fx, fy in zip(X, Y)]
+
+
+def _strassen(A, B, corte):
+    n = len(A)
+    if n <= corte:
+        return _multiplicar_bloques(A, [list(col) for col in zip(*B)])
+    if n % 2:
+        # Tamaño impar: completar con una fila y columna de ceros y recortar al final
+        A = [fila + [0.0] for fila in A] + [[0.0] * (n + 1)]
+        B = [fila + [0.0] for fila in B] + [[0.0] * (n + 1)]
+        C = _strassen(A, B, corte)
+        return [fila[:n] for fila in C[:n]]
+    h = n // 2
+    A11 = [fila[:h] for fila in A[:h]]
+    A12 = [fila[h:] for fila in A[:h]]
+    A21 = [fila[:h] for fila in A[h:]]
+    A22 = [fila[h:] for fila in A[h:]]
+    B11 = [fila[:h] for fila in B[:h]]
+    B12 = [fila[h:] for fila in B[:h]]
+    B21 = [fila[:h] for fila in B[h:]]
+    B22 = [fila[h:] for fila in B[h:]]
+
+    # Variante de Winograd: 7 productos y 15 sumas/restas
+    S1 = _sumar_listas(A21, A22)
+    S2 = _restar_listas(S1, A11)
+    S3 = _restar_listas(A11, A21)
+    S4 = _restar_listas(A12, S2)
+    T1 = _restar_listas(B12, B11)
+    T2 = _restar_listas(B22, T1)
+    T3 = _restar_listas(B22, B12)
+    T4 = _restar_listas(T2, B21)
+
+    M1 = _strassen(A11, B11, corte)
+    M2 = _strassen(A12, B21, corte)
+    M3 = _strassen(S4, B22, corte)
+    M4 = _strassen(A22, T4, corte)
+    M5 = _strassen(S1, T1, corte)
+    M6 = _strassen(S2, T2, corte)
+    M7 = _strassen(S3, T3, corte)
+
+    U2 = _sumar_listas(M1, M6)
+    U3 = _sumar_listas(U2, M7)
+    U4 = _sumar_listas(U2, M5)
+    C11 = _sumar_listas(M1, M2)
+    C12 = _sumar_listas(U4, M3)
+    C21 = _restar_listas(U3, M4)
+    C22 = _sumar_listas(U3, M5)
+    return [f1 + f2 for f1, f2 in zip(C11, C12)] + [f1 + f2 for f1, f2 in zip(C21, C22)]
+
+
+def multiplicar_strassen(A, B, corte=None):
+    """
+    Producto de matrices cuadradas n x n (listas de listas) con Strassen-Winograd recursivo.
+    - corte: tamaño por debajo del cual se usa el kernel por bloques (por defecto CORTE_STRASSEN).
+    """
+    n = len(A)
+    if any(len(fila) != n for fila in A) or len(B) != n or any(len(fila) != n for fila in B):
+        raise ValueError("Strassen requiere dos matrices cuadradas del mismo tamaño.")
+    return _strassen([[float(x) for x in fila] for fila in A], B, corte or CORTE_STRASSEN)
+
+
+def calibrar_strassen(tamanos=(64, 128, 192, 256, 384, 512), corte=None, aplicar=True):
+    """
+    Mide el kernel por bloques frente a Strassen en tamaños crecientes y toma como umbral el
+    primero en que Strassen resulta claramente más rápido. Con aplicar=True actualiza UMBRAL_STRASSEN.
+
+    Retorna {"umbral": int | None, "mediciones": [{"n", "bloques", "strassen"}, ...]}.
+    """
+    global UMBRAL_STRASSEN
+
+    rnd = random.Random(0)
+    mediciones = []
+    umbral = None
+    for n in tamanos:
+        A = [[rnd.uniform(-1, 1) for _ in range(n)] for _ in range(n)]
+        B = [[rnd.uniform(-1, 1) for _ in range(n)] for _ in range(n)]
+        t_bloques = t_strassen = float("inf")
+        # Mejor de dos mediciones; se exige un 5% de ventaja para no decidir por ruido
+        for _ in range(2):
+            t0 = time.perf_counter()
+            multiplicar_bloques(A, B)
+            t_bloques = min(t_bloques, time.perf_counter() - t0)
+            t0 = time.perf_counter()
+            multiplicar_strassen(A, B, corte)
+            t_strassen = min(t_strassen, time.perf_counter() - t0)
+        mediciones.append({"n": n, "bloques": t_bloques, "strassen": t_strassen})
+        if t_strassen < 0.95 * t_bloques:
+            umbral = n
+            break
+    if aplicar and umbral is not None:
+        UMBRAL_STRASSEN = umbral
+    return {"umbral": umbral, "mediciones": mediciones}
+
+
+# -------------------- ESTRUCTURA Y SOLVERS ESPECIALIZADOS --------------------
+TOL_ESTRUCTURA = 1e-12  # |a_ij| <= TOL_ESTRUCTURA·max|a_ij| ⇒ cero estructural (relativo, como TOL_PIVOTE_LU)
+UMBRAL_ESTRUCTURA = 64  # n desde el que los métodos con pasos usan el solver estructurado
+
+
+def _tol_estructura(A, tol_rel=TOL_ESTRUCTURA):
+    """Umbral absoluto de cero para la parte n x n de A: tol_rel veces su mayor entrada."""
+    return tol_rel * _max_abs(A, len(A))
+
+
+def analizar_estructura(A, tol_rel=TOL_ESTRUCTURA):
+    """
+    Clasifica una matriz cuadrada (lista de listas) en una sola pasada O(n²).
+
+    Sólo se leen las primeras n columnas, así que también acepta una aumentada n x (n+1).
+    Retorna {"tipo", "kl", "ku", "simetrica", "tol"}, donde kl/ku son los anchos de banda inferior y
+    superior y tipo es uno de: "diagonal", "triangular_superior", "triangular_inferior",
+    "tridiagonal", "banda", "simetrica" (candidata a Cholesky) o "densa". Con n <= 3 toda matriz
+    llena es tridiagonal, así que la banda sólo se reconoce desde n = 4. Una entrada cuenta como
+    cero si |a_ij| <= tol_rel·max|a_ij|, así que la clasificación no depende de la escala de A;
+    ese umbral absoluto se devuelve en "tol" para que los solvers lo reutilicen.
+    """
+    n = len(A)
+    tol = _tol_estructura(A, tol_rel)
+    kl = ku = 0
+    simetrica = True
+    for i in range(n):
+        fila = A[i]
+        for j in range(n):
+            x = fila[j]
+            if abs(x) > tol:
+                if i - j > kl:
+                    kl = i - j
+                elif j - i > ku:
+                    ku = j - i
+            if simetrica and j > i and abs(x - A[j][i]) > tol:
+                simetrica = False
+
+    if kl == 0 and ku == 0:
+        tipo = "diagonal"
+    elif kl == 0:
+        tipo = "triangular_superior"
+    elif ku == 0:
+        tipo = "triangular_inferior"
+    elif n > 3 and kl <= 1 and ku <= 1:
+        tipo = "tridiagonal"
+    elif n > 3 and kl + ku + 1 <= n // 2:
+        tipo = "banda"
+    elif simetrica and all(A[i][i] > tol for i in range(n)):
+        tipo = "simetrica"
+    else:
+        tipo = "densa"
+    return {"tipo": tipo, "kl": kl, "ku": ku, "simetrica": simetrica, "tol": tol}
+
+
+def _resolver_triangular(A, B, superior, tol=None):
+    """Sustitución hacia atrás (superior) o hacia adelante (inferior) para A X = B. O(n²·r).
+    tol es el umbral absoluto de pivote nulo (por omisión, _tol_estructura(A))."""
+    n = len(A)
+    if tol is None:
+        tol = _tol_estructura(A)
+    X = [None] * n
+    for i in (range(n - 1, -1, -1) if superior else range(n)):
+        piv = A[i][i]
+        if abs(piv) <= tol:
+            return None
+        acc = [float(v) for v in B[i]]
+        fila = A[i]
+        for j in (range(i + 1, n) if superior else range(i)):
+            a = fila[j]
+            if a:
+                acc = [u - a * x for u, x in zip(acc, X[j])]
+        X[i] = [u / piv for u in acc]
+    return X
+
+
+def _diagonalmente_dominante(A):
+    n = len(A)
+    return all(abs(A[i][i]) >= sum(abs(A[i][j]) for j in range(max(0, i - 1), min(n, i + 2)) if j != i)
+               for i in range(n))
+
+
+def _thomas(A, B, tol=None):
+    """Algoritmo de Thomas para sistemas tridiagonales A X = B. O(n·r)."""
+    n = len(A)
+    if tol is None:
+        tol = _tol_estructura(A)
+    cp = [0.0] * n
+    dp = [None] * n
+    beta = A[0][0]
+    if abs(beta) <= tol:
+        return None
+    cp[0] = A[0][1] / beta if n > 1 else 0.0
+    dp[0] = [v / beta for v in B[0]]
+    for i in range(1, n):
+        a = A[i][i-1]
+        beta = A[i][i] - a * cp[i-1]
+        if abs(beta) <= tol:
+            return None
+        cp[i] = A[i][i+1] / beta if i < n - 1 else 0.0
+        dp[i] = [(v - a * d) / beta for v, d in zip(B[i], dp[i-1])]
+    X = [None] * n
+    X[n-1] = dp[n-1]
+    for i in range(n - 2, -1, -1):
+        X[i] = [d - cp[i] * x for d, x in zip(dp[i], X[i+1])]
+    return X
+
+
+def _resolver_banda(A, B, kl, ku, tol=None):
+    """LU en banda con pivoteo parcial para A X = B: sólo se recorren kl filas bajo el pivote y
+    kl+ku columnas a su derecha (la banda superior crece con los intercambios). O(n·kl·(kl+ku)).
+    Retorna (X, det) o None si la matriz es singular.
+    """
+    n = len(A)
+    if tol is None:
+        tol = _tol_estructura(A)
+    M = [[float(x) for x in fila] for fila in A]
+    R = [[float(v) for v in fila] for fila in B]
+    signo = 1
+    for k in range(n):
+        ultima = min(n - 1, k + kl)
+        p = max(range(k, ultima + 1), key=lambda r: abs(M[r][k]))
+        if abs(M[p][k]) <= tol:
+            return None
+        if p != k:
+            M[k], M[p] = M[p], M[k]
+            R[k], R[p] = R[p], R[k]
+            signo = -signo
+        Mk = M[k]
+        piv = Mk[k]
+        cmax = min(n, k + kl + ku + 1)
+        for r in range(k + 1, ultima + 1):
+            Mr = M[r]
+            f = Mr[k] / piv
+            if f:
+                for c in range(k, cmax):
+                    Mr[c] -= f * Mk[c]
+                R[r] = [u - f * v for u, v in zip(R[r], R[k])]
+    X = [None] * n
+    det = signo
+    for i in range(n - 1, -1, -1):
+        acc = R[i]
+        fila = M[i]
+        for j in range(i + 1, min(n, i + kl + ku + 1)):
+            a = fila[j]
+            if a:
+                acc = [u - a * x for u, x in zip(acc, X[j])]
+        X[i] = [u / fila[i] for u in acc]
+        det *= fila[i]
+    return X, det
+
+
+def _cholesky(A, tol=None):
+    """Factorización A = L·Lᵀ. Devuelve L o None si A no es definida positiva."""
+    n = len(A)
+    if tol is None:
+        tol = _tol_estructura(A)
+    L = [[0.0] * n for _ in range(n)]
+    for j in range(n):
+        Lj = L[j]
+        d = A[j][j] - sum(x * x for x in Lj[:j])
+        if d <= tol:
+            return None
+        Lj[j] = d ** 0.5
+        for i in range(j + 1, n):
+            Li = L[i]
+            Li[j] = (A[i][j] - sum(map(mul, Li[:j], Lj[:j]))) / Lj[j]
+    return L
+
+
+def _resolver_cholesky(L, B):
+    Y = _resolver_triangular(L, B, superior=False)
+    Lt = [list(col) for col in zip(*L)]
+    return _resolver_triangular(Lt, Y, superior=True)
+
+
+def _resolver_estructurado(A, B, est):
+    """Resuelve A X = B con el algoritmo que corresponde a la estructura 'est'.
+    Retorna (X, metodo) o (None, None) si no hay ruta especializada o ésta no es aplicable
+    (pivote nulo, no definida positiva, ...), en cuyo caso se usa la eliminación densa.
+    """
+    tipo = est["tipo"]
+    tol = est["tol"]
+    if tipo == "diagonal":
+        if any(abs(A[i][i]) <= tol for i in range(len(A))):
+            return None, None
+        return [[v / A[i][i] for v in B[i]] for i in range(len(A))], "división por la diagonal (matriz diagonal)"
+    if tipo in ("triangular_superior", "triangular_inferior"):
+        superior = tipo == "triangular_superior"
+        X = _resolver_triangular(A, B, superior, tol)
+        metodo = "sustitución hacia atrás" if superior else "sustitución hacia adelante"
+        return (X, f"{metodo} (matriz triangular)") if X is not None else (None, None)
+    if tipo == "tridiagonal" and _diagonalmente_dominante(A):
+        X = _thomas(A, B, tol)
+        if X is not None:
+            return X, "algoritmo de Thomas (matriz tridiagonal)"
+    if tipo in ("tridiagonal", "banda"):
+        res = _resolver_banda(A, B, est["kl"], est["ku"], tol)
+        return (res[0], f"LU en banda (kl={est['kl']}, ku={est['ku']})") if res else (None, None)
+    if tipo == "simetrica":
+        L = _cholesky(A, tol)
+        if L is not None:
+            return _resolver_cholesky(L, B), "Cholesky (simétrica definida positiva)"
+    return None, None
+
+
+def _determinante_estructurado(A, est):
+    """Determinante según la estructura. Retorna (det, metodo) o None para usar la eliminación densa."""
+    n = len(A)
+    tipo = est["tipo"]
+    if tipo in ("diagonal", "triangular_superior", "triangular_inferior"):
+        det = 1.0
+        for i in range(n):
+            det *= A[i][i]
+        return det, "producto de la diagonal (matriz triangular)"
+    if tipo == "tridiagonal":
+        # Recurrencia de tres términos: f_i = a_ii·f_(i-1) - a_i,i-1·a_i-1,i·f_(i-2)
+        f_prev, f = 1.0, float(A[0][0])
+        for i in range(1, n):
+            f_prev, f = f, A[i][i] * f - A[i][i-1] * A[i-1][i] * f_prev
+        return f, "recurrencia de tres términos (matriz tridiagonal)"
+    if tipo == "banda":
+        res = _resolver_banda(A, [[] for _ in range(n)], est["kl"], est["ku"], est["tol"])
+        return (res[1] if res else 0.0), f"LU en banda (kl={est['kl']}, ku={est['ku']})"
+    if tipo == "simetrica":
+        L = _cholesky(A, est["tol"])
+        if L is not None:
+            det = 1.0
+            for i in range(n):
+                det *= L[i][i]
+            return det * det, "Cholesky (producto de la diagonal de L al cuadrado)"
+    return None
+
+
+# Clase de matriz para algebra lineal
+# -------------------- KERNELS PARA MATRICES PEQUEÑAS (n <= 4) --------------------
+N_PEQUENA = 4  # hasta este orden se usan las fórmulas cerradas desenrolladas
+
+
+def _det2(a):
+    return a[0][0] * a[1][1] - a[0][1] * a[1][0]
+
+
+def _det3(a):
+    # Regla de Sarrus
+    (a00, a01, a02), (a10, a11, a12), (a20, a21, a22) = a
+    return (a00 * a11 * a22 + a01 * a12 * a20 + a02 * a10 * a21
+            - a02 * a11 * a20 - a00 * a12 * a21 - a01 * a10 * a22)
+
+
+def _menores4(a):
+    """Menores 2x2 de las dos primeras filas (s) y de las dos últimas (c) de una 4x4."""
+    (a00, a01, a02, a03), (a10, a11, a12, a13), (a20, a21, a22, a23), (a30, a31, a32, a33) = a
+    s = (a00 * a11 - a10 * a01, a00 * a12 - a10 * a02, a00 * a13 - a10 * a03,
+         a01 * a12 - a11 * a02, a01 * a13 - a11 * a03, a02 * a13 - a12 * a03)
+    c = (a20 * a31 - a30 * a21, a20 * a32 - a30 * a22, a20 * a33 - a30 * a23,
+         a21 * a32 - a31 * a22, a21 * a33 - a31 * a23, a22 * a33 - a32 * a23)
+    return s, c
+
+
+def _det4(a):
+    # Laplace por bloques: cada menor 2x2 de arriba por su complementario de abajo
+    (s0, s1, s2, s3, s4, s5), (c0, c1, c2, c3, c4, c5) = _menores4(a)
+    return s0 * c5 - s1 * c4 + s2 * c3 + s3 * c2 - s4 * c1 + s5 * c0
+
+
+_DET_PEQUENOS = {1: lambda a: a[0][0], 2: _det2, 3: _det3, 4: _det4}
+
+
+def determinante_pequeno(A):
+    """Determinante por fórmula cerrada si A es n x n con n <= 4; None en otro caso.
+    Conserva el tipo de las entradas (Fraction de entrada -> Fraction exacto)."""
+    f = _DET_PEQUENOS.get(len(A))
+    return f(A) if f is not None else None
+
+
+def _adjunta3(a):
+    (a00, a01, a02), (a10, a11, a12), (a20, a21, a22) = a
+    return [[a11 * a22 - a12 * a21, a02 * a21 - a01 * a22, a01 * a12 - a02 * a11],
+            [a12 * a20 - a10 * a22, a00 * a22 - a02 * a20, a02 * a10 - a00 * a12],
+            [a10 * a21 - a11 * a20, a01 * a20 - a00 * a21, a00 * a11 - a01 * a10]]
+
+
+def _adjunta4(a):
+    (a00, a01, a02, a03), (a10, a11, a12, a13), (a20, a21, a22, a23), (a30, a31, a32, a33) = a
+    (s0, s1, s2, s3, s4, s5), (c0, c1, c2, c3, c4, c5) = _menores4(a)
+    return [[a11 * c5 - a12 * c4 + a13 * c3, -a01 * c5 + a02 * c4 - a03 * c3,
+             a31 * s5 - a32 * s4 + a33 * s3, -a21 * s5 + a22 * s4 - a23 * s3],
+            [-a10 * c5 + a12 * c2 - a13 * c1, a00 * c5 - a02 * c2 + a03 * c1,
+             -a30 * s5 + a32 * s2 - a33 * s1, a20 * s5 - a22 * s2 + a23 * s1],
+            [a10 * c4 - a11 * c2 + a13 * c0, -a00 * c4 + a01 * c2 - a03 * c0,
+             a30 * s4 - a31 * s2 + a33 * s0, -a20 * s4 + a21 * s2 - a23 * s0],
+            [-a10 * c3 + a11 * c1 - a12 * c0, a00 * c3 - a01 * c1 + a02 * c0,
+             -a30 * s3 + a31 * s1 - a32 * s0, a20 * s3 - a21 * s1 + a22 * s0]]
+
+
+def _adjunta(A):
+    """Matriz adjunta (traspuesta de cofactores) de A n x n con n <= 4."""
+    n = len(A)
+    if n == 1:
+        return [[1]]
+    if n == 2:
+        (a, b), (c, d) = A
+        return [[d, -b], [-c, a]]
+    return _adjunta3(A) if n == 3 else _adjunta4(A)
+
+
+def _det_despreciable(A, det, eps=1e-12):
+    """True si det(A) es cero: exactamente si es int/Fraction y, en coma flotante, si
+    |det| <= eps·Π ||fila_i||₂ (cota de Hadamard), así el criterio no depende de la escala de A."""
+    if isinstance(det, (int, Fraction)):
+        return det == 0
+    escala = 1.0
+    for fila in A:
+        escala *= _norma2(fila)
+    return abs(det) <= eps * escala
+
+
+def inversa_pequena(A, eps=1e-12):
+    """Inversa por adjunta, A^-1 = adj(A) / det(A), para n <= 4.
+    Retorna (inversa, det); inversa es None si A es singular (ver _det_despreciable)."""
+    det = determinante_pequeno(A)
+    if _det_despreciable(A, det, eps):
+        return None, det
+    inv_det = 1 / det
+    return [[c * inv_det for c in fila] for fila in _adjunta(A)], det
+
+
+def cramer_pequeno(A, b, eps=1e-12):
+    """Regla de Cramer directa para n <= 4: x_i = det(A_i) / det(A) sin copias por columna
+    ni búsquedas de pivote. Lanza ValueError si det(A) es cero, como cramer()."""
+    det = _DET_PEQUENOS[len(A)]
+    detA = det(A)
+    if _det_despreciable(A, detA, eps):
+        raise ValueError("Determinante de A es cero: no existe solución única (regla de Cramer no aplicable).")
+    return [det([f[:j] + [bi] + f[j + 1:] for f, bi in zip(A, b)]) / detA for j in range(len(A))]
+
+
+# -------------------- QR DE HOUSEHOLDER Y MÍNIMOS CUADRADOS --------------------
+TOL_RANGO_QR = 1e-10  # |R_kk| <= tol·|R_00| marca el rango numérico
+
+
+def _qr_householder_numpy(A, b, tol):
+    """QR con pivoteo de columnas vectorizado: cada reflector es una actualización de rango 1."""
+    R = np.array(A, dtype=float)
+    qtb = np.array(b, dtype=float)
+    n, m = R.shape
+    perm = list(range(m))
+    rango = 0
+    norma0 = None
+    for k in range(min(n, m)):
+        normas = np.einsum("ij,ij->j", R[k:, k:], R[k:, k:])
+        p = k + int(np.argmax(normas))
+        norma = float(np.sqrt(normas[p - k]))
+        if norma0 is None:
+            norma0 = norma
+        if norma <= tol * max(norma0, 1e-300):
+            break
+        if p != k:
+            R[:, [k, p]] = R[:, [p, k]]
+            perm[k], perm[p] = perm[p], perm[k]
+        alfa = -norma if R[k, k] >= 0 else norma
+        v = R[k:, k].copy()
+        v[0] -= alfa
+        beta = 2.0 / float(v @ v)
+        R[k:, k + 1:] -= beta * np.outer(v, v @ R[k:, k + 1:])
+        qtb[k:] -= beta * (v @ qtb[k:]) * v
+        R[k, k] = alfa
+        R[k + 1:, k] = 0.0
+        rango += 1
+    return R.tolist(), perm, qtb.tolist(), rango
+
+
+def _qr_householder_python(A, b, tol, pasos=None, mat_str=None):
+    """QR con pivoteo de columnas en Python puro. La matriz se guarda por columnas para que cada
+    reflector se aplique a listas contiguas (el análogo en Python del trabajo por bloques)."""
+    n, m = len(A), len(A[0])
+    cols = [[float(A[i][j]) for i in range(n)] for j in range(m)]
+    qtb = [float(x) for x in b]
+    perm = list(range(m))
+    rango = 0
+    norma0 = None
+    for k in range(min(n, m)):
+        normas = [sum(x * x for x in cols[j][k:]) for j in range(k, m)]
+        p = k + max(range(len(normas)), key=normas.__getitem__)
+        norma = normas[p - k] ** 0.5
+        if norma0 is None:
+            norma0 = norma
+        if norma <= tol * max(norma0, 1e-300):
+            break
+        if p != k:
+            cols[k], cols[p] = cols[p], cols[k]
+            perm[k], perm[p] = perm[p], perm[k]
+        x = cols[k]
+        alfa = -norma if x[k] >= 0 else norma
+        v = x[k:]
+        v[0] -= alfa
+        beta = 2.0 / sum(t * t for t in v)
+        for c in cols[k + 1:] + [qtb]:
+            s = beta * sum(vi * ci for vi, ci in zip(v, c[k:]))
+            if s:
+                c[k:] = [ci - s * vi for ci, vi in zip(c[k:], v)]
+        x[k] = alfa
+        x[k + 1:] = [0.0] * (n - k - 1)
+        rango += 1
+        if pasos is not None:
+            aum = [[cols[j][i] for j in range(m)] + [qtb[i]] for i in range(n)]
+            pasos.append({"descripcion": f"Reflector H{k+1}: pivote columna x{perm[k]+1}, R{k+1}{k+1} = {mat_str([[alfa]])[0][0]}",
+                          "matriz": mat_str(aum)})
+    R = [[cols[j][i] for j in range(m)] for i in range(n)]
+    return R, perm, qtb, rango
+
+
+def qr_householder(A, b, tol=TOL_RANGO_QR, vectorizado=None, pasos=None, mat_str=None):
+    """Factoriza A·P = Q·R con reflectores de Householder y pivoteo de columnas, aplicando Q^T a b.
+
+    Retorna (R, perm, Q^T·b, rango): R es n x m triangular superior (sólo sus primeras 'rango'
+    filas son significativas) y la columna j de R corresponde a la variable perm[j].
+    Por defecto usa NumPy si está disponible y no se piden pasos.
+    """
+    if vectorizado is None:
+        vectorizado = np is not None and pasos is None
+    if vectorizado:
+        return _qr_householder_numpy(A, b, tol)
+    return _qr_householder_python(A, b, tol, pasos, mat_str)
+
+
+def minimos_cuadrados(A, b, tol=TOL_RANGO_QR, vectorizado=None, pasos=None, mat_str=None):
+    """Solución de mínimos cuadrados de A·x ≈ b por QR con pivoteo de columnas.
+
+    Si A tiene rango deficiente r se devuelve la solución básica (las variables de las columnas
+    no pivote valen 0). Retorna {"x", "rango", "residuo" (b - A·x), "norma_residuo", "perm"}.
+    """
+    R, perm, qtb, r = qr_householder(A, b, tol, vectorizado, pasos, mat_str)
+    m = len(A[0])
+    y = [0.0] * m
+    for i in range(r - 1, -1, -1):
+        s = qtb[i] - sum(R[i][j] * y[j] for j in range(i + 1, r))
+        y[i] = s / R[i][i]
+    x = [0.0] * m
+    for j in range(m):
+        x[perm[j]] = y[j]
+    residuo = [bi - sum(a * xj for a, xj in zip(fila, x)) for fila, bi in zip(A, b)]
+    return {"x": x, "rango": r, "residuo": residuo, "norma_residuo": _norma2(residuo), "perm": perm}
+
+
+# -------------------- PRECISIÓN MIXTA (LU float32 + REFINAMIENTO float64) --------------------
+TAM_PANEL_LU = 64              # columnas por panel del LU por bloques
+UMBRAL_PRECISION_MIXTA = 256   # n a partir del cual precision="auto" factoriza en float32
+COND_MAX_MIXTA = 1e5           # cond₁(A)·u₃₂ debe quedar lejos de 1 para que el refinamiento converja
+MAX_REFINAMIENTO = 10
+TOL_PIVOTE_LU = 1e-10          # |pivote| <= TOL_PIVOTE_LU·max|a_ij| ⇒ singular (umbral de la eliminación paso a paso, relativo)
+
+
+def _tol_pivote(A, tol_rel=TOL_PIVOTE_LU):
+    """Umbral absoluto de pivote nulo para el ndarray A: tol_rel veces su mayor entrada."""
+    return tol_rel * float(np.abs(A).max()) if A.size else 0.0
+
+
+def _lu_panel(A, nb=TAM_PANEL_LU, tol=0.0):
+    """LU con pivoteo parcial por bloques (right-looking) de un ndarray de n × w (n ≥ w), en sitio
+    y en la precisión de A: sub-panel de nb columnas, U12 = L11⁻¹·A12 y actualización del
+    complemento de Schur con un único producto matricial. Retorna los pivotes al estilo LAPACK
+    (en el paso k se intercambiaron las filas k y piv[k]) o None si algún pivote es <= tol en
+    valor absoluto (matriz singular o numéricamente singular; ver _tol_pivote)."""
+    w = A.shape[1]
+    piv = []
+    for k0 in range(0, w, nb):
+        k1 = min(k0 + nb, w)
+        for k in range(k0, k1):
+            p = k + int(np.argmax(np.abs(A[k:, k])))
+            if abs(A[p, k]) <= tol:
+                return None
+            if p != k:
+                A[[k, p]] = A[[p, k]]
+            piv.append(p)
+            A[k + 1:, k] /= A[k, k]
+            A[k + 1:, k + 1:k1] -= np.outer(A[k + 1:, k], A[k, k + 1:k1])
+        if k1 < w:
+            L11 = np.tril(A[k0:k1, k0:k1], -1) + np.eye(k1 - k0, dtype=A.dtype)
+            A[k0:k1, k1:] = np.linalg.solve(L11, A[k0:k1, k1:])
+            A[k1:, k1:] -= A[k1:, k0:k1] @ A[k0:k1, k1:]
+    return piv
+
+
+def _lu_bloques(A, nb=TAM_PANEL_LU, tol_rel=TOL_PIVOTE_LU):
+    """LU por bloques de un ndarray cuadrado (ver _lu_panel). Retorna la factorización (ver
+    _factor_lu) o None si algún pivote es <= tol_rel·max|a_ij|."""
+    piv = _lu_panel(A, nb, _tol_pivote(A, tol_rel))
+    if piv is None:
+        return None
+    perm = np.arange(A.shape[0])
+    for k, p in enumerate(piv):
+        perm[[k, p]] = perm[[p, k]]
+    return _factor_lu(A, perm, nb)
+
+
+def _factor_lu(LU, perm, nb):
+    """Empaqueta P·A = L·U con las inversas de los bloques diagonales de L y U, de modo que cada
+    sustitución posterior sea una secuencia de productos matriz-vector."""
+    n = LU.shape[0]
+    bloques = [(k0, min(k0 + nb, n)) for k0 in range(0, n, nb)]
+    inv_L, inv_U = [], []
+    for k0, k1 in bloques:
+        D = LU[k0:k1, k0:k1]
+        I = np.eye(k1 - k0, dtype=LU.dtype)
+        inv_L.append(np.linalg.solve(np.tril(D, -1) + I, I))
+        inv_U.append(np.linalg.solve(np.triu(D), I))
+    return {"LU": LU, "perm": perm, "bloques": bloques, "inv_L": inv_L, "inv_U": inv_U}
+
+
+def _sustitucion_bloques(T, inversas, bloques, b, inferior):
+    """Resuelve T·x = b con T triangular (inferior o superior) usando las inversas de sus bloques
+    diagonales; trabaja en la precisión de T."""
+    x = np.array(b, dtype=T.dtype)
+    pares = list(zip(bloques, inversas))
+    for (k0, k1), inv in (pares if inferior else pares[::-1]):
+        s = x[k0:k1] - (T[k0:k1, :k0] @ x[:k0] if inferior else T[k0:k1, k1:] @ x[k1:])
+        x[k0:k1] = inv @ s
+    return x
+
+
+def _resolver_lu(F, b):
+    """x con A·x = b a partir de la factorización P·A = L·U."""
+    y = _sustitucion_bloques(F["LU"], F["inv_L"], F["bloques"], np.asarray(b)[F["perm"]], True)
+    return _sustitucion_bloques(F["LU"], F["inv_U"], F["bloques"], y, False)
+
+
+def _resolver_lu_t(F, c):
+    """z con Aᵀ·z = c: Uᵀ·w = c, Lᵀ·y = w y z[perm] = y."""
+    T = F["LU"].T
+    w = _sustitucion_bloques(T, [inv.T for inv in F["inv_U"]], F["bloques"], c, True)
+    y = _sustitucion_bloques(T, [inv.T for inv in F["inv_L"]], F["bloques"], w, False)
+    z = np.empty_like(y)
+    z[F["perm"]] = y
+    return z
+
+
+def _estimar_norma_inversa_1(resolver, resolver_t, n, max_iter=5):
+    """Estimación de ‖A⁻¹‖₁ (Hager / Higham) con unas pocas resoluciones con A y Aᵀ sobre una
+    factorización ya calculada: O(n²) en lugar de los O(n³) de invertir."""
+    x = [1.0 / n] * n
+    est, j_previo = 0.0, None
+    for _ in range(max_iter):
+        y = resolver(x)
+        est = sum(abs(v) for v in y)
+        z = resolver_t([1.0 if v >= 0 else -1.0 for v in y])
+        j = max(range(n), key=lambda i: abs(z[i]))
+        if abs(z[j]) <= sum(map(mul, z, x)) or j == j_previo:
+            break
+        x = [0.0] * n
+        x[j], j_previo = 1.0, j
+    # Vector alternativo de Higham: cubre los casos en que la iteración se detiene en un máximo local
+    alt = [(-1.0) ** i * (1.0 + i / max(n - 1, 1)) for i in range(n)]
+    return max(est, 2.0 * sum(abs(v) for v in resolver(alt)) / (3.0 * n))
+
+
+def _resolver_doble(A, b, motivo, condicion=None):
+    """Resolución en float64; x = None si A es (numéricamente) singular."""
+    if np is not None:
+        # np.linalg.solve no detecta matrices de rango deficiente en coma flotante: LU con umbral relativo
+        F = _lu_bloques(np.array(A, dtype=float))
+        x = _resolver_lu(F, np.asarray(b, dtype=float)).tolist() if F is not None else None
+    else:
+        x = _resolver_numerico(A, b)
+    return {"x": x, "precision": "doble", "iteraciones": 0, "residuos": [], "condicion": condicion,
+            "mensaje": f"Resuelto en float64: {motivo}."}
+
+
+def resolver_precision_mixta(A, b, tol=None, max_iter=MAX_REFINAMIENTO, cond_max=COND_MAX_MIXTA, nb=TAM_PANEL_LU):
+    """Resuelve A·x = b (A cuadrada) factorizando en float32 y refinando en float64.
+
+    - La LU por bloques se hace en float32 (la mitad de tráfico de memoria); cada paso de
+      refinamiento calcula r = b - A·x en float64 y corrige x con una resolución en float32.
+    - Si cond₁(A) estimada supera cond_max, el refinamiento se estanca o no hay NumPy, resuelve
+      directamente en float64.
+    - tol: error hacia atrás ‖r‖∞ / (‖A‖∞·‖x‖∞ + ‖b‖∞) a alcanzar (por defecto √n·ε₆₄).
+
+    Retorna {"x": list | None, "precision": "mixta" | "doble", "iteraciones": int,
+             "residuos": [...], "condicion": float | None, "mensaje": str}
+    """
+    if np is None:
+        return _resolver_doble(A, b, "NumPy no está disponible")
+    A64 = np.asarray(A, dtype=float)
+    b64 = np.asarray(b, dtype=float)
+    n = A64.shape[0]
+    if tol is None:
+        tol = max(n, 1) ** 0.5 * np.finfo(float).eps
+
+    F = _lu_bloques(A64.astype(np.float32), nb)
+    if F is None or not np.all(np.isfinite(F["LU"])):
+        return _resolver_doble(A, b, "pivote nulo o desbordamiento en float32")
+    est = _estimar_norma_inversa_1(lambda v: _resolver_lu(F, np.asarray(v, dtype=float)).tolist(),
+                                   lambda v: _resolver_lu_t(F, np.asarray(v, dtype=float)).tolist(), n)
+    condicion = float(np.abs(A64).sum(axis=0).max() * est)
+    if not np.isfinite(condicion) or condicion > cond_max:
+        return _resolver_doble(A, b, f"condición estimada {condicion:.3g} > {cond_max:.0e}", condicion)
+
+    norma_A = np.abs(A64).sum(axis=1).max()
+    norma_b = np.abs(b64).max() if n else 0.0
+    x = _resolver_lu(F, b64).astype(float)
+    residuos = []
+    for it in range(max_iter + 1):
+        r = b64 - A64 @ x
+        denom = norma_A * np.abs(x).max() + norma_b
+        residuos.append(float(np.abs(r).max() / denom) if denom else 0.0)
+        if residuos[-1] <= tol:
+            return {"x": x.tolist(), "precision": "mixta", "iteraciones": it, "residuos": residuos,
+                    "condicion": condicion,
+                    "mensaje": f"LU en float32 + {it} paso(s) de refinamiento en float64."}
+        if it == max_iter or (it > 0 and residuos[-1] > 0.5 * residuos[-2]):
+            break
+        x += _resolver_lu(F, r).astype(float)
+    res = _resolver_doble(A, b, "el refinamiento en float32 no alcanzó la tolerancia", condicion)
+    res["residuos"] = residuos
+    return res
+
+
+# -------------------- SALUD NUMÉRICA --------------------
+EPS_DOBLE = 2.0 ** -52
+COND_ADVERTENCIA = 1e10   # cond₁(A) desde la que se pierden ≥ 10 de los ~16 dígitos de float64
+CRECIMIENTO_ADVERTENCIA = 1e4
+
+
+def _norma1(A):
+    """‖A‖₁: máxima suma de columna en valor absoluto."""
+    return max((sum(abs(x) for x in col) for col in zip(*A)), default=0.0)
+
+
+def _norma_inf(A):
+    """‖A‖∞: máxima suma de fila en valor absoluto."""
+    return max((sum(abs(x) for x in fila) for fila in A), default=0.0)
+
+
+def _max_abs(filas, ncols):
+    return max((abs(x) for fila in filas for x in fila[:ncols]), default=0.0)
+
+
+def _aplicar_operaciones(ops, v):
+    """A⁻¹·v repitiendo sobre v las operaciones de fila de Gauss-Jordan que llevaron A a I:
+    ("swap", i, j, _), ("escala", i, _, p) para Fi / p y ("resta", r, f, c) para Fr - c·Ff."""
+    x = list(v)
+    for op, i, j, c in ops:
+        if op == "swap":
+            x[i], x[j] = x[j], x[i]
+        elif op == "escala":
+            x[i] /= c
+        else:
+            x[i] -= c * x[j]
+    return x
+
+
+def _aplicar_operaciones_t(ops, v):
+    """A⁻ᵀ·v: las traspuestas de las mismas operaciones elementales, en orden inverso."""
+    x = list(v)
+    for op, i, j, c in reversed(ops):
+        if op == "swap":
+            x[i], x[j] = x[j], x[i]
+        elif op == "escala":
+            x[i] /= c
+        else:
+            x[j] -= c * x[i]
+    return x
+
+
+def _resolver_lu_filas(LU, perm, b):
+    """x con A·x = b a partir de P·A = L·U empaquetada en listas (L unitaria bajo la diagonal)."""
+    n = len(LU)
+    y = [b[p] for p in perm]
+    for i in range(n):
+        fila = LU[i]
+        y[i] -= sum(fila[k] * y[k] for k in range(i))
+    for i in range(n - 1, -1, -1):
+        fila = LU[i]
+        y[i] = (y[i] - sum(fila[k] * y[k] for k in range(i + 1, n))) / fila[i]
+    return y
+
+
+def _resolver_lu_filas_t(LU, perm, c):
+    """z con Aᵀ·z = c: Uᵀ·w = c, Lᵀ·y = w y z[perm] = y."""
+    n = len(LU)
+    w = list(c)
+    for i in range(n):
+        w[i] = (w[i] - sum(LU[k][i] * w[k] for k in range(i))) / LU[i][i]
+    for i in range(n - 1, -1, -1):
+        w[i] -= sum(LU[k][i] * w[k] for k in range(i + 1, n))
+    z = [0.0] * n
+    for i, p in enumerate(perm):
+        z[p] = w[i]
+    return z
+
+
+def error_hacia_atras(A, x, b):
+    """Error relativo hacia atrás normwise ‖b - A·x‖∞ / (‖A‖∞·‖x‖∞ + ‖b‖∞) (Rigal-Gaches): el
+    menor cambio relativo en A y b para el que x es solución exacta."""
+    r = max((abs(bi - sum(map(mul, fila, x))) for fila, bi in zip(A, b)), default=0.0)
+    denom = _norma_inf(A) * max(map(abs, x), default=0.0) + max(map(abs, b), default=0.0)
+    return r / denom if denom else 0.0
+
+
+def informe_salud(A, resolver=None, resolver_t=None, norma_inversa=None, crecimiento=None,
+                  error_atras=None):
+    """Informe numérico de una factorización de la matriz cuadrada A.
+
+    - condicion: cond₁(A) = ‖A‖₁·‖A⁻¹‖₁; ‖A⁻¹‖₁ se toma de norma_inversa si se conoce
+      o se estima (Hager / Higham) con resolver / resolver_t sobre la factorización, en O(n²).
+    - digitos_perdidos: log₁₀ cond₁(A), cota de los dígitos significativos que se pierden.
+    - crecimiento_pivotes: max |a_ij| durante la eliminación / max |a_ij| de A.
+    - error_atras: ver error_hacia_atras.
+    - advertencia: texto si la matriz está casi singular o la eliminación fue inestable.
+    """
+    n = len(A)
+    if norma_inversa is None:
+        norma_inversa = _estimar_norma_inversa_1(resolver, resolver_t, n)
+    condicion = _norma1(A) * norma_inversa
+    avisos = []
+    if condicion >= COND_ADVERTENCIA:
+        avisos.append(f"matriz casi singular (cond₁ ≈ {condicion:.2e}): sólo ~{max(0.0, 16 - log10(condicion)):.0f} "
+                      f"dígitos significativos fiables")
+    if crecimiento is not None and crecimiento >= CRECIMIENTO_ADVERTENCIA:
+        avisos.append(f"crecimiento de pivotes {crecimiento:.2e}: eliminación potencialmente inestable")
+    return {"condicion": condicion,
+            "digitos_perdidos": log10(condicion) if condicion > 0 else 0.0,
+            "crecimiento_pivotes": crecimiento,
+            "error_atras": error_atras,
+            "advertencia": "; ".join(avisos) or None}
+
+
+# -------------------- ELIMINACIÓN FUERA DE MEMORIA --------------------
+MEMORIA_FUERA_DE_MEMORIA = 256 * 2 ** 20  # bytes de RAM para los dos paneles n × nb en memoria
+UMBRAL_FUERA_DE_MEMORIA = 2000             # n desde el que crud.resolver_matriz resuelve en disco
+
+
+def _tam_panel_fuera(n, memoria):
+    """Columnas por panel para que dos paneles de n filas quepan en 'memoria' bytes."""
+    return max(1, memoria // (2 * 8 * n))
+
+
+def _leer(io, W, indice):
+    bloque = np.array(W[indice])
+    io["leidos"] += bloque.nbytes
+    return bloque
+
+
+def _escribir(io, W, indice, bloque):
+    W[indice] = bloque
+    io["escritos"] += bloque.nbytes
+
+
+def _fase_io():
+    return {"leidos": 0, "escritos": 0, "segundos": 0.0}
+
+
+def lu_fuera_de_memoria(ruta, n, m, ruta_trabajo=None, tam_panel=None, memoria=MEMORIA_FUERA_DE_MEMORIA,
+                        tol_rel=TOL_PIVOTE_LU):
+    """Eliminación gaussiana con pivoteo parcial de la aumentada [A | B] (n × m, m > n) guardada
+    en 'ruta' como float64 fila por fila (persistencia.guardar_matriz_binaria), sin cargarla en RAM.
+
+    - Copia: la matriz se pasa por bloques de filas a un archivo de trabajo en orden por
+      columnas (ruta_trabajo, por defecto ruta + ".lu"), donde cada panel de columnas es contiguo.
+    - Factorización right-looking por paneles de tam_panel columnas (por defecto, lo que deja
+      caber dos paneles en 'memoria'): se lee el panel, se factoriza en RAM (_lu_panel) y cada
+      panel a su derecha se lee, se le aplican los intercambios, U12 = L11⁻¹·A12, A22 -= L21·U12 y
+      se vuelve a escribir. B viaja como columnas finales, así que al terminar contiene L⁻¹·P·B.
+    - Singular: algún pivote <= tol_rel·max|a_ij| de A (el máximo se toma durante la copia),
+      el mismo criterio relativo que _lu_bloques.
+
+    Retorna {"archivo": ruta_trabajo, "n", "m", "tam_panel", "singular": bool,
+             "io": {"copia": {...}, "factorizacion": {...}}} con bytes leídos / escritos y segundos
+    por fase.
+    """
+    if np is None:
+        raise RuntimeError("La eliminación fuera de memoria requiere NumPy.")
+    if m <= n:
+        raise ValueError("Se requiere una matriz aumentada [A | B] con m > n columnas.")
+    nb = tam_panel or _tam_panel_fuera(n, memoria)
+    ruta_trabajo = ruta_trabajo or ruta + ".lu"
+    io = {"copia": _fase_io(), "factorizacion": _fase_io()}
+
+    t0 = time.perf_counter()
+    R = np.memmap(ruta, dtype=np.float64, mode="r", shape=(n, m))
+    W = np.memmap(ruta_trabajo, dtype=np.float64, mode="w+", shape=(n, m), order="F")
+    filas = max(1, memoria // (2 * 8 * m))
+    tol = 0.0
+    for r0 in range(0, n, filas):
+        bloque = _leer(io["copia"], R, slice(r0, r0 + filas))
+        tol = max(tol, _tol_pivote(bloque[:, :n], tol_rel))
+        _escribir(io["copia"], W, slice(r0, r0 + filas), bloque)
+    W.flush()
+    del R
+    io["copia"]["segundos"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    fase, singular = io["factorizacion"], False
+    for k0 in range(0, n, nb):
+        k1 = min(k0 + nb, n)
+        P = _leer(fase, W, np.s_[k0:, k0:k1])
+        piv = _lu_panel(P, tol=tol)
+        if piv is None:
+            singular = True
+            break
+        _escribir(fase, W, np.s_[k0:, k0:k1], P)
+        w = k1 - k0
+        L11 = np.tril(P[:w], -1) + np.eye(w)
+        for j0 in range(k1, m, nb):
+            j1 = min(j0 + nb, m)
+            T = _leer(fase, W, np.s_[k0:, j0:j1])
+            for k, p in enumerate(piv):
+                if p != k:
+                    T[[k, p]] = T[[p, k]]
+            T[:w] = np.linalg.solve(L11, T[:w])
+            T[w:] -= P[w:] @ T[:w]
+            _escribir(fase, W, np.s_[k0:, j0:j1], T)
+        W.flush()  # las actualizaciones del panel van a disco antes de leer el siguiente
+    del W
+    fase["segundos"] = time.perf_counter() - t0
+    return {"archivo": ruta_trabajo, "n": n, "m": m, "tam_panel": nb, "singular": singular, "io": io}
+
+
+def resolver_fuera_de_memoria(ruta, n, m=None, ruta_trabajo=None, tam_panel=None,
+                              memoria=MEMORIA_FUERA_DE_MEMORIA, conservar=False, tol_rel=TOL_PIVOTE_LU):
+    """Resuelve A·X = B para la aumentada [A | B] de n × m en disco (m = n + 1 por defecto) con
+    lu_fuera_de_memoria y una sustitución hacia atrás por paneles, en orden inverso, que lee U
+    una sola vez. Sólo B (n × k) y un panel de U están en RAM.
+
+    Retorna {"x": list | None (primera columna de X), "soluciones": [k listas] | None,
+             "mensaje": str, "tam_panel": int, "io": {"copia", "factorizacion", "sustitucion"}};
+    x es None si A es singular o numéricamente singular (pivote <= tol_rel·max|a_ij|).
+    Con conservar=False el archivo de trabajo se borra al terminar.
+    """
+    m = m or n + 1
+    lu = lu_fuera_de_memoria(ruta, n, m, ruta_trabajo, tam_panel, memoria, tol_rel)
+    io, nb = lu["io"], lu["tam_panel"]
+    res = {"x": None, "soluciones": None, "tam_panel": nb, "io": io,
+           "mensaje": "La matriz es singular: el sistema no tiene solución única."}
+    if not lu["singular"]:
+        t0 = time.perf_counter()
+        fase = io["sustitucion"] = _fase_io()
+        W = np.memmap(lu["archivo"], dtype=np.float64, mode="r", shape=(n, m), order="F")
+        X = _leer(fase, W, np.s_[:, n:])
+        for k0 in reversed(range(0, n, nb)):
+            k1 = min(k0 + nb, n)
+            U = _leer(fase, W, np.s_[:k1, k0:k1])
+            X[k0:k1] = np.linalg.solve(np.triu(U[k0:k1]), X[k0:k1])
+            X[:k0] -= U[:k0] @ X[k0:k1]
+        del W
+        fase["segundos"] = time.perf_counter() - t0
+        res["soluciones"] = X.T.tolist()
+        res["x"] = res["soluciones"][0]
+        res["mensaje"] = "El sistema tiene solución única."
+    if not conservar:
+        os.remove(lu["archivo"])
+    return res
+
+
+# -------------------- ELIMINACIÓN PARALELA --------------------
+UMBRAL_ELIMINACION_PARALELA = 256  # n desde el que gauss_jordan / inversa con hilos usan lu_paralelo
+
+
+def _columnas_por_hilo(j0, j1, hilos, nb):
+    """Reparte las columnas j0:j1 en tramos contiguos de al menos nb columnas, uno por hilo."""
+    paso = max(nb, -(-(j1 - j0) // hilos))
+    return [(a, min(a + paso, j1)) for a in range(j0, j1, paso)]
+
+
+def _actualizar_columnas(A, k0, k1, piv, L11, j0, j1):
+    """Aplica a las columnas j0:j1 los intercambios del panel k0:k1 y, si están a su derecha,
+    U12 = L11⁻¹·A12 y A22 -= L21·U12. Cada tramo de columnas es independiente de los demás."""
+    B = A[k0:, j0:j1]
+    for k, p in enumerate(piv):
+        if p != k:
+            B[[k, p]] = B[[p, k]]
+    if j0 >= k1:
+        w = k1 - k0
+        B[:w] = np.linalg.solve(L11, B[:w])
+        B[w:] -= A[k1:, k0:k1] @ B[:w]
+
+
+def lu_paralelo(A, hilos=None, nb=TAM_PANEL_LU, tol_rel=TOL_PIVOTE_LU):
+    """LU con pivoteo parcial por bloques (right-looking) de un ndarray cuadrado, en sitio.
+
+    Cada panel de nb columnas se factoriza en el hilo principal (_lu_panel); luego los
+    intercambios de filas y la actualización del complemento de Schur se reparten por tramos de
+    columnas entre un pool de 'hilos' hilos (por defecto os.cpu_count()). Los productos y
+    resoluciones de NumPy liberan el GIL, así que los tramos avanzan en paralelo; si la BLAS ya es
+    multihilo conviene limitarla (p. ej. OPENBLAS_NUM_THREADS=1) para no sobresuscribir núcleos.
+
+    Retorna la factorización (ver _factor_lu) con "signo" = det(P), o None si algún pivote es
+    <= tol_rel·max|a_ij| (matriz singular o numéricamente singular).
+    """
+    n = A.shape[0]
+    hilos = max(1, hilos or os.cpu_count() or 1)
+    tol = _tol_pivote(A, tol_rel)
+    perm = np.arange(n)
+    signo = 1
+    with ThreadPoolExecutor(max_workers=hilos) as pool:
+        for k0 in range(0, n, nb):
+            k1 = min(k0 + nb, n)
+            piv = _lu_panel(A[k0:, k0:k1], tol=tol)
+            if piv is None:
+                return None
+            for k, p in enumerate(piv):
+                if p != k:
+                    perm[[k0 + k, k0 + p]] = perm[[k0 + p, k0 + k]]
+                    signo = -signo
+            L11 = np.tril(A[k0:k1, k0:k1], -1) + np.eye(k1 - k0)
+            tramos = _columnas_por_hilo(0, k0, hilos, nb) + _columnas_por_hilo(k1, n, hilos, nb)
+            list(pool.map(lambda t: _actualizar_columnas(A, k0, k1, piv, L11, *t), tramos))
+    F = _factor_lu(A, perm, nb)
+    F["signo"] = signo
+    return F
+
+
+def resolver_paralelo(A, B, hilos=None, nb=TAM_PANEL_LU):
+    """X con A·X = B (B de n × k) factorizando con lu_paralelo y resolviendo las columnas de B
+    por tramos en el mismo número de hilos. Retorna (X, F) o (None, None) si A es singular."""
+    hilos = max(1, hilos or os.cpu_count() or 1)
+    F = lu_paralelo(np.array(A, dtype=float), hilos, nb)
+    if F is None:
+        return None, None
+    B = np.asarray(B, dtype=float)
+    if B.ndim == 1:
+        return _resolver_lu(F, B), F
+    X = np.empty_like(B)
+    tramos = _columnas_por_hilo(0, B.shape[1], hilos, 1)
+    with ThreadPoolExecutor(max_workers=hilos) as pool:
+        for (j0, j1), parte in zip(tramos, pool.map(lambda t: _resolver_lu(F, B[:, t[0]:t[1]]), tramos)):
+            X[:, j0:j1] = parte
+    return X, F
+
+
+def _salud_lu(A, F):
+    """informe_salud sobre una factorización de _factor_lu (cond₁ estimada con F)."""
+    return informe_salud(A, lambda v: _resolver_lu(F, np.asarray(v, dtype=float)).tolist(),
+                         lambda v: _resolver_lu_t(F, np.asarray(v, dtype=float)).tolist())
+
+
+def medir_escalado_paralelo(n=1024, hilos=None, nb=TAM_PANEL_LU, repeticiones=2):
+    """Mide lu_paralelo sobre una matriz aleatoria n × n con 1, 2, ..., hilos hilos (por defecto
+    os.cpu_count()). Retorna {"n", "mediciones": [{"hilos", "segundos", "aceleracion",
+    "eficiencia"}]}, con aceleración = t₁ / t_p y eficiencia = aceleración / p."""
+    if np is None:
+        raise RuntimeError("La eliminación paralela requiere NumPy.")
+    hilos = hilos or os.cpu_count() or 1
+    A = np.random.default_rng(0).standard_normal((n, n)) + n ** 0.5 * np.eye(n)
+    mediciones = []
+    for p in range(1, hilos + 1):
+        mejor = float("inf")
+        for _ in range(repeticiones):
+            M = A.copy()
+            t0 = time.perf_counter()
+            lu_paralelo(M, p, nb)
+            mejor = min(mejor, time.perf_counter() - t0)
+        t1 = mediciones[0]["segundos"] if mediciones else mejor
+        mediciones.append({"hilos": p, "segundos": mejor, "aceleracion": t1 / mejor,
+                           "eficiencia": t1 / mejor / p})
+    return {"n": n, "mediciones": mediciones}
+
+
+# -------------------- RELACIONES DE DEPENDENCIA --------------------
+UMBRAL_VECTORIZADO = 2500  # n·k a partir del cual independencia_vectores sin pasos usa NumPy
+
+
+def _solucion_independencia(R, pivotes, libres, k, tol=1e-10):
+    """Arma la solución de independencia a partir de la RREF R (vectores como columnas).
+
+    pivotes: {columna: fila}. Para cada columna libre f, v_f = Σ R[fila_p][f]·v_p sobre las columnas
+    pivote p, y x = e_f - Σ R[fila_p][f]·e_p es un vector de la base del espacio nulo.
+    """
+    dependencias = []
+    base_nula = []
+    for f in libres:
+        coefs = {}
+        x = [0] * k
+        x[f] = 1
+        for p in sorted(pivotes):
+            c = R[pivotes[p]][f]
+            if abs(c) > tol:
+                coefs[p + 1] = c
+                x[p] = -c
+        dependencias.append({"vector": f + 1, "coeficientes": coefs})
+        base_nula.append(x)
+    rango = len(pivotes)
+    return {
+        "independiente": rango == k,
+        "rango": rango,
+        "pivotes": [c + 1 for c in sorted(pivotes)],
+        "libres": [c + 1 for c in libres],
+        "dependencias": dependencias,
+        "base_nula": base_nula,
+    }
+
+
+def _mensaje_independencia(solucion):
+    if solucion["independiente"]:
+        return "Linealmente independientes "
+    libres_nombres = ", ".join(f"v{c}" for c in solucion["libres"]) if solucion["libres"] else "ninguna"
+    mensaje = f"Linealmente dependientes. Columnas sin pivote (libres): {libres_nombres}."
+    for dep in solucion.get("dependencias", []):
+        terminos = " + ".join(f"({Matriz._format_number(c)})·v{p}" for p, c in dep["coeficientes"].items()) or "0"
+        mensaje += f"\nv{dep['vector']} = {terminos}"
+    return mensaje
+
+
+def dependencias_vectores(vectores, tol=1e-10):
+    """Independencia, relaciones de dependencia y base del espacio nulo en una sola pasada.
+
+    Con NumPy la RREF se calcula con operaciones vectorizadas (pivoteo parcial, una actualización
+    de rango 1 por columna); sin NumPy se usa la eliminación de Matriz.independencia_vectores.
+    Retorna el mismo dict que la clave "solucion" de independencia_vectores.
+    """
+    k = len(vectores)
+    if k == 0:
+        return {"independiente": True, "rango": 0, "pivotes": [], "libres": [], "dependencias": [], "base_nula": []}
+    if np is None:
+        A = [[vectores[c][r] for c in range(k)] for r in range(len(vectores[0]))]
+        return Matriz(A).independencia_vectores(vectores, mostrar_pasos=False)["solucion"]
+    R = np.array(vectores, dtype=float).T.copy()
+    n = R.shape[0]
+    escala = max(1.0, float(np.abs(R).max()))
+    pivotes = {}
+    libres = []
+    fila = 0
+    for col in range(k):
+        if fila >= n:
+            libres.append(col)
+            continue
+        r = fila + int(np.argmax(np.abs(R[fila:, col])))
+        if abs(R[r, col]) <= tol * escala:
+            R[fila:, col] = 0.0
+            libres.append(col)
+            continue
+        if r != fila:
+            R[[fila, r]] = R[[r, fila]]
+        R[fila] /= R[fila, col]
+        factores = R[:, col].copy()
+        factores[fila] = 0.0
+        R -= np.outer(factores, R[fila])
+        pivotes[col] = fila
+        fila += 1
+    return _solucion_independencia(R.tolist(), pivotes, libres, k, tol)
+
+
+# -------------------- VISTAS SIN COPIA --------------------
+class _FilaVista:
+    """Fila de una vista: lee base_fila[indices[j]] sin copiar. Un slice devuelve una lista."""
+    __slots__ = ("_fila", "_indices")
+
+    def __init__(self, fila, indices):
+        self._fila = fila
+        self._indices = indices
+
+    def __len__(self):
+        return len(self._indices)
+
+    def __getitem__(self, j):
+        if isinstance(j, slice):
+            return [self._fila[k] for k in self._indices[j]]
+        return self._fila[self._indices[j]]
+
+    def __iter__(self):
+        fila = self._fila
+        return (fila[k] for k in self._indices)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class _ColumnaVista(_FilaVista):
+    """Columna 'col' de la base recorrida por las filas 'indices' (fila de una vista traspuesta)."""
+    __slots__ = ("_col",)
+
+    def __init__(self, base, indices, col):
+        super().__init__(base, indices)
+        self._col = col
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._fila[k][self._col] for k in self._indices[i]]
+        return self._fila[self._indices[i]][self._col]
+
+    def __iter__(self):
+        base, col = self._fila, self._col
+        return (base[k][col] for k in self._indices)
+
+
+class VistaMatriz:
+    """Vista de sólo lectura sobre las filas de otra matriz (traspuesta y/o submatriz), sin copiar.
+
+    Se comporta como una lista de listas para lectura (len, V[i][j], iteración por filas, slices
+    que devuelven listas), así que los algoritmos del módulo la aceptan tal cual. No admite
+    escritura: para modificarla se usa materializar() / a_listas(), que recién ahí copia.
+    Para (i, j): sin trasponer es base[filas[i]][columnas[j]]; traspuesta, base[filas[j]][columnas[i]].
+    """
+    __slots__ = ("_base", "_filas", "_columnas", "_traspuesta")
+
+    def __init__(self, base, filas=None, columnas=None, traspuesta=False):
+        if isinstance(base, Matriz):
+            base = base.A
+        if isinstance(base, VistaMatriz):
+            padre = base
+            base = padre._base
+            # Índices pedidos en coordenadas de la vista padre -> coordenadas de la base
+            propias_f, propias_c = (padre._columnas, padre._filas) if padre._traspuesta else (padre._filas, padre._columnas)
+            f = propias_f if filas is None else [propias_f[i] for i in filas]
+            c = propias_c if columnas is None else [propias_c[j] for j in columnas]
+            if padre._traspuesta:
+                f, c = c, f
+            filas, columnas, traspuesta = f, c, padre._traspuesta != traspuesta
+        else:
+            filas = range(len(base)) if filas is None else filas
+            columnas = range(len(base[0])) if columnas is None else columnas
+        if not len(filas) or not len(columnas):
+            raise ValueError("La vista no puede estar vacía.")
+        self._base = base
+        self._filas = filas
+        self._columnas = columnas
+        self._traspuesta = traspuesta
+
+    @property
+    def n(self):
+        return len(self._columnas) if self._traspuesta else len(self._filas)
+
+    @property
+    def m(self):
+        return len(self._filas) if self._traspuesta else len(self._columnas)
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(self.n))]
+        if self._traspuesta:
+            return _ColumnaVista(self._base, self._filas, self._columnas[i])
+        return _FilaVista(self._base[self._filas[i]], self._columnas)
+
+    def __iter__(self):
+        return (self[i] for i in range(self.n))
+
+    def __array__(self, dtype=None, copy=None):
+        arr = np.asarray(self._base, dtype=dtype)[np.ix_(list(self._filas), list(self._columnas))]
+        return arr.T if self._traspuesta else arr
+
+    def traspuesta(self):
+        return VistaMatriz(self, traspuesta=True)
+
+    def a_listas(self):
+        return [list(fila) for fila in self]
+
+    def materializar(self):
+        """Copia la vista en una Matriz nueva (necesario antes de escribir)."""
+        return Matriz._desde_filas(self.a_listas())
+
+    def __repr__(self):
+        return f"VistaMatriz({self.n}x{self.m})"
+
+
+def bloque_coeficientes(datos):
+    """Vista del bloque A de una aumentada [A | b] (todas las columnas menos la última)."""
+    base = datos.A if isinstance(datos, Matriz) else datos
+    return VistaMatriz(base, columnas=range(len(base[0]) - 1))
+
+
+def columna(datos, j):
+    """Vista de la columna j (admite -1 para el término independiente) como secuencia 1-D."""
+    base = datos.A if isinstance(datos, Matriz) else datos
+    return _ColumnaVista(base, range(len(base)), j)
+
+
+class _FilaMatriz:
+    """Fila i de una Matriz: lectura y escritura directas sobre el buffer plano (stride m).
+    Un slice devuelve una lista, así que row[:] / fila[:-1] siguen produciendo listas."""
+    __slots__ = ("_datos", "_inicio", "_m")
+
+    def __init__(self, datos, inicio, m):
+        self._datos = datos
+        self._inicio = inicio
+        self._m = m
+
+    def tolist(self):
+        seg = self._datos[self._inicio:self._inicio + self._m]
+        return seg.tolist() if isinstance(seg, array) else seg
+
+    def __len__(self):
+        return self._m
+
+    def _indice(self, j):
+        if j < 0:
+            j += self._m
+        if not 0 <= j < self._m:
+            raise IndexError("índice de columna fuera de rango")
+        return self._inicio + j
+
+    def __getitem__(self, j):
+        if isinstance(j, slice):
+            seg = self._datos[self._inicio:self._inicio + self._m][j]
+            return seg.tolist() if isinstance(seg, array) else seg
+        return self._datos[self._indice(j)]
+
+    def __setitem__(self, j, valor):
+        self._datos[self._indice(j)] = valor
+
+    def __iter__(self):
+        return iter(self._datos[self._inicio:self._inicio + self._m])
+
+    def __add__(self, other):
+        return self.tolist() + list(other)
+
+    def __radd__(self, other):
+        return list(other) + self.tolist()
+
+    def __eq__(self, other):
+        try:
+            return self.tolist() == list(other)
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return repr(self.tolist())
+
+
+class _FilasMatriz:
+    """Vista "lista de listas" (atributo A) sobre el buffer plano de una Matriz."""
+    __slots__ = ("_datos", "_n", "_m")
+
+    def __init__(self, datos, n, m):
+        self._datos = datos
+        self._n = n
+        self._m = m
+
+    def __len__(self):
+        return self._n
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(self._n))]
+        if i < 0:
+            i += self._n
+        if not 0 <= i < self._n:
+            raise IndexError("índice de fila fuera de rango")
+        return _FilaMatriz(self._datos, i * self._m, self._m)
+
+    def __iter__(self):
+        return (_FilaMatriz(self._datos, i * self._m, self._m) for i in range(self._n))
+
+    def __eq__(self, other):
+        try:
+            return [list(f) for f in self] == [list(f) for f in other]
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return repr([f.tolist() for f in self])
+
+
+def _buffer_plano(filas):
+    """Aplana 'filas' en un array('d') si todas las entradas son float o int representables
+    exactamente; con otros tipos (Fraction, enteros enormes) usa una lista plana para no perder
+    exactitud."""
+    plano = list(chain.from_iterable(filas))
+    tipos = set(map(type, plano))
+    if tipos <= {float, int} and (int not in tipos or
+                                  max(abs(x) for x in plano if type(x) is int) < 2 ** 53):
+        return array("d", plano)
+    return plano
+
+
+def _combinar_buffers(a, b, op):
+    """Operación elemento a elemento entre dos buffers planos; array('d') si ambos lo son."""
+    datos = list(map(op, a, b))
+    return array("d", datos) if isinstance(a, array) and isinstance(b, array) else datos
+
+
+TAM_TRAMO = 4096  # elementos por tramo en las operaciones en sitio sin NumPy
+
+
+class PoolBuffers:
+    """Pool pequeño de buffers array('d') reutilizables, agrupados por tamaño.
+
+    Las operaciones en sitio toman de aquí su espacio de trabajo (p. ej. la salida de un
+    producto) y lo devuelven al terminar, de modo que una reducción sobre un conjunto largo de
+    matrices no crea un buffer nuevo por paso.
+    """
+
+    def __init__(self, max_por_tamano=4):
+        self.max_por_tamano = max_por_tamano
+        self._libres = {}
+
+    def tomar(self, tam):
+        libres = self._libres.get(tam)
+        if libres:
+            return libres.pop()
+        return array("d", bytes(8 * tam))
+
+    def devolver(self, buf):
+        if isinstance(buf, array):
+            libres = self._libres.setdefault(len(buf), [])
+            if len(libres) < self.max_por_tamano:
+                libres.append(buf)
+
+    def vaciar(self):
+        self._libres.clear()
+
+
+pool_buffers = PoolBuffers()
+
+
+def _vista_np(datos, forma=None):
+    """Vista NumPy que comparte memoria con un array('d') (None sin NumPy o con lista plana)."""
+    if np is None or not isinstance(datos, array):
+        return None
+    v = np.frombuffer(datos, dtype=float)
+    return v.reshape(forma) if forma is not None else v
+
+
+def _operar_en(out, a, b, op):
+    """out[k] = op(a[k], b[k]) sobre buffers planos del mismo largo, sin buffers temporales del
+    tamaño de la matriz (NumPy con out=, o tramos de TAM_TRAMO). Retorna el buffer resultante:
+    el mismo 'out', salvo que haya que pasar a lista plana para no perder exactitud."""
+    vo, va, vb = _vista_np(out), _vista_np(a), _vista_np(b)
+    if vo is not None and va is not None and vb is not None:
+        (np.add if op is add else np.subtract)(va, vb, out=vo)
+        return out
+    if isinstance(out, array) and not (isinstance(a, array) and isinstance(b, array)):
+        return list(map(op, a, b))  # entradas exactas (Fraction): el resultado no cabe en doubles
+    conv = array if isinstance(out, array) else None
+    for i in range(0, len(out), TAM_TRAMO):
+        j = i + TAM_TRAMO
+        tramo = map(op, a[i:j], b[i:j])
+        out[i:j] = array("d", tramo) if conv else list(tramo)
+    return out
+
+
+def _producto_en(out, a, b, n, m, p):
+    """out (n·p) = a (n·m) @ b (m·p) sobre buffers planos; out no debe compartir memoria con a/b.
+    Si algún buffer es una lista plana, retorna una lista nueva con el producto de
+    multiplicar_bloques (en coma flotante, como el operador @)."""
+    vo, va, vb = _vista_np(out, (n, p)), _vista_np(a, (n, m)), _vista_np(b, (m, p))
+    if vo is not None and va is not None and vb is not None:
+        np.matmul(va, vb, out=vo)
+        return out
+    if not (isinstance(out, array) and isinstance(a, array) and isinstance(b, array)):
+        filas_a = [a[i:i + m] for i in range(0, n * m, m)]
+        filas_b = [b[i:i + p] for i in range(0, m * p, p)]
+        return list(chain.from_iterable(multiplicar_bloques(filas_a, filas_b)))
+    # B traspuesta en un buffer del pool; filas y columnas se recorren como memoryview (sin copias)
+    bt = pool_buffers.tomar(m * p)
+    for c in range(p):
+        bt[c * m:(c + 1) * m] = b[c::p]
+    mv_a, mv_bt = memoryview(a), memoryview(bt)
+    columnas = [mv_bt[c * m:(c + 1) * m] for c in range(p)]
+    for i in range(n):
+        fila = mv_a[i * m:(i + 1) * m]
+        out[i * p:(i + 1) * p] = array("d", [sum(map(mul, fila, col)) for col in columnas])
+    for v in columnas:
+        v.release()
+    mv_a.release()
+    mv_bt.release()
+    pool_buffers.devolver(bt)
+    return out
+
+
+class Matriz:
+    # Representación compacta: un único buffer plano (array('d') de doubles, fila por fila) en lugar
+    # de una lista de listas de floats "boxed"; A es una vista sobre ese buffer.
+    __slots__ = ("_datos", "n", "m", "_variables")
+
+    def __init__(self, datos):
+        # Validaciones básicas
+        # - Datos no vacíos
+        #
+        if not datos or not all(datos):
+            raise ValueError("La matriz no puede estar vacía.")
+        cols = len(datos[0])
+
+        # - Todas las filas, igual cantidad de columnas
+        for fila in datos:
+            if len(fila) != cols:
+                raise ValueError("Todas las filas deben tener la misma cantidad de columnas")
+        
+        # Guardo mi matriz(A) en un buffer plano, numero de filas y columnas tambn
+        
+        self._datos = _buffer_plano(datos)
+        self.n = len(datos)
+        self.m = cols
+        
+        # Los nombres de variables x1, x2, ..., x(m-1) se generan recién al pedirlos
+        self._variables = None
+
+    @property
+    def A(self):
+        """Entradas como lista de filas indexable (A[i][j]); lee y escribe sobre el buffer."""
+        return _FilasMatriz(self._datos, self.n, self.m)
+
+    @A.setter
+    def A(self, filas):
+        self._datos = _buffer_plano(filas)
+        self.n = len(filas)
+        self.m = len(filas[0])
+        self._variables = None
+
+    @property
+    def variables(self):
+        if self._variables is None:
+            self._variables = [f"x{i+1}" for i in range(self.m - 1)]
+        return self._variables
+
+    def _filas(self):
+        """Copia de las entradas como lista de listas (para los kernels que indexan mucho)."""
+        m, d = self.m, self._datos
+        if isinstance(d, array):
+            return [d[i:i + m].tolist() for i in range(0, self.n * m, m)]
+        return [d[i:i + m] for i in range(0, self.n * m, m)]
+
+    @classmethod
+    def _desde_filas(cls, filas):
+        """Construye una Matriz a partir de 'filas' sin validarlas (uso interno: filas recién
+        calculadas y rectangulares)."""
+        return cls._desde_buffer(_buffer_plano(filas), len(filas), len(filas[0]))
+
+    @classmethod
+    def _desde_buffer(cls, datos, n, m):
+        """Adopta un buffer plano ya construido (array('d') o lista) de n·m entradas."""
+        M = cls.__new__(cls)
+        M._datos = datos
+        M.n = n
+        M.m = m
+        M._variables = None
+        return M
+
+    def vista(self, filas=None, columnas=None):
+        """Vista sin copia de la submatriz filas x columnas (índices o range)."""
+        return VistaMatriz(self.A, filas, columnas)
+
+    def vista_traspuesta(self):
+        """Traspuesta como vista sin copia (trasponer() en cambio devuelve una Matriz nueva)."""
+        return VistaMatriz(self.A, traspuesta=True)
+
+    def coeficientes(self):
+        """Vista sin copia del bloque de coeficientes de la aumentada [A | b]."""
+        return bloque_coeficientes(self.A)
+
+    def perezosa(self):
+        """Expresión perezosa con esta matriz como hoja: (A.perezosa() + B - C).evaluar()."""
+        return ExpresionMatriz.hoja(self)
+
+    """ Si es un numero entero, asi se muestra. Si tiene decimales, se muestra con 4 decimales"""
+    @staticmethod
+    def _format_number(x):
+        # En modo exacto los valores son Fraction: se muestran como p/q
+        if isinstance(x, Fraction) and x.denominator != 1:
+            return str(x)
+        if abs(x - int(x)) < 1e-10:
+            return str(int(x))
+        else:
+            return f"{x:.4f}"
+    # utiliza la funcion de arriba, pero la aplica a toda la matriz
+    def _mat_str(self, mat):
+        return [[self._format_number(x) for x in row] for row in mat]
+    
+    
+
+    """ -------------------- ESTRUCTURA DEL BLOQUE DE COEFICIENTES -------------------- """
+    def estructura(self):
+        """Clasifica el bloque de coeficientes (ver analizar_estructura). No se guarda en caché:
+        A[i][j] = v escribe directamente en el buffer y dejaría una clasificación obsoleta."""
+        if self.m not in (self.n, self.n + 1):
+            return {"tipo": "rectangular", "kl": None, "ku": None, "simetrica": False, "tol": None}
+        # analizar_estructura sólo lee las primeras n columnas: la aumentada sirve sin recortar
+        return analizar_estructura(self._filas())
+
+    def _resolver_por_estructura(self):
+        """Intenta resolver el sistema aumentado con el solver especializado de su estructura.
+        gauss y gauss_jordan siempre muestran pasos, así que sólo se usa desde UMBRAL_ESTRUCTURA:
+        por debajo se mantiene la eliminación paso a paso. Devuelve el dict de resultado o None si
+        corresponde la eliminación densa."""
+        if self.m != self.n + 1 or self.n < UMBRAL_ESTRUCTURA:
+            return None
+        est = self.estructura()
+        if est["tipo"] == "densa":
+            return None
+        X, metodo = _resolver_estructurado([fila[:-1] for fila in self.A], [[fila[-1]] for fila in self.A], est)
+        if X is None:
+            return None
+        solucion = {self.variables[i]: self._format_number(X[i][0]) for i in range(self.n)}
+        pasos = [
+            {"descripcion": f"Estructura detectada: {est['tipo']} → {metodo}", "matriz": self._mat_str(self.A)},
+            {"descripcion": "Solución", "matriz": self._mat_str([fila for fila in X])},
+        ]
+        return {"pasos": pasos, "solucion": solucion, "mensaje": "El sistema tiene solución única.",
+                "metodo": metodo, "estructura": est["tipo"]}
+
+    def _resolver_precision_mixta(self, precision):
+        """Sistema cuadrado denso con resolver_precision_mixta según 'precision' ("doble", "mixta"
+        o "auto": mixta desde UMBRAL_PRECISION_MIXTA). None si corresponde la eliminación normal
+        (precisión doble pedida, sin NumPy o sistema singular)."""
+        if precision == "doble" or self.m != self.n + 1 or np is None:
+            return None
+        if precision == "auto" and self.n < UMBRAL_PRECISION_MIXTA:
+            return None
+        filas = self._filas()
+        res = resolver_precision_mixta(bloque_coeficientes(filas), columna(filas, -1))
+        if res["x"] is None:
+            return None
+        solucion = {self.variables[i]: self._format_number(v) for i, v in enumerate(res["x"])}
+        metodo = ("LU en precisión mixta (float32) + refinamiento iterativo" if res["precision"] == "mixta"
+                  else "LU en float64")
+        pasos = [{"descripcion": res["mensaje"]}]
+        pasos += [{"descripcion": f"Refinamiento {i}: error relativo hacia atrás {r:.3e}"}
+                  for i, r in enumerate(res["residuos"])]
+        return {"pasos": pasos, "solucion": solucion, "mensaje": "El sistema tiene solución única.",
+                "metodo": metodo, "precision": res["precision"], "condicion": res["condicion"]}
+
+    def _resolver_paralelo(self, hilos):
+        """Sistema cuadrado denso con resolver_paralelo si se pidieron hilos y n alcanza
+        UMBRAL_ELIMINACION_PARALELA. None si corresponde la eliminación normal (también si es
+        singular, para que ésta clasifique el sistema)."""
+        if not hilos or self.m != self.n + 1 or self.n < UMBRAL_ELIMINACION_PARALELA or np is None:
+            return None
+        filas = self._filas()
+        A = bloque_coeficientes(filas)
+        x, F = resolver_paralelo(A, columna(filas, -1), hilos)
+        if x is None:
+            return None
+        solucion = {self.variables[i]: self._format_number(v) for i, v in enumerate(x.tolist())}
+        pasos = [{"descripcion": f"LU por bloques de {TAM_PANEL_LU} columnas con la actualización de cada "
+                                 f"panel repartida entre {hilos} hilos; sustitución hacia adelante y hacia atrás."}]
+        return {"pasos": pasos, "solucion": solucion, "mensaje": "El sistema tiene solución única.",
+                "metodo": f"LU paralela por bloques ({hilos} hilos)", "salud": _salud_lu(A, F)}
+
+    """ -------------------- MÉTODO GAUSS-JORDAN -------------------- """
+    def gauss_jordan(self, exacto=False, especializado=True, precision="doble", hilos=None):
+        # Modo exacto: Bareiss libre de fracciones, solución racional exacta
+        if exacto:
+            return self._gauss_jordan_exacto()
+        # Estructuras especiales (triangular, tridiagonal, banda, SPD): solver O(n) / O(n²)
+        if especializado:
+            res = self._resolver_por_estructura()
+            if res is not None:
+                return res
+        # Sistemas grandes: una sola ruta, elegida explícitamente. Precisión mixta (LU en float32 +
+        # refinamiento en float64) si se pide "mixta", o "auto" sin hilos; con hilos, LU paralela
+        if precision == "mixta" or (precision == "auto" and not hilos):
+            res = self._resolver_precision_mixta(precision)
+        else:
+            res = self._resolver_paralelo(hilos)
+        if res is not None:
+            return res
+        A = [row[:] for row in self.A]  # trabajar sobre copia (para hacer distintas operaciones)
+        n, m = self.n, self.m
+        pasos = []
+        pivotes = {}
+        libres = set()
+        fila = 0
+        # Operaciones de fila (para estimar cond₁ sin otra factorización) y crecimiento de pivotes
+        ops = []
+        max_A = max_elim = _max_abs(A, m - 1)
+
+        pasos.append({"descripcion": "Matriz inicial", "matriz": self._mat_str(A)})
+
+        for col in range(m-1):
+            pivot_row = None
+            for r in range(fila, n):
+                if abs(A[r][col]) > 1e-10:
+                    pivot_row = r
+                    break
+            if pivot_row is None:
+                libres.add(col)
+                pasos.append({"descripcion": f"{self.variables[col]}: variable libre (columna {col+1})", "matriz": self._mat_str(A)})
+                continue
+
+            if pivot_row != fila:
+                A[fila], A[pivot_row] = A[pivot_row], A[fila]
+                ops.append(("swap", fila, pivot_row, None))
+                valor_pivote = self._format_number(A[fila][col])
+                pasos.append({"descripcion": f"(*Pivote*, Fila: {fila+1}; Columna: {col+1}; Valor: {valor_pivote})\nF{fila+1} ↔ F{pivot_row+1}", "matriz": self._mat_str(A)})
+
+            pivot = A[fila][col]
+            # Solo agrego pivote en los pasos que ya existen
+            if abs(pivot - 1) > 1e-10:
+                A[fila] = [x/pivot for x in A[fila]]
+                ops.append(("escala", fila, None, pivot))
+                valor_pivote = self._format_number(pivot)
+                pasos.append({"descripcion": f"(*Pivote*, Fila: {fila+1}; Columna: {col+1}; Valor: {valor_pivote})\nF{fila+1} → F{fila+1} / {valor_pivote}", "matriz": self._mat_str(A)})
+
+            for r in range(n):
+                if r != fila and abs(A[r][col]) > 1e-10:
+                    factor = A[r][col]
+                    A[r] = [A[r][k] - factor*A[fila][k] for k in range(m)]
+                    ops.append(("resta", r, fila, factor))
+                    max_elim = max(max_elim, _max_abs((A[r],), m - 1))
+                    valor_pivote = self._format_number(A[fila][col])
+                    pasos.append({"descripcion": f"(*Pivote*, Fila: {fila+1}; Columna: {col+1}; Valor: {valor_pivote})\nF{r+1} → F{r+1} - ({self._format_number(factor)})*F{fila+1}", "matriz": self._mat_str(A)})
+
+            pivotes[col] = fila
+            fila += 1
+            if fila >= n:
+                break
+
+        res = self._solucion_desde_rref(A, pivotes, libres, pasos)
+        res["metodo"] = "eliminación densa (Gauss-Jordan)"
+        if n == m - 1 and len(pivotes) == n and isinstance(res["solucion"], dict):
+            # Sistema cuadrado no singular: las operaciones registradas son A⁻¹
+            filas = self._filas()
+            coef, b = bloque_coeficientes(filas), columna(filas, -1)
+            x = [A[pivotes[i]][-1] for i in range(n)]
+            res["salud"] = informe_salud(
+                coef, lambda v: _aplicar_operaciones(ops, v), lambda v: _aplicar_operaciones_t(ops, v),
+                crecimiento=max_elim / max_A if max_A else None, error_atras=error_hacia_atras(coef, x, b))
+        return res
+
+    def _solucion_desde_rref(self, A, pivotes, libres, pasos):
+        """Construye el dict de resultado de Gauss-Jordan a partir de la forma escalonada reducida."""
+        n, m = self.n, self.m
+
+        # Detectar inconsistencia
+        for r in range(n):
+            if all(abs(A[r][c]) < 1e-10 for c in range(m-1)) and abs(A[r][-1]) > 1e-10:
+                return {"pasos": pasos, "solucion": "Sin solución"}
+
+        # Variables libres
+        for col in range(m-1):
+            if col not in pivotes:
+                libres.add(col)
+
+        # Construir solución
+        solucion = {}
+        if libres:
+            for i in range(m-1):
+                if i in libres:
+                    solucion[self.variables[i]] = "libre"
+                else:
+                    fila = pivotes[i]
+                    expr = self._format_number(A[fila][-1])
+                    for j in sorted(libres):
+                        coef = -A[fila][j]
+                        if abs(coef) > 1e-10:
+                            expr += f" + ({self._format_number(coef)})*{self.variables[j]}"
+                    solucion[self.variables[i]] = expr
+        else:
+            for i in range(m-1):
+                val = A[pivotes[i]][-1]
+                solucion[self.variables[i]] = self._format_number(val)
+
+        # Mensaje sobre el tipo de solución
+        if libres:
+            tipo_sol = "El sistema tiene infinitas soluciones (variables libres presentes)."
+        else:
+            tipo_sol = "El sistema tiene solución única."
+        return {"pasos": pasos, "solucion": solucion, "mensaje": tipo_sol}
+
+    def _gauss_jordan_exacto(self):
+        """Gauss-Jordan exacto: Bareiss reducido sobre enteros y división final por el pivote
+        de cada fila, obteniendo la forma escalonada reducida en Fraction."""
+        A, _ = _filas_a_enteros(self.A)
+        pasos = [{"descripcion": "Matriz inicial (filas escaladas a enteros)", "matriz": self._mat_str(A)}]
+        pivotes, _, _ = _bareiss(A, self.m - 1, reducida=True, pasos=pasos, mat_str=self._mat_str)
+        for col, f in pivotes.items():
+            piv = A[f][col]
+            A[f] = [Fraction(x, piv) for x in A[f]]
+        pasos.append({"descripcion": "Cada fila pivote dividida por su pivote (forma reducida exacta)", "matriz": self._mat_str(A)})
+        libres = {c for c in range(self.m - 1) if c not in pivotes}
+        return self._solucion_desde_rref(A, pivotes, libres, pasos)
+
+    # -------------------- VARIOS LADOS DERECHOS (A X = B) --------------------
+    def resolver_multiple(self, B=None, mostrar_pasos=False, hilos=None):
+        """Resuelve A·X = B para k lados derechos con una sola eliminación.
+
+        - B: n × k (lista de listas o Matriz), siendo la matriz A. Con B=None la matriz se toma
+          como [A | B]: A son sus primeras n columnas y B las k restantes.
+        - Sin pasos y con A cuadrada: solver estructurado si A tiene estructura (ver estructura) o
+          LU por bloques de NumPy (paralela con hilos desde UMBRAL_ELIMINACION_PARALELA).
+        - Con pasos, sin NumPy o con A singular: Gauss-Jordan con pivoteo parcial sobre [A | B];
+          cada columna de B se clasifica después sobre la misma forma reducida.
+
+        Retorna {"pasos", "soluciones": [dict | "Sin solución", ...] (una por columna de B),
+                 "mensajes": [...], "mensaje", "metodo", "valores": X de p × k o None si algún
+                 sistema no tiene solución única, "salud" (sólo en la ruta LU)}
+        """
+        filas = self._filas()
+        if B is None:
+            if self.m <= self.n:
+                raise ValueError("Se requiere una matriz [A | B] de n×(n+k) con k ≥ 1.")
+            p, Aug = self.n, filas
+        else:
+            B = B._filas() if isinstance(B, Matriz) else [list(f) for f in B]
+            if len(B) != self.n or not B[0]:
+                raise ValueError(f"B debe tener {self.n} filas y al menos una columna.")
+            p, Aug = self.m, [fa + fb for fa, fb in zip(filas, B)]
+        if not mostrar_pasos and p == self.n:
+            res = self._resolver_multiple_directo(Aug, p, hilos)
+            if res is not None:
+                return res
+        return self._resolver_multiple_rref(Aug, p, mostrar_pasos)
+
+    def _resultado_multiple(self, X, p, pasos, metodo, salud=None):
+        variables = [f"x{i+1}" for i in range(p)]
+        k = len(X[0]) if X else 0
+        soluciones = [{variables[i]: self._format_number(X[i][j]) for i in range(p)} for j in range(k)]
+        return {"pasos": pasos, "soluciones": soluciones, "mensajes": ["El sistema tiene solución única."] * k,
+                "mensaje": f"Los {k} sistemas tienen solución única (una sola eliminación).",
+                "metodo": metodo, "valores": X, "salud": salud}
+
+    def _resolver_multiple_directo(self, Aug, p, hilos):
+        """Ruta sin pasos para A cuadrada: None si no aplica (sin NumPy o A singular)."""
+        A = [f[:p] for f in Aug]
+        B = [f[p:] for f in Aug]
+        est = analizar_estructura(A)
+        X, metodo = _resolver_estructurado(A, B, est) if est["tipo"] != "densa" else (None, None)
+        if X is not None:
+            return self._resultado_multiple(X, p, [], metodo)
+        if np is None:
+            return None
+        if hilos and p >= UMBRAL_ELIMINACION_PARALELA:
+            X, F = resolver_paralelo(A, B, hilos)
+            metodo = f"LU paralela por bloques ({hilos} hilos)"
+        else:
+            F = _lu_bloques(np.array(A, dtype=float))
+            X = _resolver_lu(F, np.array(B, dtype=float)) if F is not None else None
+            metodo = "LU por bloques"
+        if X is None:
+            return None
+        return self._resultado_multiple(X.tolist(), p, [], metodo, _salud_lu(A, F))
+
+    def _resolver_multiple_rref(self, Aug, p, mostrar_pasos):
+        """Gauss-Jordan con pivoteo parcial en las p primeras columnas de [A | B]."""
+        A = [list(f) for f in Aug]
+        n, m = len(A), len(A[0])
+        pasos = []
+        if mostrar_pasos:
+            pasos.append({"descripcion": "Matriz inicial (A | B)", "matriz": self._mat_str(A)})
+        pivotes = {}
+        fila = 0
+        for col in range(p):
+            if fila >= n:
+                break
+            pivot_row = max(range(fila, n), key=lambda r: abs(A[r][col]))
+            if abs(A[pivot_row][col]) <= 1e-10:
+                continue
+            if pivot_row != fila:
+                A[fila], A[pivot_row] = A[pivot_row], A[fila]
+                if mostrar_pasos:
+                    pasos.append({"descripcion": f"F{fila+1} ↔ F{pivot_row+1}", "matriz": self._mat_str(A)})
+            pivot = A[fila][col]
+            if abs(pivot - 1) > 1e-10:
+                A[fila] = [x / pivot for x in A[fila]]
+                if mostrar_pasos:
+                    pasos.append({"descripcion": f"F{fila+1} → F{fila+1} / {self._format_number(pivot)}", "matriz": self._mat_str(A)})
+            for r in range(n):
+                if r != fila and abs(A[r][col]) > 1e-10:
+                    factor = A[r][col]
+                    A[r] = [A[r][c] - factor * A[fila][c] for c in range(m)]
+                    if mostrar_pasos:
+                        pasos.append({"descripcion": f"F{r+1} → F{r+1} - ({self._format_number(factor)})*F{fila+1}", "matriz": self._mat_str(A)})
+            pivotes[col] = fila
+            fila += 1
+
+        k = m - p
+        if len(pivotes) == p == n:
+            X = [A[pivotes[i]][p:] for i in range(p)]
+            return self._resultado_multiple(X, p, pasos, "Gauss-Jordan sobre [A | B]")
+        # A singular o rectangular: cada columna de B se clasifica sobre la misma forma reducida
+        aux = Matriz([[0.0] * (p + 1) for _ in range(n)])
+        libres = {c for c in range(p) if c not in pivotes}
+        soluciones, mensajes = [], []
+        for j in range(k):
+            res = aux._solucion_desde_rref([f[:p] + [f[p + j]] for f in A], pivotes, set(libres), [])
+            soluciones.append(res["solucion"])
+            mensajes.append(res.get("mensaje", "El sistema es inconsistente (no tiene solución)."))
+        unicos = mensajes.count("El sistema tiene solución única.")
+        return {"pasos": pasos, "soluciones": soluciones, "mensajes": mensajes,
+                "mensaje": f"{unicos} de {k} sistemas con solución única (una sola eliminación).",
+                "metodo": "Gauss-Jordan sobre [A | B]", "valores": None}
+
+    # -------------------- MÉTODO GAUSS --------------------
+    def gauss(self, exacto=False, especializado=True, precision="doble"):
+        if especializado and not exacto:
+            res = self._resolver_por_estructura()
+            if res is not None:
+                return res
+        if not exacto:
+            res = self._resolver_precision_mixta(precision)
+            if res is not None:
+                return res
+        A = [row[:] for row in self.A]  # trabajar sobre copia
+        pasos = []
+        if exacto:
+            # Bareiss hacia adelante sobre enteros; la sustitución trabaja con Fraction
+            A, _ = _filas_a_enteros(A)
+            pasos.append({"descripcion": "Matriz inicial (filas escaladas a enteros)", "matriz": self._mat_str(A)})
+            _bareiss(A, self.m - 1, pasos=pasos, mat_str=self._mat_str)
+            A = [[Fraction(x) for x in fila] for fila in A]
+        else:
+            # (Evitar duplicar "Matriz inicial": lo agrega _forward_elimination)
+            # Reutilizar el forward elimination privado
+            A, pivotes, pasos_elim = self._forward_elimination(A)
+            pasos.extend(pasos_elim)
+
+        sol = self._resolver_sustitucion(A)
+        # Mensaje coherente con Gauss-Jordan
+        if isinstance(sol, str):
+            mensaje = "El sistema es inconsistente (no tiene solución)."
+        else:
+            if any(v == "libre" for v in sol.values()):
+                mensaje = "El sistema tiene infinitas soluciones (variables libres presentes)."
+            else:
+                mensaje = "El sistema tiene solución única."
+        metodo = "eliminación de Bareiss + sustitución" if exacto else "eliminación densa (Gauss)"
+        return {"pasos": pasos, "solucion": sol, "mensaje": mensaje, "metodo": metodo}
+
+    def _forward_elimination(self, A):
+        """Realiza eliminación hacia adelante (como en Gauss), retorna la matriz transformada,
+        el dict de pivotes (col -> fila) y la lista de pasos (mismo formato que gauss/gauss_jordan).
+        """
+        n, m = self.n, self.m
+        pasos = []
+        pivotes = {}
+        fila = 0
+
+        pasos.append({"descripcion": "Matriz inicial", "matriz": self._mat_str(A)})
+
+        for col in range(min(n, m-1)):
+            pivot_row = None
+            for r in range(fila, n):
+                if abs(A[r][col]) > 1e-10:
+                    pivot_row = r
+                    break
+            if pivot_row is None:
+                pasos.append({"descripcion": f"{self.variables[col]}: columna sin pivote (variable libre)", "matriz": self._mat_str(A)})
+                continue
+
+            if pivot_row != fila:
+                A[fila], A[pivot_row] = A[pivot_row], A[fila]
+                pasos.append({"descripcion": f"F{fila+1} ↔ F{pivot_row+1}", "matriz": self._mat_str(A)})
+
+            pivot = A[fila][col]
+            if abs(pivot-1) > 1e-10:
+                A[fila] = [x/pivot for x in A[fila]]
+                pasos.append({"descripcion": f"F{fila+1} → F{fila+1} / {self._format_number(pivot)}", "matriz": self._mat_str(A)})
+
+            for r in range(fila+1, n):
+                if abs(A[r][col]) > 1e-10:
+                    factor = A[r][col]
+                    A[r] = [A[r][k] - factor*A[fila][k] for k in range(m)]
+                    pasos.append({"descripcion": f"F{r+1} → F{r+1} - ({self._format_number(factor)})*F{fila+1}", "matriz": self._mat_str(A)})
+
+            pivotes[col] = fila
+            fila += 1
+            if fila >= n:
+                break
+
+        return A, pivotes, pasos
+
+    # En la independencia tratar de no poner el rango
+    def independencia(self):
+        """Determina si las columnas (coeficientes) son linealmente independientes.
+        Reutiliza _forward_elimination para obtener pivotes y pasos.
+        """
+        A = [row[:] for row in self.A]
+        A_after, pivotes, pasos = self._forward_elimination(A)
+
+        num_cols = self.m - 1
+        rango = len(pivotes)
+        pivot_cols = sorted(pivotes.keys())
+        libres = [c for c in range(num_cols) if c not in pivotes]
+
+        independiente = (rango == num_cols)
+
+        if independiente:
+            mensaje = f"La matriz de coeficientes tiene rango {rango} y {num_cols} columna(s): es linealmente independiente."
+        else:
+            libres_nombres = ", ".join(self.variables[c] for c in libres) if libres else "ninguna"
+            mensaje = (f"La matriz es linealmente dependiente: rango {rango} < {num_cols}. "
+                       f"Columnas sin pivote (libres): {libres_nombres}.")
+
+        solucion = {
+            "independiente": independiente,
+            "rango": rango,
+            "pivotes": [c + 1 for c in pivot_cols],
+            "libres": [c + 1 for c in libres]
+        }
+
+        return {"pasos": pasos, "solucion": solucion, "mensaje": mensaje}
+
+    def independencia_vectores(self, vectores, mostrar_pasos=True, exacto=False):
+        """Comprueba la independencia lineal de una lista de vectores.
+
+        - vectores: lista de listas, cada lista es un vector de misma dimensión (longitud n).
+        - mostrar_pasos: si True se devuelven los pasos de eliminación (en formato consistente con
+          los otros métodos). Si False, la clave "pasos" será una lista vacía.
+        - exacto: si True el rango y las relaciones se obtienen por aritmética multimodular,
+          sin umbrales de tolerancia (coeficientes Fraction).
+
+        Retorna un dict con las mismas claves que `independencia`: {"pasos", "solucion", "mensaje"}.
+        """
+        # Validaciones básicas
+        if vectores is None:
+            raise ValueError("Se requiere una lista de vectores.")
+
+        k = len(vectores)
+        if k == 0:
+            return {"pasos": [] if not mostrar_pasos else [],
+                    "solucion": _solucion_independencia([], {}, [], 0),
+                    "mensaje": "No hay vectores: por convención el conjunto vacío es independiente."}
+
+        n = len(vectores[0])
+        for v in vectores:
+            if len(v) != n:
+                raise ValueError("Todos los vectores deben tener la misma dimensión")
+
+        if exacto:
+            solucion = independencia_modular(vectores)
+            pasos = [{"descripcion": f"Eliminación exacta módulo {PRIMOS_RANGO} primos de palabra: "
+                                     f"rango {solucion['rango']} (primos concordantes)"}]
+            return {"pasos": pasos if mostrar_pasos else [], "solucion": solucion,
+                    "mensaje": _mensaje_independencia(solucion)}
+
+        if not mostrar_pasos and np is not None and n * k >= UMBRAL_VECTORIZADO:
+            solucion = dependencias_vectores(vectores)
+            return {"pasos": [], "solucion": solucion, "mensaje": _mensaje_independencia(solucion)}
+
+        # Construir la matriz cuyo número de columnas = número de vectores
+        A = [[vectores[c][r] for c in range(k)] for r in range(n)]
+
+        pasos = []
+        pivotes = {}
+        libres = set()
+        fila = 0
+
+        pasos.append({"descripcion": "Matriz (vectores como columnas) - matriz inicial", "matriz": self._mat_str(A)})
+
+        for col in range(k):
+            pivot_row = None
+            for r in range(fila, n):
+                if abs(A[r][col]) > 1e-10:
+                    pivot_row = r
+                    break
+            if pivot_row is None:
+                libres.add(col)
+                pasos.append({"descripcion": f"v{col+1}: columna sin pivote (libre)", "matriz": self._mat_str(A)})
+                continue
+
+            if pivot_row != fila:
+                A[fila], A[pivot_row] = A[pivot_row], A[fila]
+                valor_pivote = self._format_number(A[fila][col])
+                pasos.append({"descripcion": f"(*Pivote*, Fila: {fila+1}; Columna: {col+1}; Valor: {valor_pivote})\nF{fila+1} ↔ F{pivot_row+1}", "matriz": self._mat_str(A)})
+
+            pivot = A[fila][col]
+            if abs(pivot - 1) > 1e-10:
+                A[fila] = [x / pivot for x in A[fila]]
+                valor_pivote = self._format_number(pivot)
+                pasos.append({"descripcion": f"(*Pivote*, Fila: {fila+1}; Columna: {col+1}; Valor: {valor_pivote})\nF{fila+1} → F{fila+1} / {valor_pivote}", "matriz": self._mat_str(A)})
+
+            for r in range(n):
+                if r != fila and abs(A[r][col]) > 1e-10:
+                    factor = A[r][col]
+                    A[r] = [A[r][c] - factor * A[fila][c] for c in range(k)]
+                    valor_pivote = self._format_number(A[fila][col])
+                    pasos.append({"descripcion": f"(*Pivote*, Fila: {fila+1}; Columna: {col+1}; Valor: {valor_pivote})\nF{r+1} → F{r+1} - ({self._format_number(factor)})*F{fila+1}", "matriz": self._mat_str(A)})
+
+            pivotes[col] = fila
+            fila += 1
+            if fila >= n:
+                break
+
+        pivot_cols = sorted(pivotes.keys())
+        libres = [c for c in range(k) if c not in pivotes]
+        solucion = _solucion_independencia(A, pivotes, libres, k)
+        return {"pasos": pasos if mostrar_pasos else [], "solucion": solucion,
+                "mensaje": _mensaje_independencia(solucion)}
+
+    # -------------------- MÉTODOS ITERATIVOS --------------------
+    def iterativo(self, metodo="jacobi", tol=1e-10, max_iter=500, omega=1.25, mostrar_pasos=True):
+        """Resuelve el sistema aumentado n x (n+1) con Jacobi, Gauss-Seidel, SOR o gradiente conjugado
+        sobre la representación dispersa por filas (ver resolver_iterativo).
+
+        Retorna {"pasos", "solucion", "mensaje", "residuos", "iteraciones", "metodo", "diverge"};
+        los pasos contienen el residuo relativo de cada iteración. Si la iteración diverge la
+        solución queda vacía.
+        """
+        if self.m != self.n + 1:
+            raise ValueError("Los métodos iterativos requieren una matriz aumentada n×(n+1).")
+        filas = a_filas_dispersas([fila[:-1] for fila in self.A])
+        b = [fila[-1] for fila in self.A]
+        res = resolver_iterativo(filas, b, metodo, tol, max_iter, omega)
+        nombres = {"jacobi": "Jacobi", "gauss-seidel": "Gauss-Seidel", "sor": f"SOR (ω = {omega})", "cg": "Gradiente conjugado"}
+        pasos = []
+        if mostrar_pasos:
+            for k, r in enumerate(res["residuos"]):
+                pasos.append({"descripcion": f"Iteración {k}: ‖b - Ax‖/‖b‖ = {r:.3e}"})
+        # Si diverge, x contiene inf / NaN: no se formatea
+        solucion = {} if res["diverge"] else {self.variables[i]: self._format_number(v) for i, v in enumerate(res["x"])}
+        if res["diverge"]:
+            mensaje = (f"{nombres[metodo]} diverge: el residuo creció a {res['residuos'][-1]:.3e} en "
+                       f"{res['iteraciones']} iteraciones (la matriz no es, p. ej., diagonalmente dominante).")
+        elif res["convergio"]:
+            mensaje = f"{nombres[metodo]} convergió en {res['iteraciones']} iteraciones (tolerancia {tol:g})."
+        else:
+            mensaje = (f"{nombres[metodo]} no convergió en {max_iter} iteraciones "
+                       f"(residuo final {res['residuos'][-1]:.3e}).")
+        return {"pasos": pasos, "solucion": solucion, "mensaje": mensaje, "residuos": res["residuos"],
+                "iteraciones": res["iteraciones"], "metodo": nombres[metodo], "diverge": res["diverge"]}
+
+    def jacobi(self, tol=1e-10, max_iter=500, mostrar_pasos=True):
+        return self.iterativo("jacobi", tol, max_iter, mostrar_pasos=mostrar_pasos)
+
+    def gauss_seidel(self, tol=1e-10, max_iter=500, mostrar_pasos=True):
+        return self.iterativo("gauss-seidel", tol, max_iter, mostrar_pasos=mostrar_pasos)
+
+    def sor(self, omega=1.25, tol=1e-10, max_iter=500, mostrar_pasos=True):
+        return self.iterativo("sor", tol, max_iter, omega, mostrar_pasos)
+
+    def gradiente_conjugado(self, tol=1e-10, max_iter=500, mostrar_pasos=True):
+        return self.iterativo("cg", tol, max_iter, mostrar_pasos=mostrar_pasos)
+
+    # -------------------- MÍNIMOS CUADRADOS --------------------
+    def minimos_cuadrados(self, mostrar_pasos=True, tol=TOL_RANGO_QR):
+        """Resuelve el sistema aumentado n x (m+1) en el sentido de mínimos cuadrados (QR de
+        Householder con pivoteo de columnas). Sirve para sistemas sobredeterminados y de rango
+        deficiente, donde gauss_jordan sólo informa "Sin solución".
+
+        Retorna {"pasos", "solucion", "mensaje", "metodo", "rango", "residuo", "norma_residuo"}.
+        """
+        A = [fila[:-1] for fila in self.A]
+        b = [fila[-1] for fila in self.A]
+        pasos = [{"descripcion": "Matriz aumentada inicial [A | b]", "matriz": self._mat_str(self.A)}] if mostrar_pasos else None
+        res = minimos_cuadrados(A, b, tol, pasos=pasos, mat_str=self._mat_str)
+        num_vars = self.m - 1
+        solucion = {self.variables[i]: self._format_number(v) for i, v in enumerate(res["x"])}
+        if res["rango"] < num_vars:
+            libres = ", ".join(self.variables[res["perm"][j]] for j in range(res["rango"], num_vars))
+            mensaje = (f"Rango deficiente ({res['rango']} < {num_vars}): solución básica de mínimos cuadrados "
+                       f"con {libres} = 0.")
+        elif res["norma_residuo"] > 1e-10:
+            mensaje = "Sistema sin solución exacta: solución de mínimos cuadrados."
+        else:
+            mensaje = "El sistema tiene solución única (residuo nulo)."
+        mensaje += f"\n||b - A·x|| = {res['norma_residuo']:.6g}"
+        if mostrar_pasos:
+            pasos.append({"descripcion": "Sustitución regresiva en R·y = Q^T·b y residuo r = b - A·x",
+                          "matriz": self._mat_str([[ri] for ri in res["residuo"]])})
+        return {"pasos": pasos or [], "solucion": solucion, "mensaje": mensaje, "metodo": "qr_householder",
+                "rango": res["rango"], "residuo": res["residuo"], "norma_residuo": res["norma_residuo"]}
+
+    # -------------------- MÉTODO TRASPUESTA E INVERSA --------------------
+    def trasponer(self):
+        """Devuelve una nueva instancia de Matriz que es la traspuesta de la actual.
+        No modifica la matriz original.
+        """
+        # Construir la traspuesta: filas -> columnas
+        d, m = self._datos, self.m
+        trans = [d[c::m] for c in range(m)]
+        return Matriz._desde_filas(trans)
+
+    # alias en inglés por conveniencia
+    transpose = trasponer
+
+    # La inversa de la matriz debe validar que es cuadrada
+    def inversa(self, mostrar_pasos=True, exacto=False, hilos=None):
+        """Calcula la inversa de la matriz usando Gauss-Jordan sobre [A | I].
+
+        - Validaciones: la matriz debe ser cuadrada (n == m).
+        - Si la matriz es singular devuelve {'pasos': pasos, 'inversa': None, 'mensaje': ...}.
+        - Si tiene inversa devuelve la matriz inversa formateada y los pasos (si mostrar_pasos).
+        - exacto: usa Bareiss sobre enteros y devuelve la inversa racional exacta.
+        - hilos: desde UMBRAL_ELIMINACION_PARALELA, LU paralela (resolver_paralelo) sobre las
+          columnas de I en lugar de la eliminación paso a paso.
+        """
+        # Solo para matrices cuadradas
+        if self.n != self.m:
+            raise ValueError("La inversa sólo está definida para matrices cuadradas (n == m).")
+
+        if self.n <= N_PEQUENA and not mostrar_pasos:
+            A = [[_a_fraccion(x) for x in fila] for fila in self.A] if exacto else self.A
+            inv, det = inversa_pequena(A)
+            if inv is not None:
+                return {"pasos": [], "inversa": self._mat_str(inv), "mensaje": "Inversa calculada correctamente.",
+                        "metodo": "adjunta (fórmula cerrada)", "valores": inv, "determinante": det}
+            if exacto:
+                return {"pasos": [], "inversa": None, "mensaje": "La matriz es singular y no tiene inversa."}
+            # En coma flotante un det(A) despreciable lo decide la eliminación con pivoteo de abajo
+
+        if exacto:
+            return self._inversa_exacta(mostrar_pasos)
+
+        est = self.estructura() if not mostrar_pasos or self.n >= UMBRAL_ESTRUCTURA else None
+        if est is not None and est["tipo"] != "densa":
+            identidad = [[1.0 if i == j else 0.0 for j in range(self.n)] for i in range(self.n)]
+            filas = self._filas()
+            X, metodo = _resolver_estructurado(filas, identidad, est)
+            if X is not None:
+                pasos = [{"descripcion": f"Estructura detectada: {est['tipo']} → {metodo} sobre las columnas de I",
+                          "matriz": self._mat_str(self.A)}]
+                det = _determinante_estructurado(filas, est)
+                return {"pasos": pasos if mostrar_pasos else [], "inversa": self._mat_str(X),
+                        "mensaje": "Inversa calculada correctamente.", "metodo": metodo,
+                        "valores": X, "determinante": det[0] if det else None}
+
+        n = self.n
+        if hilos and n >= UMBRAL_ELIMINACION_PARALELA and np is not None:
+            filas = self._filas()
+            X, F = resolver_paralelo(filas, np.eye(n), hilos)
+            if X is None:
+                return {"pasos": [], "inversa": None, "mensaje": "La matriz es singular y no tiene inversa."}
+            inv = X.tolist()
+            pasos = [{"descripcion": f"LU paralela por bloques ({hilos} hilos) y resolución de las {n} columnas de I "
+                                     f"repartidas entre los hilos."}]
+            return {"pasos": pasos if mostrar_pasos else [], "inversa": self._mat_str(inv),
+                    "mensaje": "Inversa calculada correctamente.", "metodo": f"LU paralela por bloques ({hilos} hilos)",
+                    "valores": inv, "determinante": F["signo"] * float(np.prod(np.diag(F["LU"]))),
+                    "salud": informe_salud(filas, norma_inversa=_norma1(inv))}
+
+        # Construir la matriz aumentada [A | I]
+        A = [row[:] for row in self.A]
+        Aug = [A[i] + [1.0 if i == j else 0.0 for j in range(n)] for i in range(n)]
+
+        pasos = []
+        pasos.append({"descripcion": "Matriz inicial (A | I)", "matriz": self._mat_str(Aug)})
+
+        # El determinante sale gratis: signo de los intercambios por el producto de los pivotes
+        det = 1.0
+        fila = 0
+        max_A = max_elim = _max_abs(Aug, n)
+        tol = TOL_PIVOTE_LU * max_A
+        for col in range(n):
+            pivot_row = None
+            for r in range(fila, n):
+                if abs(Aug[r][col]) > tol:
+                    pivot_row = r
+                    break
+            if pivot_row is None:
+                # No hay pivote en esta columna -> singular
+                return {"pasos": pasos, "inversa": None, "mensaje": "La matriz es singular y no tiene inversa."}
+
+            if pivot_row != fila:
+                Aug[fila], Aug[pivot_row] = Aug[pivot_row], Aug[fila]
+                det = -det
+                pasos.append({"descripcion": f"F{fila+1} ↔ F{pivot_row+1}", "matriz": self._mat_str(Aug)})
+
+            pivot = Aug[fila][col]
+            det *= pivot
+            if abs(pivot - 1) > 1e-10:
+                Aug[fila] = [x / pivot for x in Aug[fila]]
+                pasos.append({"descripcion": f"F{fila+1} → F{fila+1} / {self._format_number(pivot)}", "matriz": self._mat_str(Aug)})
+
+            for r in range(n):
+                if r != fila and abs(Aug[r][col]) > tol:
+                    factor = Aug[r][col]
+                    Aug[r] = [Aug[r][k] - factor * Aug[fila][k] for k in range(2 * n)]
+                    max_elim = max(max_elim, _max_abs((Aug[r],), n))
+                    pasos.append({"descripcion": f"F{r+1} → F{r+1} - ({self._format_number(factor)})*F{fila+1}", "matriz": self._mat_str(Aug)})
+
+            fila += 1
+
+        # Extraer la inversa (la mitad derecha de la matriz aumentada)
+        inv = [row[n:] for row in Aug]
+
+        # ‖A⁻¹‖₁ exacta a partir de la inversa; error hacia atrás de x = A⁻¹·b con b = A·(1, ..., 1)
+        filas = self._filas()
+        b = [sum(fila) for fila in filas]
+        salud = informe_salud(filas, norma_inversa=_norma1(inv), crecimiento=max_elim / max_A,
+                              error_atras=error_hacia_atras(filas, [sum(map(mul, f, b)) for f in inv], b))
+        return {"pasos": pasos if mostrar_pasos else [], "inversa": self._mat_str(inv), "mensaje": "Inversa calculada correctamente.",
+                "metodo": "eliminación densa (Gauss-Jordan sobre [A | I])", "valores": inv, "determinante": det,
+                "salud": salud}
+
+    def _inversa_exacta(self, mostrar_pasos=True):
+        """Inversa exacta: escalar cada fila de [A | I] a enteros (operación elemental válida),
+        Bareiss reducido y división final por el pivote."""
+        n = self.n
+        Aug = [list(fila) + [1 if i == j else 0 for j in range(n)] for i, fila in enumerate(self.A)]
+        Aug, _ = _filas_a_enteros(Aug)
+        pasos = [{"descripcion": "Matriz inicial (A | I) con filas escaladas a enteros", "matriz": self._mat_str(Aug)}] if mostrar_pasos else None
+        pivotes, _, _ = _bareiss(Aug, n, reducida=True, pasos=pasos, mat_str=self._mat_str)
+        if len(pivotes) < n:
+            return {"pasos": pasos or [], "inversa": None, "mensaje": "La matriz es singular y no tiene inversa."}
+        inv = [[Fraction(x, Aug[i][i]) for x in Aug[i][n:]] for i in range(n)]
+        return {"pasos": pasos or [], "inversa": self._mat_str(inv), "mensaje": "Inversa exacta calculada correctamente (Bareiss)."}
+
+    # alias en inglés
+    inverse = inversa
+    
+    
+
+    def _resolver_sustitucion(self, A):
+        eps = 1e-10
+        n_vars = self.m - 1
+        n_rows = self.n
+
+        # 1) Detectar incompatibilidad y pivotes (columna -> fila)
+        pivotes = {}
+        for i in range(n_rows):
+            fila = A[i]
+            if all(abs(c) < eps for c in fila[:n_vars]) and abs(fila[-1]) > eps:
+                return "Sistema incompatible, no tiene solución."
+            # primer no-cero de la fila = pivote
+            for j in range(n_vars):
+                if abs(fila[j]) > eps:
+                    pivotes[j] = i
+                    break
+
+        pivot_cols = sorted(pivotes.keys())
+        free_cols = [j for j in range(n_vars) if j not in pivotes]
+
+        # 2) Expresiones de variables pivote en términos de libres (y constante)
+        #    Representamos una expresión como: {"const": c, <col_libre>: coef, ...}
+        expr = {}  # expr[col_pivote] -> dict
+
+        # Procesar de abajo hacia arriba (filas con pivote descendente)
+        rows_by_desc = sorted(((row, col) for col, row in pivotes.items()), reverse=True)
+        for row, pcol in rows_by_desc:
+            piv = A[row][pcol]
+            # RHS inicial (constante)
+            cte = A[row][-1]
+            terms = {}  # coeficientes para libres
+
+            # Restar contribución de columnas libres
+            for j in free_cols:
+                coef = A[row][j]
+                if abs(coef) > eps:
+                    terms[j] = terms.get(j, 0) - coef
+
+            # Restar contribución de pivotes "inferiores" (columnas de pivote mayores)
+            for qcol, qrow in pivotes.items():
+                if qcol <= pcol:
+                    continue
+                coef = A[row][qcol]
+                if abs(coef) <= eps:
+                    continue
+                # expr[qcol] ya calculada
+                qexpr = expr[qcol]
+                cte -= coef * qexpr.get("const", 0)
+                for lj, lcoef in qexpr.items():
+                    if lj == "const":
+                        continue
+                    terms[lj] = terms.get(lj, 0) - coef * lcoef
+
+            # Dividir todo por el pivote
+            cte /= piv
+            for k in list(terms.keys()):
+                terms[k] /= piv
+
+            e = {"const": cte}
+            e.update({j: terms[j] for j in terms})
+            expr[pcol] = e
+
+        # 3) Formatear solución igual que gauss_jordan
+        def fmt(v):
+            return self._format_number(v)
+
+        solucion = {}
+        for j in range(n_vars):
+            var = self.variables[j]
+            if j in free_cols:
+                solucion[var] = "libre"
+            else:
+                e = expr[j]
+                partes = [fmt(e.get("const", 0))]
+                for lj in sorted([k for k in e.keys() if k != "const"]):
+                    coef = e[lj]
+                    if abs(coef) > eps:
+                        partes.append(f"+ ({fmt(coef)})*{self.variables[lj]}")
+                # Siempre dejamos la constante primero (aunque sea 0) para que coincida con Gauss-Jordan
+                solucion[var] = " ".join(partes) if partes else "0"
+
+        return solucion
+    
+    # Recordar hacer los determinantes de la matriz por Sarrus
+    
+    # Tambien resolver por el metodo de Cramer 
+    
+    def cramer(self, mostrar_pasos=True):
+        """Resuelve el sistema aumentado n x (n+1) por la regla de Cramer.
+
+        Para n <= 4 cada det(A_i) sale de la fórmula cerrada (Sarrus/cofactores), sin eliminación.
+        Retorna {"pasos", "solucion", "mensaje", "metodo"} con el formato de gauss/gauss_jordan.
+        """
+        if self.m != self.n + 1:
+            raise ValueError("Para Cramer se requiere una matriz aumentada n×(n+1).")
+        A = [fila[:-1] for fila in self.A]
+        b = [fila[-1] for fila in self.A]
+        if self.n > N_PEQUENA:
+            res = cramer_con_pasos(A, b, mostrar_pasos)
+            solucion = {self.variables[i]: self._format_number(x) for i, x in enumerate(res["soluciones"])}
+            return {"pasos": res["pasos"], "solucion": solucion, "mensaje": res["mensaje"], "metodo": "cramer (eliminación)"}
+        try:
+            x = cramer_pequeno(A, b)
+        except ValueError as e:
+            return {"pasos": [], "solucion": "Sin solución única", "mensaje": str(e), "metodo": "cramer (fórmula cerrada)"}
+        pasos = []
+        if mostrar_pasos:
+            detA = determinante_pequeno(A)
+            pasos.append({"descripcion": f"det(A) = {self._format_number(detA)}", "matriz": self._mat_str(A)})
+            for j in range(self.n):
+                Aj = [f[:j] + [bi] + f[j + 1:] for f, bi in zip(A, b)]
+                pasos.append({"descripcion": f"{self.variables[j]} = det(A_{j+1}) / det(A) = "
+                                             f"{self._format_number(determinante_pequeno(Aj))} / {self._format_number(detA)}",
+                              "matriz": self._mat_str(Aj)})
+        solucion = {self.variables[i]: self._format_number(v) for i, v in enumerate(x)}
+        return {"pasos": pasos, "solucion": solucion, "mensaje": "El sistema tiene solución única.",
+                "metodo": "cramer (fórmula cerrada)"}
+
+    def sarrus(self, mostrar_pasos=True):
+        """Determinante 3x3 por la regla de Sarrus (acepta también la aumentada 3x4, usando A).
+
+        Retorna {"determinante", "pasos", "mensaje"}; los pasos listan las diagonales.
+        """
+        A = self.A if self.m == self.n else [fila[:-1] for fila in self.A]
+        if len(A) != 3 or len(A[0]) != 3:
+            raise ValueError("La regla de Sarrus sólo se aplica a matrices 3x3.")
+        f = self._format_number
+        positivas = [(0, 1, 2), (1, 2, 0), (2, 0, 1)]
+        pasos = [{"descripcion": "Matriz A", "matriz": self._mat_str(A)}]
+        det = 0
+        for signo, diagonales in ((1, positivas), (-1, [(2, 1, 0), (0, 2, 1), (1, 0, 2)])):
+            for c0, c1, c2 in diagonales:
+                prod = A[0][c0] * A[1][c1] * A[2][c2]
+                det += signo * prod
+                pasos.append({"descripcion": f"{'+' if signo > 0 else '-'} a1{c0+1}·a2{c1+1}·a3{c2+1} = "
+                                             f"{'+' if signo > 0 else '-'}({f(A[0][c0])})·({f(A[1][c1])})·({f(A[2][c2])}) = "
+                                             f"{f(signo * prod)}"})
+        pasos.append({"descripcion": f"det(A) = {f(det)}"})
+        return {"determinante": det, "pasos": pasos if mostrar_pasos else [], "mensaje": "Determinante calculado por Sarrus."}
+
+    # -------------------- OPERADOR DE MATRICES --------------------
+    def _ensure_matrix_like(self, other):
+        if isinstance(other, Matriz):
+            return other
+        if isinstance(other, (list, tuple, _FilasMatriz, VistaMatriz)):
+            return Matriz([list(row) for row in other])
+        raise ValueError("El operando debe ser una Matriz o una lista de listas numéricas.")
+
+    def sumar(self, other):
+        B = self._ensure_matrix_like(other)
+        if self.n != B.n or self.m != B.m:
+            raise ValueError("Dimensiones incompatibles para suma: deben ser iguales.")
+        return Matriz._desde_buffer(_combinar_buffers(self._datos, B._datos, add), self.n, self.m)
+
+    def restar(self, other):
+        B = self._ensure_matrix_like(other)
+        if self.n != B.n or self.m != B.m:
+            raise ValueError("Dimensiones incompatibles para resta: deben ser iguales.")
+        return Matriz._desde_buffer(_combinar_buffers(self._datos, B._datos, sub), self.n, self.m)
+
+    def multiplicar(self, other, procesos=None):
+        """Producto por escalar o matricial. El matricial usa el kernel por bloques
+        (B traspuesta una vez); con procesos > 1 los productos grandes se reparten por filas."""
+        # Escalar
+        if isinstance(other, (int, float, Fraction)):
+            datos = [x * other for x in self._datos]
+            if isinstance(self._datos, array) and not isinstance(other, Fraction):
+                datos = array("d", datos)
+            return Matriz._desde_buffer(datos, self.n, self.m)
+        B = self._ensure_matrix_like(other)
+        if self.m != B.n:
+            raise ValueError(f"Dimensiones incompatibles para multiplicación: {self.n}x{self.m} * {B.n}x{B.m}")
+        C = multiplicar_bloques(self._filas(), B._filas(), procesos=procesos)
+        return Matriz._desde_filas(C)
+
+    # -------------------- OPERACIONES EN SITIO --------------------
+    def _exigir_forma(self, B, n, m, operacion):
+        if B.n != n or B.m != m:
+            raise ValueError(f"Dimensiones incompatibles para {operacion}: se esperaba {n}x{m} y es {B.n}x{B.m}.")
+
+    def sumar_en(self, out, other):
+        """out = self + other escribiendo sobre el buffer de 'out' (puede ser self u other)."""
+        B = self._ensure_matrix_like(other)
+        self._exigir_forma(B, self.n, self.m, "suma")
+        self._exigir_forma(out, self.n, self.m, "suma")
+        out._datos = _operar_en(out._datos, self._datos, B._datos, add)
+        return out
+
+    def restar_en(self, out, other):
+        """out = self - other escribiendo sobre el buffer de 'out' (puede ser self u other)."""
+        B = self._ensure_matrix_like(other)
+        self._exigir_forma(B, self.n, self.m, "resta")
+        self._exigir_forma(out, self.n, self.m, "resta")
+        out._datos = _operar_en(out._datos, self._datos, B._datos, sub)
+        return out
+
+    def multiplicar_en(self, out, other):
+        """out = self @ other escribiendo sobre el buffer de 'out' (que no puede ser self ni other)."""
+        B = self._ensure_matrix_like(other)
+        if self.m != B.n:
+            raise ValueError(f"Dimensiones incompatibles para multiplicación: {self.n}x{self.m} * {B.n}x{B.m}")
+        self._exigir_forma(out, self.n, B.m, "multiplicación")
+        if out._datos is self._datos or out._datos is B._datos:
+            raise ValueError("La salida de multiplicar_en no puede ser uno de los operandos (use @=).")
+        out._datos = _producto_en(out._datos, self._datos, B._datos, self.n, self.m, B.m)
+        return out
+
+    def __iadd__(self, other):
+        return self.sumar_en(self, other)
+
+    def __isub__(self, other):
+        return self.restar_en(self, other)
+
+    def __imatmul__(self, other):
+        B = self._ensure_matrix_like(other)
+        if self.m != B.n:
+            raise ValueError(f"Dimensiones incompatibles para multiplicación: {self.n}x{self.m} * {B.n}x{B.m}")
+        salida = pool_buffers.tomar(self.n * B.m)
+        buf = _producto_en(salida, self._datos, B._datos, self.n, self.m, B.m)
+        if buf is not salida:
+            pool_buffers.devolver(salida)  # operandos en lista plana: el producto vino de multiplicar_bloques
+        if B.m == self.m and isinstance(buf, array) and isinstance(self._datos, array):
+            # Misma forma: se copia sobre el buffer propio (las vistas A existentes siguen válidas)
+            self._datos[:] = buf
+            pool_buffers.devolver(buf)
+        else:
+            self._datos = buf
+            self.m = B.m
+            self._variables = None
+        return self
+
+    # -------------------- POTENCIAS Y POLINOMIOS --------------------
+    def _identidad(self, escala=1.0):
+        n = self.n
+        datos = [escala if i % (n + 1) == 0 else 0 * escala for i in range(n * n)]
+        if not isinstance(escala, Fraction):
+            datos = array("d", map(float, datos))
+        return Matriz._desde_buffer(datos, n, n)
+
+    def _sumar_diagonal(self, c):
+        """self += c·I en sitio."""
+        d = self._datos
+        if isinstance(d, array) and isinstance(c, Fraction):
+            c = float(c)
+        for i in range(0, self.n * self.n, self.n + 1):
+            d[i] += c
+
+    def _producto_en_sitio(self, other):
+        """self = self @ other reutilizando buffers; Strassen a partir de su umbral."""
+        if self.n >= UMBRAL_STRASSEN:
+            R = self @ other
+            self._datos = R._datos
+            return self
+        self @= other
+        return self
+
+    def potencia(self, k, mostrar_pasos=False):
+        """A^k por exponenciación binaria: ⌊log2 |k|⌋ cuadrados más un producto por cada bit 1.
+
+        - k = 0 da la identidad; k < 0 eleva la inversa a |k| (ValueError si A es singular).
+        - Los productos se acumulan en sitio (@=), sin crear una matriz nueva por paso.
+
+        Retorna {"resultado": Matriz, "productos": int, "pasos": [...], "mensaje": str}
+        """
+        if self.n != self.m:
+            raise ValueError("La potencia sólo está definida para matrices cuadradas (n == m).")
+        if isinstance(k, float) and k.is_integer():
+            k = int(k)
+        if not isinstance(k, int):
+            raise ValueError("El exponente debe ser un número entero.")
+
+        pasos = []
+        if k == 0:
+            return {"resultado": self._identidad(), "productos": 0, "pasos": pasos,
+                    "mensaje": "A^0 es la matriz identidad."}
+        if k < 0:
+            inv = self.inversa(mostrar_pasos=False)
+            if inv["inversa"] is None:
+                raise ValueError("La matriz es singular: no existen potencias negativas.")
+            base = Matriz(inv["valores"])
+            nombre = "A^-1"
+            if mostrar_pasos:
+                pasos.append({"descripcion": "Inversa calculada (potencia negativa)", "matriz": base._mat_str(base.A)})
+        else:
+            base = Matriz._desde_buffer(self._datos[:], self.n, self.n)
+            nombre = "A"
+
+        e, exp_base, exp_res = abs(k), 1, 0
+        resultado, productos = None, 0
+        while e:
+            if e & 1:
+                if resultado is None:
+                    resultado = Matriz._desde_buffer(base._datos[:], self.n, self.n)
+                else:
+                    resultado._producto_en_sitio(base)
+                    productos += 1
+                exp_res += exp_base
+                if mostrar_pasos:
+                    pasos.append({"descripcion": f"R = {nombre}^{exp_res}", "matriz": resultado._mat_str(resultado.A)})
+            e >>= 1
+            if e:
+                base._producto_en_sitio(base)
+                productos += 1
+                exp_base *= 2
+                if mostrar_pasos:
+                    pasos.append({"descripcion": f"{nombre}^{exp_base} = ({nombre}^{exp_base // 2})²",
+                                  "matriz": base._mat_str(base.A)})
+        return {"resultado": resultado, "productos": productos, "pasos": pasos,
+                "mensaje": f"A^{k} calculada con {productos} productos (exponenciación binaria)."}
+
+    def polinomio(self, coefs, mostrar_pasos=False):
+        """p(A) = c0·A^d + c1·A^(d-1) + ... + cd·I por el esquema de Horner (d - 1 productos).
+
+        - coefs: coeficientes del de mayor grado al término independiente (como numpy.polyval).
+
+        Retorna {"resultado": Matriz, "productos": int, "pasos": [...], "mensaje": str}
+        """
+        if self.n != self.m:
+            raise ValueError("El polinomio matricial sólo está definido para matrices cuadradas (n == m).")
+        coefs = list(coefs)
+        if not coefs:
+            raise ValueError("Se requiere al menos un coeficiente.")
+
+        pasos = []
+        if len(coefs) == 1:
+            R = self._identidad(coefs[0])
+        else:
+            # Primer paso sin producto: R = c0·A + c1·I
+            R = self.multiplicar(coefs[0])
+            R._sumar_diagonal(coefs[1])
+            if mostrar_pasos:
+                pasos.append({"descripcion": f"R = ({self._format_number(coefs[0])})·A + "
+                                             f"({self._format_number(coefs[1])})·I", "matriz": R._mat_str(R.A)})
+            for c in coefs[2:]:
+                R._producto_en_sitio(self)
+                R._sumar_diagonal(c)
+                if mostrar_pasos:
+                    pasos.append({"descripcion": f"R = R·A + ({self._format_number(c)})·I", "matriz": R._mat_str(R.A)})
+        productos = max(len(coefs) - 2, 0)
+        return {"resultado": R, "productos": productos, "pasos": pasos,
+                "mensaje": f"Polinomio de grado {len(coefs) - 1} evaluado con {productos} productos (Horner)."}
+
+    # Sobrecargas convenientes
+    # Sirve para usar los operadores +, -, @, * directamente
+    
+    def __add__(self, other):
+        return self.sumar(other)
+
+    def __sub__(self, other):
+        return self.restar(other)
+
+    def __matmul__(self, other):
+        # Productos cuadrados grandes: Strassen a partir del umbral calibrado
+        if isinstance(other, Matriz) and self.n == self.m == other.n == other.m and self.n >= UMBRAL_STRASSEN:
+            return Matriz._desde_filas(multiplicar_strassen(self._filas(), other._filas()))
+        return self.multiplicar(other)
+
+    def __mul__(self, other):
+        return self.multiplicar(other)
+
+    def __rmul__(self, other):
+        if isinstance(other, (int, float, Fraction)):
+            return self.multiplicar(other)
+        return NotImplemented
+
+    def to_list(self):
+        return self._filas()
+
+    def __getstate__(self):
+        return (self._datos, self.n, self.m)
+
+    def __setstate__(self, estado):
+        self._datos, self.n, self.m = estado
+        self._variables = None
+
+def determinante_por_gauss(A, exacto=False):
+    """
+    Calcula el determinante de una matriz cuadrada A (lista de listas)
+    mediante reducción a triangular superior por eliminación de Gauss.
+    No modifica A (trabaja sobre una copia). Devuelve un número (float).
+    Con exacto=True usa Bareiss sobre enteros y devuelve un Fraction exacto.
+    """
+    eps = 1e-12
+    if A is None or len(A) == 0:
+        raise ValueError("La matriz no puede estar vacía.")
+    n = len(A)
+    # verificar cuadrada
+    for row in A:
+        if len(row) != n:
+            raise ValueError("La matriz debe ser cuadrada para calcular el determinante.")
+    if n <= N_PEQUENA:
+        if exacto:
+            return Fraction(determinante_pequeno([[_a_fraccion(x) for x in fila] for fila in A]))
+        det = determinante_pequeno(A)
+        return 0.0 if _det_despreciable(A, det, eps) else float(det)
+    if exacto:
+        if n >= UMBRAL_MODULAR:
+            return determinante_modular(A)["determinante"]
+        return _determinante_bareiss(A)
+    especial = _determinante_estructurado(A, analizar_estructura(A))
+    if especial is not None:
+        return especial[0]
+    # trabajar sobre una copia en coma flotante para no alterar la original
+    M = [list(map(float, row[:])) for row in A]
+    eps *= _max_abs(M, n)  # pivote nulo relativo a la mayor entrada
+    det_sign = 1  # guarda el signo que cambia cuando se intercambian filas
+    for i in range(n):
+        # Buscar la fila con el mayor valor absoluto en la columna i (pivote)
+        max_row = max(range(i, n), key=lambda r: abs(M[r][i]))
+        # Si el mejor pivote es (prácticamente) cero, el determinante es 0
+        if abs(M[max_row][i]) <= eps:
+            return 0.0
+        # Si hay intercambio de filas, invertimos el signo del determinante
+        if max_row != i:
+            M[i], M[max_row] = M[max_row], M[i]
+            det_sign *= -1
+        pivot = M[i][i]
+        # Eliminar (poner a cero) los elementos debajo del pivote
+        for r in range(i + 1, n):
+            if abs(M[r][i]) < eps:
+                continue
+            factor = M[r][i] / pivot
+            # Restamos factor * fila_pivote a la fila r (no cambia el determinante)
+            for c in range(i, n):
+                M[r][c] -= factor * M[i][c]
+    # El determinante es el producto de la diagonal por el signo de los swaps
+    det = det_sign
+    for i in range(n):
+        det *= M[i][i]
+    return det
+
+
+def _determinante_bareiss(A, pasos=None, mat_str=None):
+    """Determinante exacto: det(A) = signo · último pivote de Bareiss / producto de escalas."""
+    M, escalas = _filas_a_enteros(A)
+    if pasos is not None:
+        pasos.append({"descripcion": "Matriz inicial (filas escaladas a enteros)", "matriz": mat_str(M)})
+    pivotes, signo, ultimo = _bareiss(M, len(M), pasos=pasos, mat_str=mat_str)
+    if len(pivotes) < len(M):
+        return Fraction(0)
+    escala_total = 1
+    for d in escalas:
+        escala_total *= d
+    return Fraction(signo * ultimo, escala_total)
+
+
+def determinante_por_gauss_con_pasos(A, mostrar_pasos=True, exacto=False):
+    """
+    Calcula el determinante de una matriz cuadrada A usando eliminación de Gauss
+    y devuelve además los pasos del procedimiento.
+
+    Retorna:
+      {
+        "determinante": float,
+        "pasos": [ {"descripcion": str, "matriz": [[str|float]]}, ... ],
+        "mensaje": str
+      }
+
+    No modifica A.
+    """
+    eps = 1e-12
+    if A is None or len(A) == 0:
+        raise ValueError("La matriz no puede estar vacía.")
+    n = len(A)
+    for row in A:
+        if len(row) != n:
+            raise ValueError("La matriz debe ser cuadrada para calcular el determinante.")
+
+    def fmt(x):
+        if isinstance(x, Fraction) and x.denominator != 1:
+            return str(x)
+        # entero sin decimales vs 4 decimales
+        return str(int(round(x))) if abs(x - round(x)) < 1e-10 else f"{x:.4f}"
+
+    def mat_fmt(M_):
+        return [[fmt(x) for x in fila] for fila in M_]
+
+    if n <= N_PEQUENA and not mostrar_pasos:
+        return {"determinante": determinante_por_gauss(A, exacto), "pasos": [],
+                "mensaje": "Determinante calculado por fórmula cerrada.", "metodo": "fórmula cerrada"}
+
+    if exacto and (n >= UMBRAL_MODULAR or not mostrar_pasos):
+        res = determinante_modular(A)
+        pasos = [{"descripcion": f"Eliminación módulo {res['primos']} primos de palabra y reconstrucción por CRT "
+                                 f"(cota de Hadamard): det(A) = {fmt(res['determinante'])}"}]
+        return {"determinante": res["determinante"], "pasos": pasos if mostrar_pasos else [],
+                "mensaje": "Determinante exacto calculado por aritmética multimodular."}
+    if exacto:
+        pasos = [] if mostrar_pasos else None
+        det = _determinante_bareiss(A, pasos, mat_fmt)
+        if mostrar_pasos:
+            pasos.append({"descripcion": f"det(A) = signo × último pivote / producto de escalas = {fmt(det)}"})
+        return {"determinante": det, "pasos": pasos or [], "mensaje": "Determinante exacto calculado por Bareiss (sin fracciones)."}
+
+    # Con pasos y n pequeño se muestra la eliminación de Gauss aunque la matriz tenga estructura
+    est = analizar_estructura(A) if not mostrar_pasos or n >= UMBRAL_ESTRUCTURA else None
+    especial = _determinante_estructurado(A, est) if est is not None else None
+    if especial is not None:
+        det, metodo = especial
+        pasos = []
+        if mostrar_pasos:
+            pasos.append({"descripcion": "Matriz inicial", "matriz": mat_fmt(A)})
+            pasos.append({"descripcion": f"Estructura detectada: {est['tipo']} → det(A) por {metodo} = {fmt(det)}"})
+        return {"determinante": det, "pasos": pasos, "mensaje": f"Determinante calculado por {metodo}.", "metodo": metodo}
+
+    # Copia en float
+    M = [list(map(float, row[:])) for row in A]
+
+    pasos = []
+    if mostrar_pasos:
+        pasos.append({"descripcion": "Matriz inicial", "matriz": mat_fmt(M)})
+
+    det_sign = 1
+    # Multiplicadores de L y permutación, para estimar cond₁(A) sobre la misma factorización
+    L = [[0.0] * n for _ in range(n)]
+    perm = list(range(n))
+    max_A = max_elim = _max_abs(M, n)
+    eps *= max_A  # pivote nulo relativo a la mayor entrada
+    for i in range(n):
+        # escoger pivote por valor absoluto máximo
+        max_row = max(range(i, n), key=lambda r: abs(M[r][i]))
+        if abs(M[max_row][i]) <= eps:
+            # det=0: registrar razón
+            if mostrar_pasos:
+                pasos.append({
+                    "descripcion": f"Columna {i+1}: pivote ≈ 0 ⇒ det(A)=0",
+                    "matriz": mat_fmt(M)
+                })
+            return {"determinante": 0.0, "pasos": pasos if mostrar_pasos else [], "mensaje": "Determinante nulo (pivote cero)."}
+
+        if max_row != i:
+            M[i], M[max_row] = M[max_row], M[i]
+            L[i], L[max_row] = L[max_row], L[i]
+            perm[i], perm[max_row] = perm[max_row], perm[i]
+            det_sign *= -1
+            if mostrar_pasos:
+                pasos.append({
+                    "descripcion": f"F{i+1} ↔ F{max_row+1} (cambia el signo del determinante)",
+                    "matriz": mat_fmt(M)
+                })
+
+        pivot = M[i][i]
+        # eliminación por debajo del pivote
+        for r in range(i + 1, n):
+            if abs(M[r][i]) < eps:
+                continue
+            factor = M[r][i] / pivot
+            L[r][i] = factor
+            for c in range(i, n):
+                M[r][c] -= factor * M[i][c]
+            max_elim = max(max_elim, _max_abs((M[r],), n))
+            if mostrar_pasos:
+                pasos.append({
+                    "descripcion": f"F{r+1} → F{r+1} - (" + fmt(factor) + f")*F{i+1}",
+                    "matriz": mat_fmt(M)
+                })
+
+    det = det_sign
+    for i in range(n):
+        det *= M[i][i]
+
+    mensaje = "Determinante calculado por eliminación de Gauss."
+    if mostrar_pasos:
+        diag_prod = " × ".join(fmt(M[i][i]) for i in range(n))
+        signo = "-1" if det_sign < 0 else "1"
+        pasos.append({
+            "descripcion": f"Producto diagonal × signo = (" + diag_prod + f") × {signo}",
+            "matriz": mat_fmt([[M[i][i] if i==j else 0.0 for j in range(n)] for i in range(n)])
+        })
+
+    LU = [L[i][:i] + M[i][i:] for i in range(n)]
+    salud = informe_salud(A, lambda v: _resolver_lu_filas(LU, perm, v), lambda v: _resolver_lu_filas_t(LU, perm, v),
+                          crecimiento=max_elim / max_A)
+    return {"determinante": det, "pasos": pasos if mostrar_pasos else [], "mensaje": mensaje, "metodo": "eliminación densa (Gauss)",
+            "salud": salud}
+
+def cramer(A, b):
+    """
+    Resuelve el sistema A x = b usando la regla de Cramer.
+    - A: matriz de coeficientes (lista de listas) cuadrada n x n
+    - b: vector de resultados (lista de longitud n)
+    Devuelve la lista [x1, x2, ..., xn].
+    Lanza ValueError si no hay solución única (determinante cero) o si dimensiones no coinciden.
+    """
+    eps = 1e-12
+    if A is None or b is None:
+        raise ValueError("A y b son requeridos.")
+    n = len(A)
+    if n == 0:
+        return []
+    for row in A:
+        if len(row) != n:
+            raise ValueError("La matriz A debe ser cuadrada.")
+    if len(b) != n:
+        raise ValueError("El vector b debe tener la misma dimensión que A.")
+    if n <= N_PEQUENA:
+        return [float(x) for x in cramer_pequeno(A, list(b), eps)]
+    # Determinante de la matriz de coeficientes
+    detA = determinante_por_gauss(A)
+    if _det_despreciable(A, detA, eps):
+        # Si es cero, no hay solución única y la regla de Cramer no aplica
+        raise ValueError("Determinante de A es cero: no existe solución única (regla de Cramer no aplicable).")
+    solucion = []
+    # Para cada variable reemplazamos la columna correspondiente por b y calculamos su determinante
+    for col in range(n):
+        Ai = [row[:] for row in A]  # copia de A
+        for i in range(n):
+            Ai[i][col] = b[i]  # sustituir la columna col por b
+        detAi = determinante_por_gauss(Ai)
+        solucion.append(detAi / detA)  # xi = det(Ai) / det(A)
+    return solucion
+
+
+def cramer_con_pasos(A, b, mostrar_pasos=True):
+    """
+    Igual que cramer(A, b), pero devuelve además los pasos intermedios usando
+    determinante_por_gauss_con_pasos.
+
+    Retorna un dict:
+      {
+        "soluciones": [x1, x2, ...],
+        "pasos": [{"descripcion": str, "matriz": [[str]]?}, ...],
+        "detA": float,
+        "mensaje": str
+      }
+    """
+    eps = 1e-12
+    if A is None or b is None:
+        raise ValueError("A y b son requeridos.")
+    n = len(A)
+    if n == 0:
+        return {"soluciones": [], "pasos": [], "detA": 1.0, "mensaje": "Sistema vacío."}
+    for row in A:
+        if len(row) != n:
+            raise ValueError("La matriz A debe ser cuadrada.")
+    if len(b) != n:
+        raise ValueError("El vector b debe tener la misma dimensión que A.")
+
+    pasos = []
+    # Paso inicial: mostrar A y b
+    def fmt(x):
+        return str(int(round(x))) if abs(x - round(x)) < 1e-10 else f"{x:.4f}"
+    def mat_fmt(M):
+        return [[fmt(x) for x in fila] for fila in M]
+
+    if not mostrar_pasos and n <= N_PEQUENA:
+        return {"soluciones": cramer(A, b), "pasos": [], "detA": determinante_por_gauss(A),
+                "mensaje": "Solución por Cramer calculada correctamente."}
+
+    if mostrar_pasos:
+        pasos.append({"descripcion": "Matriz A (coeficientes)", "matriz": mat_fmt(A)})
+        pasos.append({"descripcion": "Vector b", "matriz": mat_fmt([[bi] for bi in b])})
+
+    # det(A) con pasos
+    detA_res = determinante_por_gauss_con_pasos(A, mostrar_pasos)
+    detA = detA_res.get("determinante", 0.0)
+    if mostrar_pasos:
+        pasos.append({"descripcion": f"Cálculo de det(A) = {fmt(detA)}"})
+        pasos.extend(detA_res.get("pasos", []))
+
+    if _det_despreciable(A, detA, eps):
+        # mantener el contrato de la función original: no solución única
+        raise ValueError("Determinante de A es cero: no existe solución única (regla de Cramer no aplicable).")
+
+    soluciones = []
+    for col in range(n):
+        Ai = [row[:] for row in A]
+        for i in range(n):
+            Ai[i][col] = b[i]
+        if mostrar_pasos:
+            pasos.append({"descripcion": f"Matriz A_{col+1} (columna {col+1} reemplazada por b)", "matriz": mat_fmt(Ai)})
+        detAi_res = determinante_por_gauss_con_pasos(Ai, mostrar_pasos)
+        detAi = detAi_res.get("determinante", 0.0)
+        if mostrar_pasos:
+            pasos.append({"descripcion": f"Cálculo de det(A_{col+1}) = {fmt(detAi)}"})
+            pasos.extend(detAi_res.get("pasos", []))
+            pasos.append({"descripcion": f"x{col+1} = det(A_{col+1}) / det(A) = {fmt(detAi)} / {fmt(detA)} = {fmt(detAi/detA)}"})
+        soluciones.append(detAi / detA)
+
+    return {
+        "soluciones": soluciones,
+        "pasos": pasos if mostrar_pasos else [],
+        "detA": detA,
+        "mensaje": "Solución por Cramer calculada correctamente."
+    }
+
+
+# -------------------- CADENA DE PRODUCTOS --------------------
+def plan_cadena(dims):
+    """
+    Planifica el orden óptimo de M1 @ M2 @ ... @ Mk por programación dinámica (matrix-chain).
+    - dims: [p0, p1, ..., pk], donde Mi tiene dimensiones p(i-1) x p(i).
+
+    Retorna:
+      {
+        "orden": "((M1 M2) M3)",
+        "flops": multiplicaciones escalares del orden óptimo,
+        "flops_secuencial": multiplicaciones escalares de izquierda a derecha,
+        "productos": [{"izq": "M1", "der": "M2", "res": "R1"}, ...]  (en orden de ejecución)
+      }
+    """
+    k = len(dims) - 1
+    if k < 1:
+        raise ValueError("Se requiere al menos una matriz en la cadena.")
+    # costo[i][j]: mínimo de multiplicaciones para Mi..Mj (índices 0-based)
+    costo = [[0] * k for _ in range(k)]
+    corte = [[0] * k for _ in range(k)]
+    for largo in range(2, k + 1):
+        for i in range(k - largo + 1):
+            j = i + largo - 1
+            mejor = None
+            for s in range(i, j):
+                c = costo[i][s] + costo[s+1][j] + dims[i] * dims[s+1] * dims[j+1]
+                if mejor is None or c < mejor:
+                    mejor = c
+                    corte[i][j] = s
+            costo[i][j] = mejor
+
+    productos = []
+
+    def recorrer(i, j):
+        # Devuelve (etiqueta del operando, texto del paréntesis)
+        if i == j:
+            return f"M{i+1}", f"M{i+1}"
+        s = corte[i][j]
+        izq, txt_izq = recorrer(i, s)
+        der, txt_der = recorrer(s + 1, j)
+        res = f"R{len(productos) + 1}"
+        productos.append({"izq": izq, "der": der, "res": res})
+        return res, f"({txt_izq} {txt_der})"
+
+    _, orden = recorrer(0, k - 1)
+    secuencial = sum(dims[0] * dims[i] * dims[i+1] for i in range(1, k))
+    return {"orden": orden, "flops": costo[0][k-1], "flops_secuencial": secuencial, "productos": productos}
+
+
+def multiplicar_cadena(lista, mostrar_pasos=True):
+    """
+    Multiplica M1 @ M2 @ ... @ Mk siguiendo el orden óptimo de plan_cadena.
+    - lista: Matriz o listas de listas, con dimensiones internas compatibles.
+
+    Retorna {"resultado": Matriz, "orden": str, "flops": int, "flops_secuencial": int,
+             "pasos": [...], "mensaje": str}
+    """
+    if not lista:
+        raise ValueError("Se requiere al menos una matriz en la cadena.")
+    mats = [m if isinstance(m, Matriz) else Matriz(m) for m in lista]
+    for idx in range(len(mats) - 1):
+        if mats[idx].m != mats[idx+1].n:
+            raise ValueError(f"Dimensiones incompatibles para multiplicación: M{idx+1} es {mats[idx].n}x{mats[idx].m} "
+                             f"y M{idx+2} es {mats[idx+1].n}x{mats[idx+1].m}")
+    dims = [mats[0].n] + [M.m for M in mats]
+    plan = plan_cadena(dims)
+
+    operandos = {f"M{i+1}": M for i, M in enumerate(mats)}
+    pasos = []
+    if mostrar_pasos:
+        pasos.append({"descripcion": f"Orden planificado: {plan['orden']} — {plan['flops']} multiplicaciones escalares "
+                                     f"(izquierda a derecha: {plan['flops_secuencial']})"})
+    for prod in plan["productos"]:
+        X, Y = operandos[prod["izq"]], operandos[prod["der"]]
+        R = X.multiplicar(Y)
+        operandos[prod["res"]] = R
+        if mostrar_pasos:
+            pasos.append({"descripcion": f"{prod['res']} = {prod['izq']} @ {prod['der']} "
+                                         f"({X.n}x{X.m} · {Y.n}x{Y.m}, {X.n * X.m * Y.m} mult.)",
+                          "matriz": R._mat_str(R.A)})
+    resultado = operandos[plan["productos"][-1]["res"]] if plan["productos"] else mats[0]
+    return {
+        "resultado": resultado,
+        "orden": plan["orden"],
+        "flops": plan["flops"],
+        "flops_secuencial": plan["flops_secuencial"],
+        "pasos": pasos,
+        "mensaje": "Producto en cadena calculado con el orden óptimo."
+    }
+
+
+# -------------------- EXPRESIONES PEREZOSAS --------------------
+def _producto_listas(A, B):
+    """A @ B sobre listas: Strassen para cuadradas grandes, kernel por bloques en otro caso."""
+    if len(A) == len(A[0]) == len(B) == len(B[0]) >= UMBRAL_STRASSEN:
+        return multiplicar_strassen(A, B)
+    return multiplicar_bloques(A, B)
+
+
+def _cadena_listas(mats):
+    """Producto M1 @ ... @ Mk (listas de listas) con el paréntesis óptimo de plan_cadena."""
+    if len(mats) == 1:
+        return mats[0]
+    plan = plan_cadena([len(mats[0])] + [len(M[0]) for M in mats])
+    operandos = {f"M{i+1}": M for i, M in enumerate(mats)}
+    for prod in plan["productos"]:
+        operandos[prod["res"]] = _producto_listas(operandos[prod["izq"]], operandos[prod["der"]])
+    return operandos[plan["productos"][-1]["res"]]
+
+
+def _combinacion_lineal(coefs):
+    """Función (x_1, ..., x_k) -> Σ c_t·x_t, desenrollada para los casos frecuentes (k <= 3)."""
+    if len(coefs) == 1:
+        (c0,) = coefs
+        return lambda a: c0 * a
+    if len(coefs) == 2:
+        c0, c1 = coefs
+        return lambda a, b: c0 * a + c1 * b
+    if len(coefs) == 3:
+        c0, c1, c2 = coefs
+        return lambda a, b, c: c0 * a + c1 * b + c2 * c
+    return lambda *valores: sum(map(mul, coefs, valores))
+
+
+class ExpresionMatriz:
+    """Grafo de operaciones sobre matrices que se evalúa recién con evaluar().
+
+    Se obtiene con Matriz.perezosa() y admite +, -, * (escalar), @ y negación. La expresión se
+    guarda como combinación lineal Σ coef·(F1 @ F2 @ ...) de productos: los escalares se pliegan en
+    los coeficientes, cada cadena de productos se evalúa con el orden óptimo de plan_cadena y todos
+    los términos se suman en una sola pasada que asigna únicamente la matriz resultado.
+    """
+
+    def __init__(self, terminos, n, m):
+        self.terminos = terminos  # [(coef, [factor, ...])]; factor = Matriz (hoja) o ExpresionMatriz
+        self.n = n
+        self.m = m
+
+    @classmethod
+    def hoja(cls, M):
+        return cls([(1, [M])], M.n, M.m)
+
+    @staticmethod
+    def _operando(other):
+        if isinstance(other, ExpresionMatriz):
+            return other
+        if isinstance(other, Matriz):
+            return ExpresionMatriz.hoja(other)
+        if isinstance(other, (list, tuple, _FilasMatriz, VistaMatriz)):
+            return ExpresionMatriz.hoja(Matriz([list(row) for row in other]))
+        raise ValueError("El operando debe ser una Matriz, una expresión o una lista de listas numéricas.")
+
+    def _combinar(self, other, signo, operacion):
+        B = self._operando(other)
+        if self.n != B.n or self.m != B.m:
+            raise ValueError(f"Dimensiones incompatibles para {operacion}: deben ser iguales.")
+        return ExpresionMatriz(self.terminos + [(signo * c, f) for c, f in B.terminos], self.n, self.m)
+
+    def __add__(self, other):
+        return self._combinar(other, 1, "suma")
+
+    def __radd__(self, other):
+        return self._operando(other)._combinar(self, 1, "suma")
+
+    def __sub__(self, other):
+        return self._combinar(other, -1, "resta")
+
+    def __rsub__(self, other):
+        return self._operando(other)._combinar(self, -1, "resta")
+
+    def __neg__(self):
+        return self * -1
+
+    def __mul__(self, other):
+        if isinstance(other, (int, float)):
+            return ExpresionMatriz([(c * other, f) for c, f in self.terminos], self.n, self.m)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def _como_factor(self):
+        # Un único término se concatena a la cadena; una suma queda como subexpresión
+        if len(self.terminos) == 1:
+            return self.terminos[0]
+        return 1, [self]
+
+    def __matmul__(self, other):
+        B = self._operando(other)
+        if self.m != B.n:
+            raise ValueError(f"Dimensiones incompatibles para multiplicación: {self.n}x{self.m} * {B.n}x{B.m}")
+        (c1, f1), (c2, f2) = self._como_factor(), B._como_factor()
+        return ExpresionMatriz([(c1 * c2, f1 + f2)], self.n, B.m)
+
+    def __rmatmul__(self, other):
+        return self._operando(other) @ self
+
+    def _evaluar_plano(self):
+        """Evalúa el grafo y devuelve el buffer plano (fila por fila) del resultado.
+
+        Fusión: una sola pasada por índice de elemento combina el buffer de cada término con su
+        coeficiente y escribe directamente el buffer del resultado, sin buffers intermedios.
+        """
+        coefs = []
+        datos = []
+        hojas = {}  # id del buffer de una hoja -> posición: A + B - A suma coeficientes, no buffers
+        for coef, factores in self.terminos:
+            if coef == 0:
+                continue
+            if len(factores) == 1 and isinstance(factores[0], Matriz):
+                buf = factores[0]._datos
+                if id(buf) in hojas:
+                    coefs[hojas[id(buf)]] += coef
+                    continue
+                hojas[id(buf)] = len(datos)
+            else:
+                mats = [f._filas() if isinstance(f, Matriz) else f._evaluar().to_list() for f in factores]
+                buf = _buffer_plano(_cadena_listas(mats))
+            coefs.append(coef)
+            datos.append(buf)
+        datos = [d for c, d in zip(coefs, datos) if c != 0]
+        coefs = [c for c in coefs if c != 0]
+        if not datos:
+            return array("d", bytes(8 * self.n * self.m))
+        if len(datos) == 1 and coefs[0] == 1:
+            return datos[0][:]  # una sola hoja: copia de su buffer
+        # array('d') si todo es float; con Fraction o enteros enormes, lista para no perder exactitud
+        combinar = _combinacion_lineal(coefs)
+        if all(isinstance(d, array) for d in datos) and all(type(c) in (int, float) for c in coefs):
+            return array("d", map(combinar, *datos))
+        return list(map(combinar, *datos))
+
+    def _evaluar(self):
+        return Matriz._desde_buffer(self._evaluar_plano(), self.n, self.m)
+
+    def evaluar(self):
+        """Evalúa el grafo y devuelve una Matriz nueva (la única asignación del resultado)."""
+        return self._evaluar()
+
+
+# -------------------- OPERACIONES EN LOTE --------------------
+def _inversa_numerica(A, tol_rel=TOL_PIVOTE_LU):
+    """Inversa en coma flotante por Gauss-Jordan con pivoteo parcial. Devuelve None si algún
+    pivote es <= tol_rel·max|a_ij| (singular o numéricamente singular, sin depender de la escala)."""
+    n = len(A)
+    Aug = [[float(x) for x in fila] + [1.0 if i == j else 0.0 for j in range(n)] for i, fila in enumerate(A)]
+    eps = tol_rel * _max_abs(Aug, n)
+    for col in range(n):
+        pr = max(range(col, n), key=lambda r: abs(Aug[r][col]))
+        if abs(Aug[pr][col]) <= eps:
+            return None
+        Aug[col], Aug[pr] = Aug[pr], Aug[col]
+        piv = Aug[col][col]
+        fila_p = [x / piv for x in Aug[col]]
+        Aug[col] = fila_p
+        for r in range(n):
+            if r != col and Aug[r][col] != 0.0:
+                f = Aug[r][col]
+                Aug[r] = [a - f * b for a, b in zip(Aug[r], fila_p)]
+    return [fila[n:] for fila in Aug]
+
+
+def _resolver_numerico(A, b, tol_rel=TOL_PIVOTE_LU):
+    """Resuelve A x = b (A cuadrada) por eliminación con pivoteo parcial. Devuelve None si algún
+    pivote es <= tol_rel·max|a_ij|."""
+    n = len(A)
+    M = [[float(x) for x in fila] + [float(bi)] for fila, bi in zip(A, b)]
+    eps = tol_rel * _max_abs(M, n)
+    for col in range(n):
+        pr = max(range(col, n), key=lambda r: abs(M[r][col]))
+        if abs(M[pr][col]) <= eps:
+            return None
+        M[col], M[pr] = M[pr], M[col]
+        fila_p = M[col]
+        piv = fila_p[col]
+        for r in range(col + 1, n):
+            if M[r][col] != 0.0:
+                f = M[r][col] / piv
+                M[r] = [a - f * c for a, c in zip(M[r], fila_p)]
+    x = [0.0] * n
+    for i in range(n - 1, -1, -1):
+        s = M[i][n] - sum(M[i][j] * x[j] for j in range(i + 1, n))
+        x[i] = s / M[i][i]
+    return x
+
+
+def _gauss_jordan_lote(A, B, tol_rel=TOL_PIVOTE_LU):
+    """Gauss-Jordan con pivoteo parcial sobre el lote [A_i | B_i] (A de k × n × n, B de k × n × r),
+    vectorizado sobre el lote: cada columna se elimina en las k matrices con una sola operación.
+
+    La singularidad sale de la misma eliminación (sin un determinante aparte): A_i es singular si
+    algún pivote es <= tol_rel·max|A_i|. Su pivote se reemplaza por 1 para que no contamine el
+    resto del lote. Retorna (X de k × n × r, regulares: máscara booleana de k).
+    """
+    k, n, _ = A.shape
+    M = np.concatenate([A, B], axis=2).astype(float)
+    tol = tol_rel * np.abs(A).max(axis=(1, 2))
+    regulares = np.ones(k, dtype=bool)
+    lote = np.arange(k)
+    for col in range(n):
+        p = col + np.argmax(np.abs(M[:, col:, col]), axis=1)
+        fila_p = M[lote, p].copy()
+        M[lote, p] = M[:, col]
+        M[:, col] = fila_p
+        piv = M[:, col, col].copy()
+        nulo = np.abs(piv) <= tol
+        regulares &= ~nulo
+        piv[nulo] = 1.0
+        M[:, col] /= piv[:, None]
+        factores = M[:, :, col].copy()
+        factores[:, col] = 0.0
+        M -= factores[:, :, None] * M[:, col][:, None, :]
+    return M[:, :, n:], regulares
 
-            if pivot_row != fila:
-                A[fila], A[pivot_row] = A[pivot_row], A[fila]
-                pasos.append({"descripcion": f"F{fila+1} ↔ F{pivot_row+1}", "matriz": self._mat_str(A)})
 
-            pivot = A[fila][col]
-            if abs(pivot-1) > 1e-10:
-                A[fila] = [x/pivot for x in A[fila]]
-                pasos.append({"descripcion": f"F{fila+1} → F{fila+1} / {self._format_number(pivot)}", "matriz": self._mat_str(A)})
+class LoteMatrices:
+    """Conjunto de k matrices n x m (p. ej. un conjunto de 'conjuntos_matrices') tratado como
+    un único arreglo (k, n, m).
 
-            for r in range(fila+1, n):
-                if abs(A[r][col]) > 1e-10:
-                    factor = A[r][col]
-                    A[r] = [A[r][k] - factor*A[fila][k] for k in range(m)]
-                    pasos.append({"descripcion": f"F{r+1} → F{r+1} - ({self._format_number(factor)})*F{fila+1}", "matriz": self._mat_str(A)})
+    Con NumPy cada operación es una sola llamada vectorizada sobre el lote; sin NumPy se recorre
+    el lote en Python puro acumulando sobre un único buffer.
+    """
 
-            pivotes[col] = fila
-            fila += 1
-            if fila >= n:
-                break
+    def __init__(self, datos):
+        if not datos:
+            raise ValueError("El conjunto de matrices no puede estar vacío.")
+        primera = Matriz(datos[0])
+        self.k, self.n, self.m = len(datos), primera.n, primera.m
+        for M in datos:
+            if len(M) != self.n or any(len(fila) != self.m for fila in M):
+                raise ValueError("Todas las matrices del conjunto deben tener las mismas dimensiones.")
+        if np is not None:
+            self.arr = np.asarray(datos, dtype=float)
+        else:
+            self.arr = None
+            self.datos = [[[float(x) for x in fila] for fila in M] for M in datos]
 
-        return A, pivotes, pasos
+    def _lista(self):
+        return self.arr.tolist() if self.arr is not None else self.datos
 
-    # En la independencia tratar de no poner el rango
-    def independencia(self):
-        """Determina si las columnas (coeficientes) son linealmente independientes.
-        Reutiliza _forward_elimination para obtener pivotes y pasos.
-        """
-        A = [row[:] for row in self.A]
-        A_after, pivotes, pasos = self._forward_elimination(A)
+    # --- Reducciones ---
+    def suma(self):
+        """M1 + M2 + ... + Mk"""
+        if self.arr is not None:
+            return Matriz(self.arr.sum(axis=0).tolist())
+        acc = [fila[:] for fila in self.datos[0]]
+        for M in self.datos[1:]:
+            for i, fila in enumerate(M):
+                fa = acc[i]
+                for j, x in enumerate(fila):
+                    fa[j] += x
+        return Matriz(acc)
 
-        num_cols = self.m - 1
-        rango = len(pivotes)
-        pivot_cols = sorted(pivotes.keys())
-        libres = [c for c in range(num_cols) if c not in pivotes]
+    def resta(self):
+        """M1 - M2 - ... - Mk"""
+        if self.arr is not None:
+            return Matriz((self.arr[0] - self.arr[1:].sum(axis=0)).tolist())
+        acc = [fila[:] for fila in self.datos[0]]
+        for M in self.datos[1:]:
+            for i, fila in enumerate(M):
+                fa = acc[i]
+                for j, x in enumerate(fila):
+                    fa[j] -= x
+        return Matriz(acc)
 
-        independiente = (rango == num_cols)
+    def producto(self):
+        """M1 @ M2 @ ... @ Mk (requiere matrices cuadradas si k > 1)."""
+        if self.k > 1 and self.n != self.m:
+            raise ValueError(f"Dimensiones incompatibles para multiplicación: {self.n}x{self.m} * {self.n}x{self.m}")
+        if self.k == 1:
+            return Matriz(self._lista()[0])
+        if self.arr is not None:
+            return Matriz(np.linalg.multi_dot(list(self.arr)).tolist())
+        # Cadena de cuadradas: todos los órdenes cuestan lo mismo, se acumula en sitio
+        acc = Matriz(self.datos[0])
+        for M in self.datos[1:]:
+            acc @= Matriz._desde_filas(M)
+        return acc
 
-        if independiente:
-            mensaje = f"La matriz de coeficientes tiene rango {rango} y {num_cols} columna(s): es linealmente independiente."
-        else:
-            libres_nombres = ", ".join(self.variables[c] for c in libres) if libres else "ninguna"
-            mensaje = (f"La matriz es linealmente dependiente: rango {rango} < {num_cols}. "
-                       f"Columnas sin pivote (libres): {libres_nombres}.")
+    # --- Operaciones por matriz (en un solo paso sobre el lote) ---
+    def _exigir_cuadradas(self, m):
+        if self.n != m:
+            raise ValueError("La operación requiere matrices cuadradas (o aumentadas n×(n+1) para resolver).")
 
-        solucion = {
-            "independiente": independiente,
-            "rango": rango,
-            "pivotes": [c + 1 for c in pivot_cols],
-            "libres": [c + 1 for c in libres]
-        }
+    def determinantes(self):
+        """Lista con det(Mi) para cada matriz del lote."""
+        self._exigir_cuadradas(self.m)
+        if self.arr is not None:
+            return np.linalg.det(self.arr).tolist()
+        return [determinante_por_gauss(M) for M in self.datos]
 
-        return {"pasos": pasos, "solucion": solucion, "mensaje": mensaje}
+    def inversas(self, tol_rel=TOL_PIVOTE_LU):
+        """Lista con la inversa (lista de listas) de cada matriz, o None si es (numéricamente)
+        singular: algún pivote <= tol_rel·max|a_ij| de esa matriz."""
+        self._exigir_cuadradas(self.m)
+        if self.arr is None:
+            return [_inversa_numerica(M, tol_rel) for M in self.datos]
+        identidad = np.broadcast_to(np.eye(self.n), self.arr.shape)
+        X, regulares = _gauss_jordan_lote(self.arr, identidad, tol_rel)
+        return [x.tolist() if ok else None for x, ok in zip(X, regulares)]
 
-    def independencia_vectores(self, vectores, mostrar_pasos=True):
-        """Comprueba la independencia lineal de una lista de vectores.
+    def resolver(self, tol_rel=TOL_PIVOTE_LU):
+        """Resuelve cada matriz aumentada [A | b] (n×(n+1)); None si A es (numéricamente) singular."""
+        self._exigir_cuadradas(self.m - 1)
+        if self.arr is None:
+            return [_resolver_numerico([f[:-1] for f in M], [f[-1] for f in M], tol_rel) for M in self.datos]
+        X, regulares = _gauss_jordan_lote(self.arr[:, :, :-1], self.arr[:, :, -1:], tol_rel)
+        return [x[:, 0].tolist() if ok else None for x, ok in zip(X, regulares)]
 
-        - vectores: lista de listas, cada lista es un vector de misma dimensión (longitud n).
-        - mostrar_pasos: si True se devuelven los pasos de eliminación (en formato consistente con
-          los otros métodos). Si False, la clave "pasos" será una lista vacía.
 
-        Retorna un dict con las mismas claves que `independencia`: {"pasos", "solucion", "mensaje"}.
-        """
-        # Validaciones básicas
-        if vectores is None:
-            raise ValueError("Se requiere una lista de vectores.")
+# -------------------- MÉTODOS ITERATIVOS --------------------
+METODOS_ITERATIVOS = ("jacobi", "gauss-seidel", "sor", "cg")
+FACTOR_DIVERGENCIA = 1e8  # residuo > FACTOR_DIVERGENCIA · residuo inicial ⇒ la iteración diverge
 
-        k = len(vectores)
-        if k == 0:
-            return {"pasos": [] if not mostrar_pasos else [],
-                    "solucion": {"independiente": True, "rango": 0, "pivotes": [], "libres": []},
-                    "mensaje": "No hay vectores: por convención el conjunto vacío es independiente."}
 
-        n = len(vectores[0])
-        for v in vectores:
-            if len(v) != n:
-                raise ValueError("Todos los vectores deben tener la misma dimensión")
+def _diverge(residuos, tol):
+    return not isfinite(residuos[-1]) or residuos[-1] > FACTOR_DIVERGENCIA * max(residuos[0], tol)
 
-        # Construir la matriz cuyo número de columnas = número de vectores
-        A = [[vectores[c][r] for c in range(k)] for r in range(n)]
 
-        pasos = []
-        pivotes = {}
-        libres = set()
-        fila = 0
+def a_filas_dispersas(A, tol=0.0):
+    """Representación dispersa por filas: para cada fila, la lista de (columna, valor) no nulos."""
+    return [[(j, float(x)) for j, x in enumerate(fila) if abs(x) > tol] for fila in A]
 
-        pasos.append({"descripcion": "Matriz (vectores como columnas) - matriz inicial", "matriz": self._mat_str(A)})
 
-        for col in range(k):
-            pivot_row = None
-            for r in range(fila, n):
-                if abs(A[r][col]) > 1e-10:
-                    pivot_row = r
-                    break
-            if pivot_row is None:
-                libres.add(col)
-                pasos.append({"descripcion": f"v{col+1}: columna sin pivote (libre)", "matriz": self._mat_str(A)})
-                continue
+def _producto_filas(filas, x):
+    return [sum(v * x[j] for j, v in fila) for fila in filas]
 
-            if pivot_row != fila:
-                A[fila], A[pivot_row] = A[pivot_row], A[fila]
-                valor_pivote = self._format_number(A[fila][col])
-                pasos.append({"descripcion": f"(*Pivote*, Fila: {fila+1}; Columna: {col+1}; Valor: {valor_pivote})\nF{fila+1} ↔ F{pivot_row+1}", "matriz": self._mat_str(A)})
 
-            pivot = A[fila][col]
-            if abs(pivot - 1) > 1e-10:
-                A[fila] = [x / pivot for x in A[fila]]
-                valor_pivote = self._format_number(pivot)
-                pasos.append({"descripcion": f"(*Pivote*, Fila: {fila+1}; Columna: {col+1}; Valor: {valor_pivote})\nF{fila+1} → F{fila+1} / {valor_pivote}", "matriz": self._mat_str(A)})
+def _norma2(v):
+    return sum(x * x for x in v) ** 0.5
 
-            for r in range(n):
-                if r != fila and abs(A[r][col]) > 1e-10:
-                    factor = A[r][col]
-                    A[r] = [A[r][c] - factor * A[fila][c] for c in range(k)]
-                    valor_pivote = self._format_number(A[fila][col])
-                    pasos.append({"descripcion": f"(*Pivote*, Fila: {fila+1}; Columna: {col+1}; Valor: {valor_pivote})\nF{r+1} → F{r+1} - ({self._format_number(factor)})*F{fila+1}", "matriz": self._mat_str(A)})
 
-            pivotes[col] = fila
-            fila += 1
-            if fila >= n:
-                break
+def resolver_iterativo(filas, b, metodo="jacobi", tol=1e-10, max_iter=500, omega=1.25, x0=None):
+    """
+    Resuelve A x = b con un método iterativo sobre la representación dispersa por filas
+    (ver a_filas_dispersas). Cada iteración cuesta O(nnz).
 
-        pivot_cols = sorted(pivotes.keys())
-        libres = [c for c in range(k) if c not in pivotes]
-        rango = len(pivotes)
-        independiente = (rango == k)
+    - metodo: "jacobi", "gauss-seidel", "sor" (con factor omega) o "cg" (gradiente conjugado, A SPD).
+    - tol: tolerancia sobre el residuo relativo ‖b - A x‖ / ‖b‖.
+    - max_iter: máximo de iteraciones.
 
-        if independiente:
-            mensaje = f"Linealmente independientes "
-        else:
-            libres_nombres = ", ".join(f"v{c+1}" for c in libres) if libres else "ninguna"
-            mensaje = (f"Linealmente dependientes. "
-                       f"Columnas sin pivote (libres): {libres_nombres}.")
+    Se detiene antes de max_iter si el residuo deja de ser finito o supera FACTOR_DIVERGENCIA
+    veces el inicial.
 
-        solucion = {
-            "independiente": independiente,
-            "rango": rango,
-            "pivotes": [c + 1 for c in pivot_cols],
-            "libres": [c + 1 for c in libres]
-        }
+    Retorna {"x": [...], "iteraciones": k, "convergio": bool, "diverge": bool,
+             "residuos": [r0, r1, ...]}.
+    """
+    if metodo not in METODOS_ITERATIVOS:
+        raise ValueError(f"Método iterativo desconocido: {metodo}")
+    if metodo == "sor" and not (0 < omega < 2):
+        raise ValueError("SOR requiere 0 < ω < 2.")
+    n = len(filas)
+    if len(b) != n:
+        raise ValueError("El vector b debe tener la misma dimensión que A.")
+    b = [float(v) for v in b]
+    x = [float(v) for v in x0] if x0 is not None else [0.0] * n
+    norma_b = _norma2(b) or 1.0
 
-        return {"pasos": pasos if mostrar_pasos else [], "solucion": solucion, "mensaje": mensaje}
+    def residuo(x):
+        return [bi - ai for bi, ai in zip(b, _producto_filas(filas, x))]
 
-    # -------------------- MÉTODO TRASPUESTA E INVERSA --------------------
-    def trasponer(self):
-        """Devuelve una nueva instancia de Matriz que es la traspuesta de la actual.
-        No modifica la matriz original.
-        """
-        # Construir la traspuesta: filas -> columnas
-        trans = [[self.A[r][c] for r in range(self.n)] for c in range(self.m)]
-        return Matriz(trans)
+    if metodo == "cg":
+        return _gradiente_conjugado(filas, b, x, tol, max_iter, norma_b, residuo)
 
-    # alias en inglés por conveniencia
-    transpose = trasponer
+    # Separar la diagonal de los términos fuera de ella
+    diag = [0.0] * n
+    fuera = []
+    for i, fila in enumerate(filas):
+        resto = []
+        for j, v in fila:
+            if j == i:
+                diag[i] = v
+            else:
+                resto.append((j, v))
+        if diag[i] == 0.0:
+            raise ValueError(f"El elemento diagonal a[{i+1},{i+1}] es cero: el método {metodo} no es aplicable.")
+        fuera.append(resto)
 
-    # La inversa de la matriz debe validar que es cuadrada
-    def inversa(self, mostrar_pasos=True):
-        """Calcula la inversa de la matriz usando Gauss-Jordan sobre [A | I].
+    residuos = [_norma2(residuo(x)) / norma_b]
+    convergio = residuos[0] < tol
+    k = 0
+    while not convergio and k < max_iter:
+        if metodo == "jacobi":
+            x = [(b[i] - sum(v * x[j] for j, v in fuera[i])) / diag[i] for i in range(n)]
+        else:
+            w = 1.0 if metodo == "gauss-seidel" else omega
+            for i in range(n):
+                gs = (b[i] - sum(v * x[j] for j, v in fuera[i])) / diag[i]
+                x[i] = x[i] + w * (gs - x[i])
+        k += 1
+        residuos.append(_norma2(residuo(x)) / norma_b)
+        if _diverge(residuos, tol):
+            return {"x": x, "iteraciones": k, "convergio": False, "diverge": True, "residuos": residuos}
+        convergio = residuos[-1] < tol
+    return {"x": x, "iteraciones": k, "convergio": convergio, "diverge": False, "residuos": residuos}
 
-        - Validaciones: la matriz debe ser cuadrada (n == m).
-        - Si la matriz es singular devuelve {'pasos': pasos, 'inversa': None, 'mensaje': ...}.
-        - Si tiene inversa devuelve la matriz inversa formateada y los pasos (si mostrar_pasos).
-        """
-        # Solo para matrices cuadradas
-        if self.n != self.m:
-            raise ValueError("La inversa sólo está definida para matrices cuadradas (n == m).")
 
-        n = self.n
-        # Construir la matriz aumentada [A | I]
-        A = [row[:] for row in self.A]
-        Aug = [A[i] + [1.0 if i == j else 0.0 for j in range(n)] for i in range(n)]
+def _gradiente_conjugado(filas, b, x, tol, max_iter, norma_b, residuo):
+    r = residuo(x)
+    p = r[:]
+    rr = sum(v * v for v in r)
+    residuos = [rr ** 0.5 / norma_b]
+    k = 0
+    while residuos[-1] >= tol and k < max_iter:
+        Ap = _producto_filas(filas, p)
+        pAp = sum(map(mul, p, Ap))
+        if pAp <= 0.0:
+            raise ValueError("La matriz no es simétrica definida positiva: gradiente conjugado no aplicable.")
+        alfa = rr / pAp
+        x = [xi + alfa * pi for xi, pi in zip(x, p)]
+        r = [ri - alfa * api for ri, api in zip(r, Ap)]
+        rr_nuevo = sum(v * v for v in r)
+        p = [ri + (rr_nuevo / rr) * pi for ri, pi in zip(r, p)]
+        rr = rr_nuevo
+        k += 1
+        residuos.append(rr ** 0.5 / norma_b)
+        if _diverge(residuos, tol):
+            return {"x": x, "iteraciones": k, "convergio": False, "diverge": True, "residuos": residuos}
+    return {"x": x, "iteraciones": k, "convergio": residuos[-1] < tol, "diverge": False, "residuos": residuos}
 
-        pasos = []
-        pasos.append({"descripcion": "Matriz inicial (A | I)", "matriz": self._mat_str(Aug)})
 
-        fila = 0
-        for col in range(n):
-            pivot_row = None
-            for r in range(fila, n):
-                if abs(Aug[r][col]) > 1e-10:
-                    pivot_row = r
-                    break
-            if pivot_row is None:
-                # No hay pivote en esta columna -> singular
-                return {"pasos": pasos, "inversa": None, "mensaje": "La matriz es singular y no tiene inversa."}
+# -------------------- MATRIZ DISPERSA (CSR) --------------------
+UMBRAL_DISPERSO = 64       # filas desde las que como_matriz considera la representación dispersa
+DENSIDAD_DISPERSA = 0.1    # fracción máxima de no nulos para usar MatrizDispersa
 
-            if pivot_row != fila:
-                Aug[fila], Aug[pivot_row] = Aug[pivot_row], Aug[fila]
-                pasos.append({"descripcion": f"F{fila+1} ↔ F{pivot_row+1}", "matriz": self._mat_str(Aug)})
 
-            pivot = Aug[fila][col]
-            if abs(pivot - 1) > 1e-10:
-                Aug[fila] = [x / pivot for x in Aug[fila]]
-                pasos.append({"descripcion": f"F{fila+1} → F{fila+1} / {self._format_number(pivot)}", "matriz": self._mat_str(Aug)})
+def _eliminacion_dispersa(filas, num_cols, umbral=0.1, tol=1e-12):
+    """
+    Eliminación gaussiana dispersa con pivoteo de Markowitz (grado mínimo con umbral).
 
-            for r in range(n):
-                if r != fila and abs(Aug[r][col]) > 1e-10:
-                    factor = Aug[r][col]
-                    Aug[r] = [Aug[r][k] - factor * Aug[fila][k] for k in range(2 * n)]
-                    pasos.append({"descripcion": f"F{r+1} → F{r+1} - ({self._format_number(factor)})*F{fila+1}", "matriz": self._mat_str(Aug)})
+    - filas: lista de dicts {col: valor}; se modifican in-place.
+    - num_cols: columnas candidatas a pivote (0..num_cols-1); el resto (p. ej. el término
+      independiente) sólo se transforma.
+    - En cada paso se elige, entre las columnas activas de menor número de entradas, el pivote
+      con |a| >= umbral·max|columna| cuya fila tenga menos entradas: así se limita el relleno.
+    - Las columnas se guardan en un heap por grado: al final de cada paso se agrega una entrada
+      por columna cuyo grado cambió y las viejas se descartan al salir, así elegir la columna
+      cuesta O(log n) y no O(n).
 
-            fila += 1
+    Retorna (orden, relleno): orden = [(fila, columna), ...] en orden de eliminación y relleno =
+    número de entradas nuevas creadas.
+    """
+    # Estructura por columnas de la submatriz activa: col -> set(filas)
+    por_col = {}
+    for i, fila in enumerate(filas):
+        for j in fila:
+            if j < num_cols:
+                por_col.setdefault(j, set()).add(i)
+    heap = [(len(r), j) for j, r in por_col.items()]
+    heapq.heapify(heap)
+    eliminadas = set()
 
-        # Extraer la inversa (la mitad derecha de la matriz aumentada)
-        inv = [row[n:] for row in Aug]
+    orden = []
+    relleno = 0
+    while heap:
+        # Columna de grado mínimo (menos entradas en filas activas); entradas obsoletas se saltan
+        grado, col = heapq.heappop(heap)
+        if col in eliminadas or grado != len(por_col[col]):
+            continue
+        candidatas = por_col[col]
+        if not candidatas:
+            eliminadas.add(col)
+            continue
+        max_abs = max(abs(filas[r][col]) for r in candidatas)
+        if max_abs < tol:
+            # Columna numéricamente nula: se descarta como pivote
+            for r in candidatas:
+                del filas[r][col]
+            por_col[col] = set()
+            eliminadas.add(col)
+            continue
+        piv_fila = min((r for r in candidatas if abs(filas[r][col]) >= umbral * max_abs),
+                       key=lambda r: (len(filas[r]), r))
+        fila_p = filas[piv_fila]
+        piv = fila_p[col]
+        orden.append((piv_fila, col))
+        eliminadas.add(col)
+        cambiadas = set()  # columnas cuyo grado cambió en este paso: una entrada nueva cada una
+        for j in fila_p:
+            if j < num_cols:
+                por_col[j].discard(piv_fila)
+                cambiadas.add(j)
+        for r in list(candidatas):
+            fila_r = filas[r]
+            f = fila_r.pop(col) / piv
+            for j, v in fila_p.items():
+                if j == col:
+                    continue
+                if j in fila_r:
+                    nuevo = fila_r[j] - f * v
+                    if abs(nuevo) < tol:
+                        del fila_r[j]
+                        if j < num_cols:
+                            por_col[j].discard(r)
+                            cambiadas.add(j)
+                    else:
+                        fila_r[j] = nuevo
+                else:
+                    fila_r[j] = -f * v
+                    relleno += 1
+                    if j < num_cols:
+                        por_col[j].add(r)
+                        cambiadas.add(j)
+        por_col[col] = set()
+        for j in cambiadas - eliminadas:
+            heapq.heappush(heap, (len(por_col[j]), j))
+    return orden, relleno
 
-        return {"pasos": pasos if mostrar_pasos else [], "inversa": self._mat_str(inv), "mensaje": "Inversa calculada correctamente."}
 
-    # alias en inglés
-    inverse = inversa
-    
-    
+def _sustitucion_dispersa(filas, orden, num_vars):
+    """Sustitución en orden inverso de eliminación sobre las filas que dejó _eliminacion_dispersa.
 
-    def _resolver_sustitucion(self, A):
-        eps = 1e-10
-        n_vars = self.m - 1
-        n_rows = self.n
+    Retorna expr[col_pivote] = {"const": c, col_libre: coef, ...} con x_col = c + Σ coef·x_libre;
+    la constante sale de la columna num_vars (el término independiente, 0 si no existe).
+    """
+    expr = {}
+    for r, c in reversed(orden):
+        fila = filas[r]
+        piv = fila[c]
+        e = {"const": fila.get(num_vars, 0.0)}
+        for j, v in fila.items():
+            if j == c or j >= num_vars:
+                continue
+            if j in expr:
+                for clave, coef in expr[j].items():
+                    e[clave] = e.get(clave, 0.0) - v * coef
+            else:  # columna libre
+                e[j] = e.get(j, 0.0) - v
+        expr[c] = {clave: coef / piv for clave, coef in e.items()}
+    return expr
 
-        # 1) Detectar incompatibilidad y pivotes (columna -> fila)
-        pivotes = {}
-        for i in range(n_rows):
-            fila = A[i]
-            if all(abs(c) < eps for c in fila[:n_vars]) and abs(fila[-1]) > eps:
-                return "Sistema incompatible, no tiene solución."
-            # primer no-cero de la fila = pivote
-            for j in range(n_vars):
-                if abs(fila[j]) > eps:
-                    pivotes[j] = i
-                    break
 
-        pivot_cols = sorted(pivotes.keys())
-        free_cols = [j for j in range(n_vars) if j not in pivotes]
+class MatrizDispersa:
+    """Matriz dispersa en formato CSR (valores, índices de columna y punteros de fila).
 
-        # 2) Expresiones de variables pivote en términos de libres (y constante)
-        #    Representamos una expresión como: {"const": c, <col_libre>: coef, ...}
-        expr = {}  # expr[col_pivote] -> dict
+    Implementa la misma API que Matriz (sumar, restar, multiplicar, trasponer, gauss,
+    independencia_vectores); memoria y tiempo dependen del número de no nulos (nnz).
 
-        # Procesar de abajo hacia arriba (filas con pivote descendente)
-        rows_by_desc = sorted(((row, col) for col, row in pivotes.items()), reverse=True)
-        for row, pcol in rows_by_desc:
-            piv = A[row][pcol]
-            # RHS inicial (constante)
-            cte = A[row][-1]
-            terms = {}  # coeficientes para libres
+    Acepta:
+      - datos densos (lista de listas),
+      - una Matriz,
+      - la forma dispersa persistida: {"formato": "csr", "filas", "columnas", "valores", "indices", "punteros"}.
+    """
 
-            # Restar contribución de columnas libres
-            for j in free_cols:
-                coef = A[row][j]
-                if abs(coef) > eps:
-                    terms[j] = terms.get(j, 0.0) - coef
+    def __init__(self, datos, tol=0.0):
+        if isinstance(datos, MatrizDispersa):
+            self.n, self.m = datos.n, datos.m
+            self.valores, self.indices, self.punteros = datos.valores[:], datos.indices[:], datos.punteros[:]
+        elif isinstance(datos, dict):
+            if datos.get("formato") != "csr":
+                raise ValueError("Formato disperso desconocido: se esperaba 'csr'.")
+            self.n, self.m = int(datos["filas"]), int(datos["columnas"])
+            self.valores = [float(v) for v in datos["valores"]]
+            self.indices = [int(j) for j in datos["indices"]]
+            self.punteros = [int(p) for p in datos["punteros"]]
+            if len(self.punteros) != self.n + 1 or len(self.valores) != len(self.indices):
+                raise ValueError("Forma CSR inconsistente.")
+        else:
+            densa = (datos if isinstance(datos, Matriz) else Matriz(datos))._filas()
+            self.n, self.m = len(densa), len(densa[0])
+            self.valores, self.indices, self.punteros = [], [], [0]
+            for fila in densa:
+                for j, x in enumerate(fila):
+                    if abs(x) > tol:
+                        self.indices.append(j)
+                        self.valores.append(float(x))
+                self.punteros.append(len(self.valores))
+        self.variables = [f"x{i+1}" for i in range(self.m - 1)]
 
-            # Restar contribución de pivotes "inferiores" (columnas de pivote mayores)
-            for qcol, qrow in pivotes.items():
-                if qcol <= pcol:
-                    continue
-                coef = A[row][qcol]
-                if abs(coef) <= eps:
-                    continue
-                # expr[qcol] ya calculada
-                qexpr = expr[qcol]
-                cte -= coef * qexpr.get("const", 0.0)
-                for lj, lcoef in qexpr.items():
-                    if lj == "const":
-                        continue
-                    terms[lj] = terms.get(lj, 0.0) - coef * lcoef
+    @classmethod
+    def _desde_filas(cls, filas, n, m):
+        """Construye desde una lista de dicts {col: valor} por fila."""
+        obj = cls.__new__(cls)
+        obj.n, obj.m = n, m
+        obj.valores, obj.indices, obj.punteros = [], [], [0]
+        for fila in filas:
+            for j in sorted(fila):
+                obj.indices.append(j)
+                obj.valores.append(fila[j])
+            obj.punteros.append(len(obj.valores))
+        obj.variables = [f"x{i+1}" for i in range(m - 1)]
+        return obj
 
-            # Dividir todo por el pivote
-            cte /= piv
-            for k in list(terms.keys()):
-                terms[k] /= piv
+    @property
+    def nnz(self):
+        return len(self.valores)
 
-            e = {"const": cte}
-            e.update({j: terms[j] for j in terms})
-            expr[pcol] = e
+    def fila(self, i):
+        """Dict {col: valor} con los no nulos de la fila i."""
+        a, b = self.punteros[i], self.punteros[i+1]
+        return dict(zip(self.indices[a:b], self.valores[a:b]))
 
-        # 3) Formatear solución igual que gauss_jordan
-        def fmt(v):
-            return self._format_number(v)
+    def filas_dispersas(self):
+        """Formato por filas [(col, valor), ...] que usan los métodos iterativos."""
+        return [list(zip(self.indices[self.punteros[i]:self.punteros[i+1]],
+                         self.valores[self.punteros[i]:self.punteros[i+1]])) for i in range(self.n)]
 
-        solucion = {}
-        for j in range(n_vars):
-            var = self.variables[j]
-            if j in free_cols:
-                solucion[var] = "libre"
-            else:
-                e = expr[j]
-                partes = [fmt(e.get("const", 0.0))]
-                for lj in sorted([k for k in e.keys() if k != "const"]):
-                    coef = e[lj]
-                    if abs(coef) > eps:
-                        partes.append(f"+ ({fmt(coef)})*{self.variables[lj]}")
-                # Siempre dejamos la constante primero (aunque sea 0) para que coincida con Gauss-Jordan
-                solucion[var] = " ".join(partes) if partes else "0"
+    def to_list(self):
+        densa = [[0.0] * self.m for _ in range(self.n)]
+        for i in range(self.n):
+            for k in range(self.punteros[i], self.punteros[i+1]):
+                densa[i][self.indices[k]] = self.valores[k]
+        return densa
 
-        return solucion
-    
-    # Recordar hacer los determinantes de la matriz por Sarrus
-    
-    # Tambien resolver por el metodo de Cramer 
-    
-    def cramer(self):
-        """ Necesito este metodo para el jueves con la clase del Profesor Ivan"""
-    
-    
-    # Necesito el metodo e Sarrus para el jueves con la clase del Profesor Ivan
-    def sarrus(self):
-        """ Necesito este metodo para el jueves con la clase del Profesor Ivan"""
+    def a_densa(self):
+        return Matriz(self.to_list())
 
-    # -------------------- OPERADOR DE MATRICES --------------------
-    def _ensure_matrix_like(self, other):
-        if isinstance(other, Matriz):
+    def a_dict(self):
+        """Forma dispersa para persistir en JSON."""
+        return {"formato": "csr", "filas": self.n, "columnas": self.m,
+                "valores": self.valores[:], "indices": self.indices[:], "punteros": self.punteros[:]}
+
+    # -------------------- OPERADORES --------------------
+    def _ensure_dispersa(self, other):
+        if isinstance(other, MatrizDispersa):
             return other
-        if isinstance(other, (list, tuple)):
-            return Matriz([list(row) for row in other])
-        raise ValueError("El operando debe ser una Matriz o una lista de listas numéricas.")
+        return MatrizDispersa(other)
+
+    def _combinar(self, other, signo, operacion):
+        B = self._ensure_dispersa(other)
+        if self.n != B.n or self.m != B.m:
+            raise ValueError(f"Dimensiones incompatibles para {operacion}: deben ser iguales.")
+        filas = []
+        for i in range(self.n):
+            fila = self.fila(i)
+            for j, v in B.fila(i).items():
+                nuevo = fila.get(j, 0.0) + signo * v
+                if nuevo != 0.0:
+                    fila[j] = nuevo
+                else:
+                    fila.pop(j, None)
+            filas.append(fila)
+        return MatrizDispersa._desde_filas(filas, self.n, self.m)
 
     def sumar(self, other):
-        B = self._ensure_matrix_like(other)
-        if self.n != B.n or self.m != B.m:
-            raise ValueError("Dimensiones incompatibles para suma: deben ser iguales.")
-        C = [[self.A[i][j] + B.A[i][j] for j in range(self.m)] for i in range(self.n)]
-        return Matriz(C)
+        return self._combinar(other, 1.0, "suma")
 
     def restar(self, other):
-        B = self._ensure_matrix_like(other)
-        if self.n != B.n or self.m != B.m:
-            raise ValueError("Dimensiones incompatibles para resta: deben ser iguales.")
-        C = [[self.A[i][j] - B.A[i][j] for j in range(self.m)] for i in range(self.n)]
-        return Matriz(C)
+        return self._combinar(other, -1.0, "resta")
 
     def multiplicar(self, other):
-        # Escalar
-        if isinstance(other, (int, float)):
-            C = [[self.A[i][j] * other for j in range(self.m)] for i in range(self.n)]
-            return Matriz(C)
-        B = self._ensure_matrix_like(other)
+        # Escalar (los valores se guardan en float, también al escalar por un Fraction)
+        if isinstance(other, (int, float, Fraction)):
+            C = MatrizDispersa(self)
+            C.valores = [v * float(other) for v in C.valores]
+            return C
+        B = self._ensure_dispersa(other)
         if self.m != B.n:
             raise ValueError(f"Dimensiones incompatibles para multiplicación: {self.n}x{self.m} * {B.n}x{B.m}")
-        C = [[0.0 for _ in range(B.m)] for __ in range(self.n)]
+        # Gustavson: cada fila de C combina las filas de B indicadas por los no nulos de A
+        filas = []
         for i in range(self.n):
-            for j in range(B.m):
-                s = 0.0
-                for k in range(self.m):
-                    s += self.A[i][k] * B.A[k][j]
-                C[i][j] = s
-        return Matriz(C)
+            acc = {}
+            for k in range(self.punteros[i], self.punteros[i+1]):
+                a = self.valores[k]
+                fila_b = self.indices[k]
+                for kk in range(B.punteros[fila_b], B.punteros[fila_b+1]):
+                    j = B.indices[kk]
+                    acc[j] = acc.get(j, 0.0) + a * B.valores[kk]
+            filas.append({j: v for j, v in acc.items() if v != 0.0})
+        return MatrizDispersa._desde_filas(filas, self.n, B.m)
+
+    def trasponer(self):
+        """Traspuesta en O(nnz) (conteo por columnas)."""
+        conteo = [0] * (self.m + 1)
+        for j in self.indices:
+            conteo[j + 1] += 1
+        for j in range(self.m):
+            conteo[j + 1] += conteo[j]
+        punteros = conteo[:]
+        valores = [0.0] * self.nnz
+        indices = [0] * self.nnz
+        siguiente = conteo[:-1]
+        for i in range(self.n):
+            for k in range(self.punteros[i], self.punteros[i+1]):
+                j = self.indices[k]
+                pos = siguiente[j]
+                indices[pos] = i
+                valores[pos] = self.valores[k]
+                siguiente[j] += 1
+        T = MatrizDispersa.__new__(MatrizDispersa)
+        T.n, T.m = self.m, self.n
+        T.valores, T.indices, T.punteros = valores, indices, punteros
+        T.variables = [f"x{i+1}" for i in range(T.m - 1)]
+        return T
+
+    transpose = trasponer
 
-    # Sobrecargas convenientes
-    # Sirve para usar los operadores +, -, @, * directamente
-    
     def __add__(self, other):
         return self.sumar(other)
 
@@ -521,243 +4171,417 @@ class Matriz:
         return self.multiplicar(other)
 
     def __rmul__(self, other):
-        if isinstance(other, (int, float)):
+        if isinstance(other, (int, float, Fraction)):
             return self.multiplicar(other)
         return NotImplemented
 
-    def to_list(self):
-        return [row[:] for row in self.A]
+    # -------------------- ELIMINACIÓN DISPERSA --------------------
+    _format_number = staticmethod(Matriz._format_number)
 
-def determinante_por_gauss(A):
-    """
-    Calcula el determinante de una matriz cuadrada A (lista de listas)
-    mediante reducción a triangular superior por eliminación de Gauss.
-    No modifica A (trabaja sobre una copia). Devuelve un número (float).
-    """
-    eps = 1e-12
-    if A is None or len(A) == 0:
-        raise ValueError("La matriz no puede estar vacía.")
-    n = len(A)
-    # verificar cuadrada
-    for row in A:
-        if len(row) != n:
-            raise ValueError("La matriz debe ser cuadrada para calcular el determinante.")
-    # trabajar sobre una copia en coma flotante para no alterar la original
-    M = [list(map(float, row[:])) for row in A]
-    det_sign = 1  # guarda el signo que cambia cuando se intercambian filas
-    for i in range(n):
-        # Buscar la fila con el mayor valor absoluto en la columna i (pivote)
-        max_row = max(range(i, n), key=lambda r: abs(M[r][i]))
-        # Si el mejor pivote es (prácticamente) cero, el determinante es 0
-        if abs(M[max_row][i]) < eps:
-            return 0.0
-        # Si hay intercambio de filas, invertimos el signo del determinante
-        if max_row != i:
-            M[i], M[max_row] = M[max_row], M[i]
-            det_sign *= -1
-        pivot = M[i][i]
-        # Eliminar (poner a cero) los elementos debajo del pivote
-        for r in range(i + 1, n):
-            if abs(M[r][i]) < eps:
+    def gauss(self, umbral=0.1):
+        """Resuelve el sistema aumentado n x (n+1) con eliminación dispersa (Markowitz).
+
+        Retorna el mismo formato que Matriz.gauss ({"pasos", "solucion", "mensaje"}) más
+        "metodo" y "relleno" (entradas nuevas creadas durante la eliminación).
+        """
+        eps = 1e-10
+        num_vars = self.m - 1
+        filas = [self.fila(i) for i in range(self.n)]
+        orden, relleno = _eliminacion_dispersa(filas, num_vars, umbral)
+        pivote_de = {c: r for r, c in orden}
+
+        # Filas sin pivote: 0 = b con b != 0 -> incompatible
+        filas_pivote = {r for r, _ in orden}
+        for r in range(self.n):
+            if r not in filas_pivote and abs(filas[r].get(num_vars, 0.0)) > eps:
+                return {"pasos": [], "solucion": "Sistema incompatible, no tiene solución.",
+                        "mensaje": "El sistema es inconsistente (no tiene solución).",
+                        "metodo": "eliminación dispersa (Markowitz)", "relleno": relleno}
+
+        libres = [c for c in range(num_vars) if c not in pivote_de]
+        expr = _sustitucion_dispersa(filas, orden, num_vars)
+
+        solucion = {}
+        for j in range(num_vars):
+            if j in libres:
+                solucion[self.variables[j]] = "libre"
                 continue
-            factor = M[r][i] / pivot
-            # Restamos factor * fila_pivote a la fila r (no cambia el determinante)
-            for c in range(i, n):
-                M[r][c] -= factor * M[i][c]
-    # El determinante es el producto de la diagonal por el signo de los swaps
-    det = det_sign
-    for i in range(n):
-        det *= M[i][i]
-    return det
+            partes = [self._format_number(expr[j].get("const", 0.0))]
+            for lj in sorted(k for k in expr[j] if k != "const"):
+                if abs(expr[j][lj]) > eps:
+                    partes.append(f"+ ({self._format_number(expr[j][lj])})*{self.variables[lj]}")
+            solucion[self.variables[j]] = " ".join(partes)
 
+        if libres:
+            mensaje = "El sistema tiene infinitas soluciones (variables libres presentes)."
+        else:
+            mensaje = "El sistema tiene solución única."
+        pasos = [{"descripcion": f"Eliminación dispersa con pivoteo de Markowitz: nnz = {self.nnz}, "
+                                 f"relleno = {relleno}, orden de pivotes (columna) = "
+                                 + ", ".join(f"{self.variables[c]}" for _, c in orden)}]
+        return {"pasos": pasos, "solucion": solucion, "mensaje": mensaje,
+                "metodo": "eliminación dispersa (Markowitz)", "relleno": relleno}
 
-def determinante_por_gauss_con_pasos(A, mostrar_pasos=True):
-    """
-    Calcula el determinante de una matriz cuadrada A usando eliminación de Gauss
-    y devuelve además los pasos del procedimiento.
+    def independencia_vectores(self, vectores=None, mostrar_pasos=True, umbral=0.1):
+        """Independencia lineal de las columnas de la matriz (o de 'vectores', si se dan),
+        con eliminación dispersa. Mismo formato de resultado que Matriz.independencia_vectores,
+        incluidas las relaciones de dependencia y la base del espacio nulo."""
+        if vectores is not None:
+            if not vectores:
+                solucion = _solucion_independencia([], {}, [], 0)
+                return {"pasos": [], "solucion": solucion,
+                        "mensaje": "No hay vectores: por convención el conjunto vacío es independiente."}
+            dim = len(vectores[0])
+            if any(len(v) != dim for v in vectores):
+                raise ValueError("Todos los vectores deben tener la misma dimensión")
+            columnas = MatrizDispersa(vectores).trasponer()
+        else:
+            columnas = self
+        k = columnas.m
+        filas = [columnas.fila(i) for i in range(columnas.n)]
+        orden, relleno = _eliminacion_dispersa(filas, k, umbral)
+        pivotes = {c: c for _, c in orden}
+        libres = [c for c in range(k) if c not in pivotes]
+        # Coeficientes de cada columna libre sobre las pivote: v_f = Σ -x_c·v_c con x_c = expr[c][f]
+        expr = _sustitucion_dispersa(filas, orden, k)
+        R = {c: {f: -expr[c].get(f, 0.0) for f in libres} for c in pivotes}
+        solucion = _solucion_independencia(R, pivotes, libres, k)
+        pasos = [{"descripcion": f"Eliminación dispersa (Markowitz): rango {solucion['rango']}, relleno = {relleno}"}] if mostrar_pasos else []
+        return {"pasos": pasos, "solucion": solucion, "mensaje": _mensaje_independencia(solucion)}
 
-    Retorna:
-      {
-        "determinante": float,
-        "pasos": [ {"descripcion": str, "matriz": [[str|float]]}, ... ],
-        "mensaje": str
-      }
 
-    No modifica A.
+def como_matriz(datos, densidad_max=DENSIDAD_DISPERSA):
+    """Devuelve MatrizDispersa si 'datos' es la forma dispersa persistida, o si son datos densos
+    de al menos UMBRAL_DISPERSO filas con una fracción de no nulos <= densidad_max; Matriz en
+    otro caso."""
+    if isinstance(datos, dict) and datos.get("formato") == "csr":
+        return MatrizDispersa(datos)
+    if len(datos) >= UMBRAL_DISPERSO and datos[0]:
+        no_nulos = sum(1 for fila in datos for x in fila if x != 0)
+        if no_nulos <= densidad_max * len(datos) * len(datos[0]):
+            return MatrizDispersa(datos)
+    return Matriz(datos)
+
+
+# -------------------- CACHÉ DE INVERSAS CON ACTUALIZACIONES DE BAJO RANGO --------------------
+class CacheFactorizaciones:
+    """Guarda, por nombre de matriz, la última inversa y su determinante.
+
+    Cuando la matriz cambia en pocas filas (edición de una entrada o de k filas), la inversa se
+    actualiza con Sherman-Morrison / Woodbury y el determinante con el lema del determinante
+    en O(n²·k) en lugar de recalcular en O(n³). Se refactoriza desde cero si cambian demasiadas
+    filas, si la matriz de capacitancia es casi singular, si el residuo de control crece o tras
+    demasiadas actualizaciones encadenadas.
     """
-    eps = 1e-12
-    if A is None or len(A) == 0:
-        raise ValueError("La matriz no puede estar vacía.")
-    n = len(A)
-    for row in A:
-        if len(row) != n:
-            raise ValueError("La matriz debe ser cuadrada para calcular el determinante.")
 
-    # Copia en float
-    M = [list(map(float, row[:])) for row in A]
+    def __init__(self, max_actualizaciones=20, tol_residuo=1e-8, tol_capacitancia=1e-10):
+        self.max_actualizaciones = max_actualizaciones
+        self.tol_residuo = tol_residuo
+        self.tol_capacitancia = tol_capacitancia
+        self._entradas = {}
 
-    def fmt(x):
-        # entero sin decimales vs 4 decimales
-        return str(int(round(x))) if abs(x - round(x)) < 1e-10 else f"{x:.4f}"
+    def invalidar(self, nombre=None):
+        """Olvida la entrada de 'nombre' (o todas si nombre es None)."""
+        if nombre is None:
+            self._entradas.clear()
+        else:
+            self._entradas.pop(nombre, None)
 
-    def mat_fmt(M_):
-        return [[fmt(x) for x in fila] for fila in M_]
+    def registrar(self, nombre, A, inversa, determinante):
+        """Guarda una inversa calculada por otra vía (p. ej. Matriz.inversa)."""
+        if inversa is None or determinante is None:
+            self._entradas.pop(nombre, None)
+            return
+        self._entradas[nombre] = {"A": [[float(x) for x in fila] for fila in A],
+                                  "inv": [fila[:] for fila in inversa],
+                                  "det": determinante, "actualizaciones": 0}
 
-    pasos = []
-    if mostrar_pasos:
-        pasos.append({"descripcion": "Matriz inicial", "matriz": mat_fmt(M)})
+    def _actualizar(self, nombre, A):
+        """Aplica la actualización de bajo rango. Retorna (entrada, filas_cambiadas) o None si
+        hay que refactorizar."""
+        entrada = self._entradas.get(nombre)
+        if entrada is None:
+            return None
+        viejo = entrada["A"]
+        n = len(viejo)
+        if len(A) != n or any(len(fila) != n for fila in A):
+            return None
+        filas = [i for i in range(n) if any(float(a) != b for a, b in zip(A[i], viejo[i]))]
+        k = len(filas)
+        if k == 0:
+            return entrada, filas
+        if k > max(1, n // 4) or entrada["actualizaciones"] >= self.max_actualizaciones:
+            return None
 
-    det_sign = 1
-    for i in range(n):
-        # escoger pivote por valor absoluto máximo
-        max_row = max(range(i, n), key=lambda r: abs(M[r][i]))
-        if abs(M[max_row][i]) < eps:
-            # det=0: registrar razón
-            if mostrar_pasos:
-                pasos.append({
-                    "descripcion": f"Columna {i+1}: pivote ≈ 0 ⇒ det(A)=0",
-                    "matriz": mat_fmt(M)
-                })
-            return {"determinante": 0.0, "pasos": pasos if mostrar_pasos else [], "mensaje": "Determinante nulo (pivote cero)."}
+        Ainv = entrada["inv"]
+        # A' = A + U·D con U = columnas e_i (i en filas) y D = filas modificadas de A' - A (k x n)
+        D = [[float(a) - b for a, b in zip(A[i], viejo[i])] for i in filas]
+        W = _multiplicar_bloques(D, [list(col) for col in zip(*Ainv)])      # D·A⁻¹ (k x n)
+        C = [[(1.0 if r == c else 0.0) + W[r][filas[c]] for c in range(k)] for r in range(k)]
+        Cinv = _inversa_numerica(C)
+        det_C = determinante_por_gauss(C)
+        if Cinv is None or abs(det_C) < self.tol_capacitancia:
+            return None
+        Z = [[sum(Ainv[i][filas[t]] * Cinv[t][c] for t in range(k)) for c in range(k)] for i in range(n)]  # A⁻¹U·C⁻¹
+        nueva = [[a - sum(z * W[t][j] for t, z in enumerate(Z[i])) for j, a in enumerate(Ainv[i])] for i in range(n)]
 
-        if max_row != i:
-            M[i], M[max_row] = M[max_row], M[i]
-            det_sign *= -1
-            if mostrar_pasos:
-                pasos.append({
-                    "descripcion": f"F{i+1} ↔ F{max_row+1} (cambia el signo del determinante)",
-                    "matriz": mat_fmt(M)
-                })
+        # Control O(n²): A'·(A'⁻¹·v) ≈ v para un vector de prueba
+        v = [1.0 + (i % 7) / 7.0 for i in range(n)]
+        y = [sum(map(mul, fila, v)) for fila in nueva]
+        r = [sum(float(a) * yj for a, yj in zip(A[i], y)) - v[i] for i in range(n)]
+        if _norma2(r) > self.tol_residuo * _norma2(v) * max(1.0, _norma2(y)):
+            return None
 
-        pivot = M[i][i]
-        # eliminación por debajo del pivote
-        for r in range(i + 1, n):
-            if abs(M[r][i]) < eps:
-                continue
-            factor = M[r][i] / pivot
-            for c in range(i, n):
-                M[r][c] -= factor * M[i][c]
-            if mostrar_pasos:
-                pasos.append({
-                    "descripcion": f"F{r+1} → F{r+1} - (" + fmt(factor) + f")*F{i+1}",
-                    "matriz": mat_fmt(M)
-                })
+        entrada.update({"A": [[float(x) for x in fila] for fila in A], "inv": nueva,
+                        "det": entrada["det"] * det_C, "actualizaciones": entrada["actualizaciones"] + 1})
+        return entrada, filas
 
-    det = det_sign
-    for i in range(n):
-        det *= M[i][i]
+    def _metodo(self, filas):
+        if not filas:
+            return "inversa en caché (sin cambios)"
+        if len(filas) == 1:
+            return "actualización de Sherman-Morrison (rango 1)"
+        return f"actualización de Woodbury (rango {len(filas)})"
 
-    mensaje = "Determinante calculado por eliminación de Gauss."
-    if mostrar_pasos:
-        diag_prod = " × ".join(fmt(M[i][i]) for i in range(n))
-        signo = "-1" if det_sign < 0 else "1"
-        pasos.append({
-            "descripcion": f"Producto diagonal × signo = (" + diag_prod + f") × {signo}",
-            "matriz": mat_fmt([[M[i][i] if i==j else 0.0 for j in range(n)] for i in range(n)])
-        })
+    def inversa(self, nombre, A):
+        """Inversa de A reutilizando la caché. Retorna un dict como Matriz.inversa o None si no
+        hay entrada aprovechable (el llamador calcula desde cero y usa registrar)."""
+        res = self._actualizar(nombre, A)
+        if res is None:
+            self._entradas.pop(nombre, None)
+            return None
+        entrada, filas = res
+        metodo = self._metodo(filas)
+        fmt = Matriz(entrada["inv"])
+        pasos = [{"descripcion": f"{metodo[0].upper() + metodo[1:]}"
+                                 + (f" — filas modificadas: {', '.join(f'F{i+1}' for i in filas)}" if filas else ""),
+                  "matriz": fmt._mat_str(A)}]
+        return {"pasos": pasos, "inversa": fmt._mat_str(entrada["inv"]), "mensaje": "Inversa calculada correctamente.",
+                "metodo": metodo, "valores": entrada["inv"], "determinante": entrada["det"]}
 
-    return {"determinante": det, "pasos": pasos if mostrar_pasos else [], "mensaje": mensaje}
+    def determinante(self, nombre, A):
+        """Determinante de A con el lema del determinante si hay una inversa en caché; None si no."""
+        res = self._actualizar(nombre, A)
+        if res is None:
+            self._entradas.pop(nombre, None)
+            return None
+        entrada, filas = res
+        metodo = self._metodo(filas).replace("inversa", "determinante")
+        if filas:
+            metodo += " con el lema del determinante"
+        return {"determinante": entrada["det"], "pasos": [{"descripcion": f"det(A) por {metodo}"}],
+                "mensaje": f"Determinante calculado por {metodo}.", "metodo": metodo}
 
-def cramer(A, b):
-    """
-    Resuelve el sistema A x = b usando la regla de Cramer.
-    - A: matriz de coeficientes (lista de listas) cuadrada n x n
-    - b: vector de resultados (lista de longitud n)
-    Devuelve la lista [x1, x2, ..., xn].
-    Lanza ValueError si no hay solución única (determinante cero) o si dimensiones no coinciden.
-    """
-    eps = 1e-12
-    if A is None or b is None:
-        raise ValueError("A y b son requeridos.")
-    n = len(A)
-    if n == 0:
-        return []
-    for row in A:
-        if len(row) != n:
-            raise ValueError("La matriz A debe ser cuadrada.")
-    if len(b) != n:
-        raise ValueError("El vector b debe tener la misma dimensión que A.")
-    # Determinante de la matriz de coeficientes
-    detA = determinante_por_gauss(A)
-    if abs(detA) < eps:
-        # Si es cero, no hay solución única y la regla de Cramer no aplica
-        raise ValueError("Determinante de A es cero: no existe solución única (regla de Cramer no aplicable).")
-    solucion = []
-    # Para cada variable reemplazamos la columna correspondiente por b y calculamos su determinante
-    for col in range(n):
-        Ai = [row[:] for row in A]  # copia de A
-        for i in range(n):
-            Ai[i][col] = b[i]  # sustituir la columna col por b
-        detAi = determinante_por_gauss(Ai)
-        solucion.append(detAi / detA)  # xi = det(Ai) / det(A)
-    return solucion
 
+# Caché compartida por la interfaz (una entrada por nombre de matriz)
+cache_resultados = CacheFactorizaciones()
 
-def cramer_con_pasos(A, b, mostrar_pasos=True):
+
+# -------------------- INDEPENDENCIA INCREMENTAL --------------------
+class RastreadorIndependencia:
+    """Mantiene una base escalonada reducida de un conjunto de vectores que crece.
+
+    Agregar un vector cuesta O(n·k) (n = dimensión, k = rango): se reduce contra la base y se
+    informa al momento si es dependiente y con qué coeficientes se escribe como combinación de
+    los vectores independientes ya guardados. Se serializa con a_dict()/desde_dict() para
+    persistirlo junto al conjunto de vectores.
     """
-    Igual que cramer(A, b), pero devuelve además los pasos intermedios usando
-    determinante_por_gauss_con_pasos.
 
-    Retorna un dict:
-      {
-        "soluciones": [x1, x2, ...],
-        "pasos": [{"descripcion": str, "matriz": [[str]]?}, ...],
-        "detA": float,
-        "mensaje": str
-      }
+    def __init__(self, dimension, tol=1e-10):
+        self.dimension = dimension
+        self.tol = tol
+        self.base = []            # vectores de la base, reducidos: base[t][pivotes[s]] = δ_ts
+        self.pivotes = []         # posición del pivote de cada vector de la base
+        self.transformacion = []  # transformacion[t]: coeficientes de base[t] sobre los independientes
+        self.independientes = []  # índices (0-based) de los vectores originales que forman la base
+        self.dependencias = {}    # índice -> {índice independiente: coeficiente}
+        self.total = 0
+
+    @property
+    def rango(self):
+        return len(self.base)
+
+    @classmethod
+    def desde_vectores(cls, vectores, tol=1e-10):
+        if not vectores:
+            raise ValueError("Se requiere al menos un vector para fijar la dimensión.")
+        r = cls(len(vectores[0]), tol)
+        for v in vectores:
+            r.agregar(v)
+        return r
+
+    def agregar(self, v):
+        """Agrega un vector. Retorna {"indice", "dependiente", "coeficientes", "rango", "mensaje"};
+        si es dependiente, coeficientes = {índice independiente: c} con v = Σ c·v_índice."""
+        if len(v) != self.dimension:
+            raise ValueError("Todos los vectores deben tener la misma dimensión")
+        indice = self.total
+        self.total += 1
+        r = [float(x) for x in v]
+        # Coeficientes sobre la base escalonada: la base es reducida, basta leer los pivotes
+        a = [r[p] for p in self.pivotes]
+        for t, at in enumerate(a):
+            if at:
+                r = [x - at * b for x, b in zip(r, self.base[t])]
+        coefs = [0.0] * len(self.independientes)
+        for t, at in enumerate(a):
+            if at:
+                coefs = [c + at * u for c, u in zip(coefs, self.transformacion[t])]
+
+        escala = max((abs(x) for x in v), default=0.0)
+        p = max(range(self.dimension), key=lambda i: abs(r[i])) if self.dimension else 0
+        if not self.dimension or abs(r[p]) <= self.tol * max(1.0, escala):
+            comb = {self.independientes[s]: c for s, c in enumerate(coefs) if abs(c) > self.tol}
+            self.dependencias[indice] = comb
+            terminos = " + ".join(f"({c:.6g})·v{s+1}" for s, c in sorted(comb.items())) or "0"
+            return {"indice": indice, "dependiente": True, "coeficientes": comb, "rango": self.rango,
+                    "mensaje": f"v{indice+1} es dependiente: v{indice+1} = {terminos}"}
+
+        # Independiente: nuevo vector de la base normalizado en su pivote
+        piv = r[p]
+        nuevo = [x / piv for x in r]
+        t_nuevo = [-c / piv for c in coefs] + [1.0 / piv]
+        for t in range(len(self.base)):
+            self.transformacion[t].append(0.0)
+            f = self.base[t][p]
+            if f:
+                self.base[t] = [x - f * y for x, y in zip(self.base[t], nuevo)]
+                self.transformacion[t] = [x - f * y for x, y in zip(self.transformacion[t], t_nuevo)]
+        self.base.append(nuevo)
+        self.pivotes.append(p)
+        self.transformacion.append(t_nuevo)
+        self.independientes.append(indice)
+        return {"indice": indice, "dependiente": False, "coeficientes": {}, "rango": self.rango,
+                "mensaje": f"v{indice+1} es independiente de los anteriores (rango {self.rango})."}
+
+    def a_dict(self):
+        return {"dimension": self.dimension, "tol": self.tol, "base": self.base, "pivotes": self.pivotes,
+                "transformacion": self.transformacion, "independientes": self.independientes,
+                "dependencias": [[i, [[j, c] for j, c in comb.items()]] for i, comb in self.dependencias.items()],
+                "total": self.total}
+
+    @classmethod
+    def desde_dict(cls, datos):
+        r = cls(datos["dimension"], datos.get("tol", 1e-10))
+        r.base = [list(b) for b in datos["base"]]
+        r.pivotes = list(datos["pivotes"])
+        r.transformacion = [list(t) for t in datos["transformacion"]]
+        r.independientes = list(datos["independientes"])
+        r.dependencias = {i: {j: c for j, c in comb} for i, comb in datos["dependencias"]}
+        r.total = datos["total"]
+        return r
+
+
+# -------------------- ESPACIO GENERADO --------------------
+class EspacioGenerado:
+    """Espacio generado por un conjunto de vectores, factorizado una sola vez (QR por Gram-Schmidt
+    modificado con reortogonalización) para responder muchas consultas.
+
+    Cada consulta (contiene, coordenadas, proyeccion) cuesta O(n·k). Las variantes *_lote reciben
+    una lista de vectores consulta y, con NumPy, los resuelven con dos productos matriciales.
     """
-    eps = 1e-12
-    if A is None or b is None:
-        raise ValueError("A y b son requeridos.")
-    n = len(A)
-    if n == 0:
-        return {"soluciones": [], "pasos": [], "detA": 1.0, "mensaje": "Sistema vacío."}
-    for row in A:
-        if len(row) != n:
-            raise ValueError("La matriz A debe ser cuadrada.")
-    if len(b) != n:
-        raise ValueError("El vector b debe tener la misma dimensión que A.")
 
-    pasos = []
-    # Paso inicial: mostrar A y b
-    def fmt(x):
-        return str(int(round(x))) if abs(x - round(x)) < 1e-10 else f"{x:.4f}"
-    def mat_fmt(M):
-        return [[fmt(x) for x in fila] for fila in M]
+    def __init__(self, vectores, tol=1e-10, tol_pertenencia=1e-8):
+        if not vectores:
+            raise ValueError("Se requiere al menos un vector.")
+        self.dimension = len(vectores[0])
+        if any(len(v) != self.dimension for v in vectores):
+            raise ValueError("Todos los vectores deben tener la misma dimensión")
+        self.tol = tol
+        self.tol_pertenencia = tol_pertenencia
+        self.num_vectores = len(vectores)
+        self.q = []             # base ortonormal del espacio
+        self.r = []             # r[t] = coeficientes de vectores[independientes[t]] sobre q[0..t]
+        self.independientes = []
+        for j, v in enumerate(vectores):
+            w = [float(x) for x in v]
+            norma_v = _norma2(w)
+            coefs = [0.0] * len(self.q)
+            for _ in range(2):  # dos pasadas: Gram-Schmidt "twice is enough"
+                for t, q in enumerate(self.q):
+                    c = sum(a * b for a, b in zip(q, w))
+                    coefs[t] += c
+                    w = [a - c * b for a, b in zip(w, q)]
+            norma = _norma2(w)
+            if norma <= tol * max(1.0, norma_v):
+                continue
+            self.q.append([x / norma for x in w])
+            self.r.append(coefs + [norma])
+            self.independientes.append(j)
+        self._q_np = np.array(self.q) if np is not None and self.q else None
 
-    if mostrar_pasos:
-        pasos.append({"descripcion": "Matriz A (coeficientes)", "matriz": mat_fmt(A)})
-        pasos.append({"descripcion": "Vector b", "matriz": mat_fmt([[bi] for bi in b])})
+    @property
+    def rango(self):
+        return len(self.q)
 
-    # det(A) con pasos
-    detA_res = determinante_por_gauss_con_pasos(A, mostrar_pasos)
-    detA = detA_res.get("determinante", 0.0)
-    if mostrar_pasos:
-        pasos.append({"descripcion": f"Cálculo de det(A) = {fmt(detA)}"})
-        pasos.extend(detA_res.get("pasos", []))
+    def _validar(self, v):
+        if len(v) != self.dimension:
+            raise ValueError(f"El vector debe tener dimensión {self.dimension}")
 
-    if abs(detA) < eps:
-        # mantener el contrato de la función original: no solución única
-        raise ValueError("Determinante de A es cero: no existe solución única (regla de Cramer no aplicable).")
+    def _proyectar(self, v):
+        c = [sum(a * b for a, b in zip(q, v)) for q in self.q]
+        p = [0.0] * self.dimension
+        for ct, q in zip(c, self.q):
+            if ct:
+                p = [a + ct * b for a, b in zip(p, q)]
+        return c, p
 
-    soluciones = []
-    for col in range(n):
-        Ai = [row[:] for row in A]
-        for i in range(n):
-            Ai[i][col] = b[i]
-        if mostrar_pasos:
-            pasos.append({"descripcion": f"Matriz A_{col+1} (columna {col+1} reemplazada por b)", "matriz": mat_fmt(Ai)})
-        detAi_res = determinante_por_gauss_con_pasos(Ai, mostrar_pasos)
-        detAi = detAi_res.get("determinante", 0.0)
-        if mostrar_pasos:
-            pasos.append({"descripcion": f"Cálculo de det(A_{col+1}) = {fmt(detAi)}"})
-            pasos.extend(detAi_res.get("pasos", []))
-            pasos.append({"descripcion": f"x{col+1} = det(A_{col+1}) / det(A) = {fmt(detAi)} / {fmt(detA)} = {fmt(detAi/detA)}"})
-        soluciones.append(detAi / detA)
+    def _coordenadas_desde_q(self, c):
+        # R·y = c con R triangular superior (columna t de R = self.r[t]); sustitución regresiva
+        k = len(c)
+        y = [0.0] * k
+        for t in range(k - 1, -1, -1):
+            s = c[t] - sum(self.r[u][t] * y[u] for u in range(t + 1, k))
+            y[t] = s / self.r[t][t]
+        x = [0.0] * self.num_vectores
+        for t, j in enumerate(self.independientes):
+            x[j] = y[t]
+        return x
 
-    return {
-        "soluciones": soluciones,
-        "pasos": pasos if mostrar_pasos else [],
-        "detA": detA,
-        "mensaje": "Solución por Cramer calculada correctamente."
-    }
+    def _dentro(self, v, p):
+        residuo = _norma2([a - b for a, b in zip(v, p)])
+        return residuo <= self.tol_pertenencia * max(1.0, _norma2(v))
+
+    def proyeccion(self, v):
+        """Proyección ortogonal de v sobre el espacio."""
+        self._validar(v)
+        return self._proyectar([float(x) for x in v])[1]
+
+    def contiene(self, v):
+        """True si v pertenece al espacio generado (residuo de la proyección despreciable)."""
+        self._validar(v)
+        v = [float(x) for x in v]
+        return self._dentro(v, self._proyectar(v)[1])
+
+    def coordenadas(self, v):
+        """Coeficientes x (uno por vector original) con v = Σ x_j·v_j, o None si v no está en el
+        espacio. Los vectores dependientes del conjunto reciben coeficiente 0."""
+        self._validar(v)
+        v = [float(x) for x in v]
+        c, p = self._proyectar(v)
+        if not self._dentro(v, p):
+            return None
+        return self._coordenadas_desde_q(c)
+
+    # ---- Variantes por lotes: 'consultas' es una lista de vectores ----
+    def _lote(self, consultas):
+        for v in consultas:
+            self._validar(v)
+        if self._q_np is None or not consultas:
+            pares = [self._proyectar([float(x) for x in v]) for v in consultas]
+            return [c for c, _ in pares], [p for _, p in pares]
+        V = np.array(consultas, dtype=float)
+        C = V @ self._q_np.T
+        return C.tolist(), (C @ self._q_np).tolist()
+
+    def proyeccion_lote(self, consultas):
+        return self._lote(consultas)[1]
+
+    def contiene_lote(self, consultas):
+        _, P = self._lote(consultas)
+        return [self._dentro([float(x) for x in v], p) for v, p in zip(consultas, P)]
+
+    def coordenadas_lote(self, consultas):
+        C, P = self._lote(consultas)
+        return [self._coordenadas_desde_q(c) if self._dentro([float(x) for x in v], p) else None
+                for v, c, p in zip(consultas, C, P)]
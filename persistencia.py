@@ -1,10 +1,13 @@
 import json
 import os
+from array import array
 
 ARCHIVO_MATRICES = "matriz.json"
 ARCHIVO_VECTORES = "vectores.json"
 ARCHIVO_CONJUNTOS_MATRICES = "conjuntos_matrices.json"
 ARCHIVO_ECUACIONES = "ecuaciones.json"
+ARCHIVO_MATRICES_BINARIAS = "matrices_binarias.json"
+DIRECTORIO_BINARIOS = "matrices_bin"
 
 def _cargar_todos(archivo):
     if not os.path.exists(archivo):
@@ -45,7 +48,10 @@ def cargar_todas_matrices():
 def guardar_matriz(nombre, matriz_data):
     todas_las_matrices = cargar_todas_matrices()
     todas_las_matrices[nombre] = matriz_data
-    return guardar_todas_matrices(todas_las_matrices)
+    if not guardar_todas_matrices(todas_las_matrices):
+        return False
+    eliminar_matriz_binaria(nombre)  # una copia binaria anterior con este nombre ya no corresponde
+    return True
 
 # Refactorización: actualización centralizada de matrices
 def actualizar_matriz(nombre, matriz_data):
@@ -53,7 +59,10 @@ def actualizar_matriz(nombre, matriz_data):
     if nombre not in todas_las_matrices:
         return False
     todas_las_matrices[nombre] = matriz_data
-    return guardar_todas_matrices(todas_las_matrices)
+    if not guardar_todas_matrices(todas_las_matrices):
+        return False
+    eliminar_matriz_binaria(nombre)  # la copia binaria quedó desactualizada
+    return True
 
 def cargar_matriz(nombre):
     todas_las_matrices = cargar_todas_matrices()
@@ -64,7 +73,10 @@ def eliminar_matriz(nombre):
     if nombre not in todas_las_matrices:
         return False
     del todas_las_matrices[nombre]
-    return guardar_todas_matrices(todas_las_matrices)
+    if not guardar_todas_matrices(todas_las_matrices):
+        return False
+    eliminar_matriz_binaria(nombre)
+    return True
 
 # --- Funciones para Vectores ---
 
@@ -149,4 +161,55 @@ def eliminar_ecuacion(nombre):
     if nombre not in todas:
         return False
     del todas[nombre]
-    return guardar_todas_ecuaciones(todas)
\ No newline at end of file
+    return guardar_todas_ecuaciones(todas)
+
+# --- Funciones para Matrices binarias (float64 en disco, para cálculo fuera de memoria) ---
+# Cada matriz se guarda como float64 nativo fila por fila en DIRECTORIO_BINARIOS/<nombre>.f64;
+# el índice ARCHIVO_MATRICES_BINARIAS guarda {"archivo": ruta, "n": filas, "m": columnas}.
+
+def cargar_todas_matrices_binarias():
+    return _cargar_todos(ARCHIVO_MATRICES_BINARIAS)
+
+def cargar_matriz_binaria(nombre):
+    return cargar_todas_matrices_binarias().get(nombre)
+
+def guardar_matriz_binaria(nombre, filas, n, m):
+    """Escribe las n filas (iterable de secuencias de longitud m) de una en una, sin tener la
+    matriz completa en memoria. Retorna los metadatos registrados o None si falla."""
+    os.makedirs(DIRECTORIO_BINARIOS, exist_ok=True)
+    ruta = os.path.join(DIRECTORIO_BINARIOS, f"{nombre}.f64")
+    escritas = 0
+    try:
+        with open(ruta, 'wb') as file:
+            for fila in filas:
+                fila = array('d', fila)
+                if len(fila) != m:
+                    raise ValueError(f"la fila {escritas + 1} tiene {len(fila)} columnas, se esperaban {m}")
+                fila.tofile(file)
+                escritas += 1
+        if escritas != n:
+            raise ValueError(f"se escribieron {escritas} filas, se esperaban {n}")
+    except Exception as e:
+        print(f"Error al guardar la matriz binaria {nombre}: {e}")
+        return None
+    meta = {"archivo": ruta, "n": n, "m": m}
+    todas = cargar_todas_matrices_binarias()
+    todas[nombre] = meta
+    return meta if _guardar_todos(todas, ARCHIVO_MATRICES_BINARIAS) else None
+
+def exportar_matriz_binaria(nombre):
+    """Copia una matriz guardada en ARCHIVO_MATRICES al formato binario con el mismo nombre."""
+    matriz_data = cargar_matriz(nombre)
+    if not matriz_data or not matriz_data.get('datos'):
+        return None
+    datos = matriz_data['datos']
+    return guardar_matriz_binaria(nombre, datos, len(datos), len(datos[0]))
+
+def eliminar_matriz_binaria(nombre):
+    todas = cargar_todas_matrices_binarias()
+    if nombre not in todas:
+        return False
+    meta = todas.pop(nombre)
+    if os.path.exists(meta["archivo"]):
+        os.remove(meta["archivo"])
+    return _guardar_todos(todas, ARCHIVO_MATRICES_BINARIAS)
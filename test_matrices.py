@@ -0,0 +1,757 @@
+"""test_matrices.py
+Pruebas de comportamiento de matrices.py: cada ruta rápida se compara con la implementación de
+referencia (eliminación paso a paso, aritmética con Fraction o NumPy).
+
+Uso:
+    python -m pytest -q
+"""
+
+import random
+from fractions import Fraction
+
+import pytest
+
+import matrices
+
+requiere_numpy = pytest.mark.skipif(matrices.np is None, reason="requiere NumPy")
+
+
+def _entera(n, m, semilla, lo=-9, hi=9):
+    rnd = random.Random(semilla)
+    return [[rnd.randint(lo, hi) for _ in range(m)] for _ in range(n)]
+
+
+def _real(n, m, semilla, diagonal=0.0):
+    rnd = random.Random(semilla)
+    A = [[rnd.uniform(-1, 1) for _ in range(m)] for _ in range(n)]
+    for i in range(min(n, m)):
+        A[i][i] += diagonal
+    return A
+
+
+def _cerca(x, y, tol=1e-8):
+    return abs(x - y) <= tol * max(1.0, abs(x), abs(y))
+
+
+def _matrices_cerca(X, Y, tol=1e-8):
+    return len(X) == len(Y) and all(len(fx) == len(fy) and all(_cerca(a, b, tol) for a, b in zip(fx, fy))
+                                    for fx, fy in zip(X, Y))
+
+
+# -------------------- REFERENCIAS CON FRACTION --------------------
+def _rref_fracciones(datos, num_cols):
+    """Gauss-Jordan directo sobre Fraction. Retorna (R, pivotes {col: fila})."""
+    A = [[Fraction(x) for x in fila] for fila in datos]
+    n = len(A)
+    pivotes = {}
+    fila = 0
+    for col in range(num_cols):
+        pr = next((r for r in range(fila, n) if A[r][col] != 0), None)
+        if pr is None:
+            continue
+        A[fila], A[pr] = A[pr], A[fila]
+        p = A[fila][col]
+        A[fila] = [x / p for x in A[fila]]
+        for r in range(n):
+            if r != fila and A[r][col] != 0:
+                f = A[r][col]
+                A[r] = [a - f * b for a, b in zip(A[r], A[fila])]
+        pivotes[col] = fila
+        fila += 1
+        if fila >= n:
+            break
+    return A, pivotes
+
+
+def _det_fracciones(datos):
+    A = [[Fraction(x) for x in fila] for fila in datos]
+    n = len(A)
+    det = Fraction(1)
+    for i in range(n):
+        pr = next((r for r in range(i, n) if A[r][i] != 0), None)
+        if pr is None:
+            return Fraction(0)
+        if pr != i:
+            A[i], A[pr] = A[pr], A[i]
+            det = -det
+        det *= A[i][i]
+        for r in range(i + 1, n):
+            f = A[r][i] / A[i][i]
+            A[r] = [a - f * b for a, b in zip(A[r], A[i])]
+    return det
+
+
+# -------------------- MODO EXACTO (BAREISS) --------------------
+def test_bareiss_gauss_jordan_coincide_con_fraction():
+    for semilla in range(5):
+        datos = _entera(6, 7, semilla)
+        datos[5] = [a + b for a, b in zip(datos[0], datos[1])]  # una fila dependiente
+        res = matrices.Matriz(datos).gauss_jordan(exacto=True)
+        R, pivotes = _rref_fracciones(datos, 6)
+        esperado = matrices.Matriz(datos)._solucion_desde_rref(R, pivotes, set(), [])
+        assert res["solucion"] == esperado["solucion"]
+
+
+def test_bareiss_determinante_e_inversa_exactos():
+    datos = [[Fraction(1, 3), 2, 0.5], [4, Fraction(-5, 7), 6], [7, 8, 10]]
+    datos_5 = _entera(5, 5, 11)
+    assert matrices._determinante_bareiss(datos) == _det_fracciones([[matrices._a_fraccion(x) for x in f] for f in datos])
+    assert matrices._determinante_bareiss(datos_5) == _det_fracciones(datos_5)
+    inv = matrices.Matriz(datos_5).inversa(exacto=True)["inversa"]
+    producto = [[sum(Fraction(a) * Fraction(b) for a, b in zip(fila, col)) for col in zip(*inv)] for fila in datos_5]
+    assert producto == [[int(i == j) for j in range(5)] for i in range(5)]
+
+
+# -------------------- CADENA DE PRODUCTOS --------------------
+def _producto_ingenuo(A, B):
+    return [[sum(a * b for a, b in zip(fila, col)) for col in zip(*B)] for fila in A]
+
+
+def _costo_minimo(dims, i, j):
+    """Costo óptimo de Mi..Mj probando todos los cortes (referencia exponencial)."""
+    if i == j:
+        return 0
+    return min(_costo_minimo(dims, i, s) + _costo_minimo(dims, s + 1, j) + dims[i] * dims[s + 1] * dims[j + 1]
+               for s in range(i, j))
+
+
+def test_plan_cadena_optimo_y_producto_igual_al_secuencial():
+    dims = [30, 35, 15, 5, 10, 20, 25]
+    plan = matrices.plan_cadena(dims)
+    assert plan["flops"] == _costo_minimo(dims, 0, len(dims) - 2) == 15125
+    mats = [_real(dims[i], dims[i + 1], semilla=i) for i in range(len(dims) - 1)]
+    res = matrices.multiplicar_cadena(mats, mostrar_pasos=False)
+    secuencial = mats[0]
+    for M in mats[1:]:
+        secuencial = _producto_ingenuo(secuencial, M)
+    assert _matrices_cerca(res["resultado"].to_list(), secuencial)
+
+
+# -------------------- PRODUCTO POR BLOQUES Y STRASSEN --------------------
+def test_multiplicar_bloques_coincide_con_ingenuo():
+    A = _real(70, 45, semilla=1)
+    B = _real(45, 33, semilla=2)
+    esperado = _producto_ingenuo(A, B)
+    assert _matrices_cerca(matrices.multiplicar_bloques(A, B, tam_bloque=16), esperado)
+    assert _matrices_cerca(matrices.Matriz(A).multiplicar(B).to_list(), esperado)
+
+
+def test_multiplicar_bloques_con_procesos_coincide_con_secuencial():
+    A = _real(matrices.UMBRAL_PARALELO + 3, 20, semilla=3)
+    B = _real(20, 12, semilla=4)
+    assert _matrices_cerca(matrices.multiplicar_bloques(A, B, procesos=2), matrices.multiplicar_bloques(A, B))
+
+
+def test_strassen_coincide_con_bloques_en_tamanos_impares():
+    for n in (7, 33, 70):
+        A = _real(n, n, semilla=n)
+        B = _real(n, n, semilla=n + 1)
+        assert _matrices_cerca(matrices.multiplicar_strassen(A, B, corte=8), matrices.multiplicar_bloques(A, B))
+    with pytest.raises(ValueError):
+        matrices.multiplicar_strassen(_real(3, 3, 0), _real(3, 2, 0))
+
+
+# -------------------- OPERACIONES EN LOTE --------------------
+def _lote_casos():
+    escala_chica = [[1e-5 * x for x in fila] for fila in _real(3, 3, semilla=5, diagonal=3.0)]
+    singular = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0]]
+    return [_real(3, 3, semilla=4, diagonal=3.0), escala_chica, singular]
+
+
+def _comprobar_lote(lote):
+    mats = _lote_casos()
+    invs = lote.inversas()
+    assert invs[2] is None
+    for M, inv in zip(mats[:2], invs[:2]):
+        assert _matrices_cerca(inv, matrices.Matriz(M).inversa(mostrar_pasos=True)["valores"], 1e-6)
+    aumentadas = matrices.LoteMatrices([[f + [1.0] for f in M] for M in mats])
+    sols = aumentadas.resolver()
+    assert sols[2] is None
+    for M, x in zip(mats[:2], sols[:2]):
+        assert _matrices_cerca([x], [matrices._resolver_numerico(M, [1.0] * 3)], 1e-6)
+    sumas = lote.suma().to_list()
+    assert _matrices_cerca(sumas, [[sum(M[i][j] for M in mats) for j in range(3)] for i in range(3)])
+
+
+@requiere_numpy
+def test_lote_vectorizado_escala_chica_y_singular():
+    _comprobar_lote(matrices.LoteMatrices(_lote_casos()))
+
+
+def test_lote_python_puro_escala_chica_y_singular(monkeypatch):
+    monkeypatch.setattr(matrices, "np", None)
+    _comprobar_lote(matrices.LoteMatrices(_lote_casos()))
+
+
+# -------------------- ESTRUCTURA Y SOLVERS ESPECIALIZADOS --------------------
+def _con_estructura(tipo, n, semilla):
+    A = _real(n, n, semilla)
+    for i in range(n):
+        for j in range(n):
+            fuera = {"diagonal": i != j, "triangular_superior": i > j, "triangular_inferior": i < j,
+                     "tridiagonal": abs(i - j) > 1, "banda": j - i > 2 or i - j > 1}.get(tipo, False)
+            if fuera:
+                A[i][j] = 0.0
+    if tipo == "simetrica":
+        A = [[sum(a * b for a, b in zip(fi, fj)) for fj in A] for fi in A]
+    for i in range(n):
+        A[i][i] += 4.0
+    return A
+
+
+def test_solvers_estructurados_coinciden_con_eliminacion_densa():
+    n = 12
+    for tipo in ("diagonal", "triangular_superior", "triangular_inferior", "tridiagonal", "banda", "simetrica"):
+        A = _con_estructura(tipo, n, semilla=len(tipo))
+        b = [float(i + 1) for i in range(n)]
+        est = matrices.analizar_estructura(A)
+        assert est["tipo"] == tipo
+        X, metodo = matrices._resolver_estructurado(A, [[v] for v in b], est)
+        assert metodo is not None
+        assert _matrices_cerca([[x[0] for x in X]], [matrices._resolver_numerico(A, b)])
+        det, _ = matrices._determinante_estructurado(A, est)
+        assert _cerca(det, float(_det_fracciones(A)), 1e-8)
+
+
+def test_estructura_no_depende_de_la_escala():
+    n = 6
+    A = _real(n, n, semilla=31, diagonal=2.0)
+    det = float(_det_fracciones(A))
+    inv = matrices.Matriz(A).inversa(mostrar_pasos=False)["valores"]
+    X = matrices.Matriz(A).resolver_multiple(_real(n, 2, semilla=32))["valores"]
+    for escala in (1e-12, 1e-13):
+        S = [[escala * x for x in fila] for fila in A]
+        assert matrices.analizar_estructura(S)["tipo"] == "densa"
+        assert _cerca(matrices.determinante_por_gauss(S), escala ** n * det, 1e-8 * escala ** n)
+        for mostrar_pasos in (False, True):
+            res = matrices.Matriz(S).inversa(mostrar_pasos=mostrar_pasos)
+            assert _matrices_cerca([[escala * x for x in fila] for fila in res["valores"]], inv)
+        B = [[escala * x for x in fila] for fila in _real(n, 2, semilla=32)]
+        assert _matrices_cerca(matrices.Matriz(S).resolver_multiple(B)["valores"], X)
+    # Una entrada pequeña frente a las demás sí es un cero estructural
+    T = [[1.0 if i == j else (0.5 if j == i + 1 else 0.0) for j in range(n)] for i in range(n)]
+    T[n - 1][0] = 1e-14
+    assert matrices.analizar_estructura(T)["tipo"] == "triangular_superior"
+
+
+def test_gauss_jordan_estructurado_solo_desde_el_umbral():
+    n = matrices.UMBRAL_ESTRUCTURA
+    A = _con_estructura("tridiagonal", n, semilla=1)
+    datos = [fila + [1.0] for fila in A]
+    grande = matrices.Matriz(datos).gauss_jordan()
+    densa = matrices.Matriz(datos).gauss_jordan(especializado=False)
+    assert "Thomas" in grande["metodo"] or "banda" in grande["metodo"]
+    assert grande["solucion"] == densa["solucion"]
+    chica = matrices.Matriz([fila[:5] + [1.0] for fila in A[:5]]).gauss_jordan()
+    assert chica["metodo"] == "eliminación densa (Gauss-Jordan)"
+
+
+# -------------------- MÉTODOS ITERATIVOS --------------------
+def test_iterativos_coinciden_con_eliminacion_directa():
+    n = 15
+    A = _con_estructura("simetrica", n, semilla=2)
+    for i in range(n):
+        A[i][i] += sum(abs(x) for x in A[i])  # diagonalmente dominante y SPD: todos convergen
+    b = [float((-1) ** i) for i in range(n)]
+    directa = matrices._resolver_numerico(A, b)
+    filas = matrices.a_filas_dispersas(A)
+    for metodo in matrices.METODOS_ITERATIVOS:
+        res = matrices.resolver_iterativo(filas, b, metodo, tol=1e-12)
+        assert res["convergio"] and not res["diverge"]
+        assert _matrices_cerca([res["x"]], [directa], 1e-9)
+
+
+def test_iterativo_divergente_se_detiene_sin_formatear_inf():
+    datos = [[1.0, 3.0, 1.0], [3.0, 1.0, 1.0]]  # no diagonalmente dominante: Jacobi diverge
+    res = matrices.Matriz(datos).jacobi(max_iter=5000)
+    assert res["diverge"] and res["solucion"] == {}
+    assert res["iteraciones"] < 5000
+
+
+# -------------------- MATRIZ DISPERSA --------------------
+def _rala(n, semilla, por_fila=3):
+    rnd = random.Random(semilla)
+    A = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        for j in rnd.sample(range(n), por_fila):
+            A[i][j] = rnd.uniform(-1, 1)
+        A[i][i] = 4.0
+    return A
+
+
+def test_eliminacion_dispersa_coincide_con_densa():
+    n = matrices.UMBRAL_DISPERSO
+    A = _rala(n, semilla=7)
+    datos = [fila + [float(i % 5)] for i, fila in enumerate(A)]
+    dispersa = matrices.como_matriz(datos)
+    assert isinstance(dispersa, matrices.MatrizDispersa)
+    assert isinstance(matrices.como_matriz(datos[:5]), matrices.Matriz)
+    res = dispersa.gauss()
+    assert res["solucion"] == matrices.Matriz(datos).gauss(especializado=False)["solucion"]
+    x = [float(res["solucion"][v]) for v in dispersa.variables[:n]]
+    assert _matrices_cerca([x], [matrices._resolver_numerico(A, [f[-1] for f in datos])], 1e-3)
+    assert _matrices_cerca((dispersa * Fraction(1, 2)).to_list(), (Fraction(1, 2) * dispersa).to_list())
+
+
+def test_independencia_dispersa_coincide_con_densa():
+    vectores = _entera(5, 6, semilla=3)
+    vectores.append([a - 2 * b for a, b in zip(vectores[0], vectores[3])])
+    vectores.append([0] * 6)
+    densa = matrices.Matriz([[v[r] for v in vectores] for r in range(6)])
+    esperada = densa.independencia_vectores(vectores, mostrar_pasos=False)["solucion"]
+    obtenida = matrices.MatrizDispersa(vectores).independencia_vectores(vectores, mostrar_pasos=False)["solucion"]
+    assert obtenida.keys() == esperada.keys()
+    assert obtenida["rango"] == esperada["rango"] == 5
+    for x in obtenida["base_nula"]:
+        assert all(abs(sum(c * v[r] for c, v in zip(x, vectores))) < 1e-9 for r in range(6))
+    vacio = matrices.MatrizDispersa([[0.0]]).independencia_vectores([], mostrar_pasos=False)["solucion"]
+    assert vacio["independiente"] and vacio["dependencias"] == [] and vacio["base_nula"] == []
+
+
+# -------------------- CACHÉ CON ACTUALIZACIONES DE BAJO RANGO --------------------
+def test_woodbury_coincide_con_inversa_y_determinante_desde_cero():
+    n = 12
+    A = _real(n, n, semilla=8, diagonal=4.0)
+    cache = matrices.CacheFactorizaciones()
+    cache.registrar("A", A, matrices._inversa_numerica(A), float(_det_fracciones(A)))
+    for filas in ([3], [0, 7], [2, 5, 9]):
+        A = [fila[:] for fila in A]
+        for i in filas:
+            A[i] = [x + 0.25 * (j % 3) for j, x in enumerate(A[i])]
+        res = cache.inversa("A", A)
+        assert res["metodo"].endswith(f"(rango {len(filas)})")
+        assert _matrices_cerca(res["valores"], matrices._inversa_numerica(A), 1e-8)
+        assert _cerca(res["determinante"], float(_det_fracciones(A)), 1e-8)
+    det = cache.determinante("A", A)
+    assert "sin cambios" in det["metodo"] and _cerca(det["determinante"], float(_det_fracciones(A)), 1e-8)
+    # Demasiadas filas cambiadas: la caché se descarta y el llamador refactoriza
+    assert cache.inversa("A", [[x + 1.0 for x in fila] for fila in A]) is None
+    assert cache.determinante("A", A) is None
+
+
+# -------------------- INDEPENDENCIA INCREMENTAL --------------------
+def test_rastreador_coincide_con_rref_de_cada_prefijo():
+    vectores = _entera(4, 6, semilla=9)
+    vectores.insert(2, [a + 3 * b for a, b in zip(vectores[0], vectores[1])])
+    vectores.append([2 * a - b for a, b in zip(vectores[3], vectores[4])])
+    r = matrices.RastreadorIndependencia(6)
+    for k, v in enumerate(vectores, start=1):
+        if k == 4:
+            r = matrices.RastreadorIndependencia.desde_dict(r.a_dict())
+        res = r.agregar(v)
+        columnas = [[u[i] for u in vectores[:k]] for i in range(6)]
+        _, pivotes = _rref_fracciones(columnas, k)
+        assert res["rango"] == len(pivotes)
+        assert res["dependiente"] == (k - 1 not in pivotes)
+        if res["dependiente"]:
+            combinacion = [sum(c * vectores[j][i] for j, c in res["coeficientes"].items()) for i in range(6)]
+            assert _matrices_cerca([combinacion], [v], 1e-9)
+
+
+# -------------------- RELACIONES DE DEPENDENCIA --------------------
+def test_dependencias_coinciden_con_rref_y_mensaje_las_formatea():
+    vectores = _entera(3, 5, semilla=12)
+    vectores.append([a - b for a, b in zip(vectores[0], vectores[2])])
+    columnas = [[v[i] for v in vectores] for i in range(5)]
+    res = matrices.Matriz(columnas).independencia_vectores(vectores, mostrar_pasos=False)
+    R, pivotes = _rref_fracciones(columnas, 4)
+    esperado = matrices._solucion_independencia(R, pivotes, [3], 4)
+    (dep,) = res["solucion"]["dependencias"]
+    assert dep["vector"] == 4 and dep["coeficientes"].keys() == {1, 3}
+    assert _cerca(dep["coeficientes"][1], 1) and _cerca(dep["coeficientes"][3], -1)
+    assert esperado["base_nula"] == [[-1, 0, 1, 1]]
+    assert _matrices_cerca(res["solucion"]["base_nula"], esperado["base_nula"])
+    assert "v4 = (1)·v1 + (-1)·v3" in res["mensaje"]
+    vacio = matrices.Matriz([[1]]).independencia_vectores([], mostrar_pasos=False)["solucion"]
+    assert vacio == matrices.dependencias_vectores([])
+
+
+# -------------------- ESPACIO GENERADO --------------------
+def _coordenadas_fracciones(vectores, b):
+    """Solución de Σ x_j·v_j = b por RREF con Fraction (libres = 0), o None si es incompatible."""
+    k = len(vectores)
+    aumentada = [[v[i] for v in vectores] + [b[i]] for i in range(len(b))]
+    R, pivotes = _rref_fracciones(aumentada, k + 1)
+    if k in pivotes:
+        return None
+    x = [Fraction(0)] * k
+    for c, fila in pivotes.items():
+        x[c] = R[fila][k]
+    return x
+
+
+def _comprobar_espacio(espacio, vectores, consultas):
+    esperadas = [_coordenadas_fracciones(vectores, b) for b in consultas]
+    for obtenida, b, x in zip(espacio.coordenadas_lote(consultas), consultas, esperadas):
+        assert espacio.contiene(b) == (x is not None)
+        assert (obtenida is None) == (x is None) and (espacio.coordenadas(b) is None) == (x is None)
+        if x is not None:
+            assert _matrices_cerca([obtenida, espacio.coordenadas(b)], [x, x], 1e-9)
+            assert _matrices_cerca([espacio.proyeccion(b)], [b], 1e-9)
+
+
+def test_espacio_generado_coincide_con_eliminacion_exacta(monkeypatch):
+    vectores = _entera(3, 5, semilla=16)
+    vectores.insert(1, [2 * a for a in vectores[0]])
+    combinacion = [a - 3 * b + c for a, b, c in zip(vectores[0], vectores[2], vectores[3])]
+    consultas = [combinacion, _entera(1, 5, semilla=17)[0], [0] * 5]
+    espacio = matrices.EspacioGenerado(vectores)
+    assert espacio.rango == 3 and espacio.independientes == [0, 2, 3]
+    _comprobar_espacio(espacio, vectores, consultas)
+    monkeypatch.setattr(matrices, "np", None)
+    _comprobar_espacio(matrices.EspacioGenerado(vectores), vectores, consultas)
+
+
+# -------------------- ARITMÉTICA MULTIMODULAR --------------------
+def test_determinante_crt_coincide_con_fraction_incluso_con_entradas_enormes():
+    for datos in (_entera(6, 6, semilla=13), _entera(4, 4, semilla=14, lo=-10**200, hi=10**200),
+                  [[Fraction(1, 3), 2, 5], [7, Fraction(-2, 9), 1], [4, 4, Fraction(5, 2)]]):
+        assert matrices.determinante_modular(datos)["determinante"] == _det_fracciones(datos)
+
+
+def _dependencias_fracciones(vectores):
+    k = len(vectores)
+    columnas = [[v[i] for v in vectores] for i in range(len(vectores[0]))]
+    R, pivotes = _rref_fracciones(columnas, k)
+    return matrices._solucion_independencia(R, pivotes, [c for c in range(k) if c not in pivotes], k, tol=0)
+
+
+def test_independencia_modular_coincide_con_fraction_y_respaldo_bareiss(monkeypatch):
+    vectores = _entera(4, 6, semilla=15, lo=-10**30, hi=10**30)
+    vectores.append([3 * a - 7 * b + c for a, b, c in zip(*vectores[:3])])
+    vectores.append([Fraction(a, 5) - Fraction(b, 3) for a, b in zip(vectores[1], vectores[3])])
+    esperado = _dependencias_fracciones(vectores)
+    assert matrices.independencia_modular(vectores) == esperado
+    # Si la reconstrucción racional falla se recurre a la RREF exacta de Bareiss
+    monkeypatch.setattr(matrices, "_reconstruccion_racional", lambda a, mod: None)
+    assert matrices.independencia_modular(vectores) == esperado
+
+
+# -------------------- MÍNIMOS CUADRADOS --------------------
+def test_minimos_cuadrados_qr_coincide_con_ecuaciones_normales_exactas():
+    A = _entera(20, 5, semilla=18)
+    b = _entera(1, 20, semilla=19)[0]
+    normales = [[sum(Fraction(f[i]) * f[j] for f in A) for j in range(5)]
+                + [sum(Fraction(f[i]) * bi for f, bi in zip(A, b))] for i in range(5)]
+    R, pivotes = _rref_fracciones(normales, 5)
+    esperado = [R[pivotes[j]][5] for j in range(5)]
+    modos = [False] + ([True] if matrices.np is not None else [])
+    for vectorizado in modos:
+        res = matrices.minimos_cuadrados(A, b, vectorizado=vectorizado)
+        assert res["rango"] == 5
+        assert _matrices_cerca([res["x"]], [esperado], 1e-9)
+    # Rango deficiente: el residuo sigue siendo ortogonal a las columnas de A
+    deficiente = [f + [f[0] - f[1]] for f in A]
+    for vectorizado in modos:
+        res = matrices.minimos_cuadrados(deficiente, b, vectorizado=vectorizado)
+        assert res["rango"] == 5
+        assert all(abs(sum(f[j] * r for f, r in zip(deficiente, res["residuo"]))) < 1e-8 for j in range(6))
+        x = res["x"]
+        residuo = [bi - sum(a * xj for a, xj in zip(f, esperado)) for f, bi in zip(A, b)]
+        assert _cerca(res["norma_residuo"], float(sum(r * r for r in residuo)) ** 0.5, 1e-9)
+        assert sum(1 for v in x if v == 0.0) == 1
+
+
+# -------------------- FÓRMULAS CERRADAS (n <= 4) --------------------
+def test_formulas_cerradas_coinciden_con_eliminacion_a_cualquier_escala():
+    for n in range(1, matrices.N_PEQUENA + 1):
+        base = _real(n, n, semilla=20 + n, diagonal=2.0)
+        singular = [fila[:] for fila in base]
+        singular[-1] = [2 * x for x in singular[0]] if n > 1 else [0.0]
+        for escala in (1.0, 1e-5, 1e-9, 1e7):
+            for M in (base, singular):
+                A = [[escala * x for x in fila] for fila in M]
+                b = [escala * (i + 1) for i in range(n)]
+                rapida = matrices.Matriz(A).inversa(mostrar_pasos=False)
+                general = matrices.Matriz(A).inversa(mostrar_pasos=True)
+                assert (rapida["inversa"] is None) == (general["inversa"] is None) == (M is singular)
+                if M is base:
+                    assert rapida["metodo"] == "adjunta (fórmula cerrada)"
+                    assert _matrices_cerca(rapida["valores"], general["valores"], 1e-8)
+                det = matrices.determinante_por_gauss(A)
+                con_pasos = matrices.determinante_por_gauss_con_pasos(A, mostrar_pasos=True)["determinante"]
+                assert (det == 0.0) == (con_pasos == 0.0) == (M is singular)
+                assert _cerca(det, con_pasos, 1e-8) or det == con_pasos == 0.0
+                aumentada = matrices.Matriz([f + [bi] for f, bi in zip(A, b)])
+                cerrada = aumentada.cramer(mostrar_pasos=False)
+                if M is singular:
+                    assert cerrada["solucion"] == "Sin solución única"
+                    with pytest.raises(ValueError):
+                        matrices.cramer_con_pasos(A, b, mostrar_pasos=True)
+                else:
+                    x = matrices.cramer_con_pasos(A, b, mostrar_pasos=True)["soluciones"]
+                    assert _matrices_cerca([matrices.cramer(A, b)], [x], 1e-8)
+
+
+# -------------------- EXPRESIONES PEREZOSAS --------------------
+def test_expresion_perezosa_coincide_con_operadores_inmediatos():
+    A, B, C = (matrices.Matriz(_real(6, 6, semilla=s)) for s in (21, 22, 23))
+    D = matrices.Matriz(_real(6, 4, semilla=24))
+    for perezosa, inmediata in [
+        (A.perezosa() + B - C + 2 * A - B, A + B - C + 2 * A - B),
+        (A.perezosa() - A, A - A),
+        (0.5 * (A.perezosa() @ B) - C + A - 3 * B, (A @ B) * 0.5 - C + A - B * 3),
+        ((A.perezosa() + B) @ D - 2 * (C.perezosa() @ D), (A + B) @ D - (C @ D) * 2),
+    ]:
+        assert _matrices_cerca(perezosa.evaluar().to_list(), inmediata.to_list(), 1e-12)
+    # Con Fraction el resultado sigue siendo exacto
+    F = matrices.Matriz([[Fraction(1, 3), Fraction(2, 7)], [1, Fraction(-5, 2)]])
+    G = matrices.Matriz([[Fraction(1, 6), 2], [Fraction(3, 4), 0]])
+    res = (F.perezosa() + G - 3 * F.perezosa() - G + 2 * G.perezosa()).evaluar().to_list()
+    assert res == [[-2 * f + 2 * g for f, g in zip(*filas)] for filas in zip(F.to_list(), G.to_list())]
+    assert all(type(x) is Fraction for fila in res for x in fila if x != int(x))
+
+
+# -------------------- VISTAS SIN COPIA --------------------
+def test_vistas_coinciden_con_copias_y_ven_los_cambios_de_la_base():
+    datos = _entera(5, 6, semilla=25)
+    M = matrices.Matriz(datos)
+    T = [list(col) for col in zip(*datos)]
+    assert M.vista_traspuesta().a_listas() == T == M.trasponer().to_list()
+    filas, columnas = [4, 0, 2], range(1, 5)
+    sub = M.vista(filas, columnas)
+    assert sub.a_listas() == [[datos[i][j] for j in columnas] for i in filas]
+    assert sub.traspuesta().traspuesta().a_listas() == sub.a_listas()
+    assert sub.traspuesta().a_listas() == [list(c) for c in zip(*sub.a_listas())]
+    assert M.vista_traspuesta().traspuesta().a_listas() == datos
+    assert M.coeficientes().a_listas() == [f[:-1] for f in datos]
+    assert list(matrices.columna(M, -1)) == [f[-1] for f in datos]
+    # Los algoritmos aceptan vistas y dan lo mismo que con la copia materializada
+    cuadrada = M.vista(range(5), range(5))
+    assert matrices.determinante_por_gauss(cuadrada) == matrices.determinante_por_gauss(cuadrada.a_listas())
+    assert _matrices_cerca(matrices.multiplicar_bloques(sub, M.vista_traspuesta()),
+                           _producto_ingenuo(sub.a_listas(), T))
+    # Sin copia: escribir en la base se ve en la vista; materializar sí copia
+    copia = sub.materializar()
+    M.A[4][1] = 100
+    assert sub[0][0] == 100 and copia.A[0][0] == datos[4][1]
+    with pytest.raises(ValueError):
+        M.vista([], columnas)
+
+
+# -------------------- REPRESENTACIÓN COMPACTA --------------------
+def test_buffer_plano_conserva_valores_y_exactitud():
+    datos = _real(4, 5, semilla=26)
+    M = matrices.Matriz(datos)
+    assert isinstance(M._datos, matrices.array) and not hasattr(M, "__dict__")
+    assert M.to_list() == datos and M.A[2][3] == datos[2][3]
+    M.A[2][3] = 7.5  # escribir por A modifica el buffer
+    assert M._datos[2 * 5 + 3] == 7.5 and M.to_list()[2][3] == 7.5
+    # Enteros enormes y Fraction no caben en un double: lista plana exacta
+    enorme = matrices.Matriz([[2 ** 60 + 1, 1], [3, Fraction(1, 3)]])
+    assert not isinstance(enorme._datos, matrices.array)
+    assert enorme.to_list() == [[2 ** 60 + 1, 1], [3, Fraction(1, 3)]]
+    assert matrices.determinante_por_gauss(matrices.Matriz([[2 ** 60 + 1, 1], [3, 1]]).A, exacto=True) == 2 ** 60 - 2
+    # Los resultados con el buffer coinciden con la referencia sobre listas
+    enteros = _entera(4, 5, semilla=27)
+    res = matrices.Matriz(enteros).gauss_jordan(exacto=True)
+    R, pivotes = _rref_fracciones(enteros, 4)
+    assert res["solucion"] == matrices.Matriz(enteros)._solucion_desde_rref(R, pivotes, set(), [])["solucion"]
+
+
+# -------------------- OPERACIONES EN SITIO --------------------
+def _comprobar_en_sitio():
+    A = matrices.Matriz(_real(5, 5, semilla=28))
+    B = matrices.Matriz(_real(5, 5, semilla=29))
+    C = matrices.Matriz(_real(5, 3, semilla=30))
+    suma, resta, producto = (A + B).to_list(), (A - B).to_list(), (A @ B).to_list()
+    X = matrices.Matriz(A.to_list())
+    buffer = X._datos
+    X += B
+    assert X._datos is buffer and _matrices_cerca(X.to_list(), suma, 1e-12)
+    X -= B
+    assert _matrices_cerca(X.to_list(), A.to_list(), 1e-12)
+    X @= B
+    assert X._datos is buffer and _matrices_cerca(X.to_list(), producto, 1e-12)
+    Y = matrices.Matriz(B.to_list())
+    A.restar_en(Y, Y)  # la salida puede ser el segundo operando
+    assert _matrices_cerca(Y.to_list(), resta, 1e-12)
+    out = matrices.Matriz([[0.0] * 3 for _ in range(5)])
+    A.multiplicar_en(out, C)
+    assert _matrices_cerca(out.to_list(), (A @ C).to_list(), 1e-12)
+    with pytest.raises(ValueError):
+        A.multiplicar_en(A, B)
+    X @= C  # cambia la forma: 5x5 -> 5x3
+    assert (X.n, X.m) == (5, 3) and _matrices_cerca(X.to_list(), (matrices.Matriz(producto) @ C).to_list(), 1e-12)
+    F = matrices.Matriz([[Fraction(1, 3), 1], [2, Fraction(1, 7)]])
+    F += matrices.Matriz([[Fraction(1, 6), 1], [0, 1]])
+    assert F.to_list() == [[Fraction(1, 2), 2], [2, Fraction(8, 7)]]
+
+
+@requiere_numpy
+def test_operaciones_en_sitio_coinciden_con_las_inmediatas():
+    _comprobar_en_sitio()
+
+
+def test_operaciones_en_sitio_python_puro(monkeypatch):
+    monkeypatch.setattr(matrices, "np", None)
+    _comprobar_en_sitio()
+
+
+# -------------------- POTENCIAS Y POLINOMIOS --------------------
+def test_potencia_y_polinomio_coinciden_con_productos_repetidos():
+    datos = _entera(4, 4, semilla=31, lo=-3, hi=3)
+    datos[0][0] += 10  # invertible
+    A = matrices.Matriz(datos)
+    identidad = [[int(i == j) for j in range(4)] for i in range(4)]
+    potencias = [identidad]
+    for _ in range(13):
+        potencias.append(_producto_ingenuo(potencias[-1], datos))
+    for k in (0, 1, 2, 5, 8, 13):
+        res = A.potencia(k)
+        assert _matrices_cerca(res["resultado"].to_list(), potencias[k], 1e-12)
+        assert res["productos"] <= 2 * max(k, 1).bit_length()
+    inv = matrices._inversa_numerica(datos)
+    assert _matrices_cerca(A.potencia(-3)["resultado"].to_list(), _producto_ingenuo(_producto_ingenuo(inv, inv), inv), 1e-9)
+    with pytest.raises(ValueError):
+        matrices.Matriz([[1.0, 2.0], [2.0, 4.0]]).potencia(-1)
+    coefs = [2, -1, 0, 3, 5]
+    directo = [[sum(c * potencias[len(coefs) - 1 - t][i][j] for t, c in enumerate(coefs)) for j in range(4)] for i in range(4)]
+    res = A.polinomio(coefs)
+    assert res["productos"] == len(coefs) - 2
+    assert _matrices_cerca(res["resultado"].to_list(), directo, 1e-12)
+
+
+# -------------------- PRECISIÓN MIXTA --------------------
+@requiere_numpy
+def test_precision_mixta_coincide_con_float64_y_detecta_singulares():
+    n = 60
+    A = _real(n, n, semilla=32, diagonal=float(n))
+    b = [float(i % 7 - 3) for i in range(n)]
+    res = matrices.resolver_precision_mixta(A, b)
+    assert res["precision"] == "mixta" and res["residuos"][-1] <= n ** 0.5 * 2.0 ** -52
+    assert _matrices_cerca([res["x"]], [matrices.np.linalg.solve(A, b).tolist()], 1e-10)
+    # Mal condicionada: se resuelve directamente en float64
+    hilbert = [[1.0 / (i + j + 1) for j in range(8)] for i in range(8)]
+    res = matrices.resolver_precision_mixta(hilbert, [1.0] * 8)
+    assert res["precision"] == "doble"
+    assert _matrices_cerca([res["x"]], [matrices._resolver_numerico(hilbert, [1.0] * 8)], 1e-5)
+    # Singular (también numéricamente, a cualquier escala): sin solución
+    for escala in (1.0, 1e-8):
+        singular = [[escala * x for x in fila] for fila in ([1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0])]
+        assert matrices.resolver_precision_mixta(singular, [1.0, 2.0, 3.0])["x"] is None
+    aumentada = matrices.Matriz([f + [1.0] for f in ([1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0])])
+    assert aumentada._resolver_precision_mixta("mixta") is None
+
+
+# -------------------- SALUD NUMÉRICA --------------------
+def _cond1_exacta(datos):
+    n = len(datos)
+    aumentada = [list(f) + [int(i == j) for j in range(n)] for i, f in enumerate(datos)]
+    R, _ = _rref_fracciones(aumentada, n)
+    inv = [f[n:] for f in R]
+    return float(matrices._norma1(datos) * matrices._norma1([[abs(x) for x in f] for f in inv]))
+
+
+def test_estimacion_de_condicion_coincide_con_la_exacta():
+    for datos in (_entera(6, 6, semilla=33), [[1, 1, 1], [1, 2, 4], [1, 3, 9.000001]]):
+        n = len(datos)
+        exacta = _cond1_exacta(datos)
+        res = matrices.Matriz([list(f) + [1.0] for f in datos]).gauss_jordan(especializado=False)
+        estimada = res["salud"]["condicion"]
+        assert exacta / 3 <= estimada <= exacta * (1 + 1e-6)  # Hager: cota inferior, casi siempre exacta
+        assert _cerca(matrices.Matriz(datos).inversa(mostrar_pasos=True)["salud"]["condicion"], exacta, 1e-6)
+        assert res["salud"]["error_atras"] <= 10 * n * 2.0 ** -52
+    casi_singular = matrices.Matriz([[1.0, 1.0, 1.0], [1.0, 1.0 + 3e-10, 1.0], [0.0, 1.0, 2.0]])
+    salud = casi_singular.inversa(mostrar_pasos=True)["salud"]
+    assert salud["condicion"] >= matrices.COND_ADVERTENCIA and "casi singular" in salud["advertencia"]
+
+
+# -------------------- ELIMINACIÓN FUERA DE MEMORIA --------------------
+@requiere_numpy
+def test_fuera_de_memoria_coincide_con_la_eliminacion_densa(tmp_path, monkeypatch):
+    import crud
+    import persistencia
+    monkeypatch.chdir(tmp_path)
+    n = 40
+    A = _real(n, n, semilla=34, diagonal=4.0)
+    datos = [f + [float(i % 3)] for i, f in enumerate(A)]
+    meta = persistencia.guardar_matriz_binaria("sistema", datos, n, n + 1)
+    res = matrices.resolver_fuera_de_memoria(meta["archivo"], n, tam_panel=7)
+    assert _matrices_cerca([res["x"]], [matrices._resolver_numerico(A, [f[-1] for f in datos])], 1e-9)
+    # Singular y también numéricamente singular a escala chica: sin solución, como la ruta densa
+    for escala in (1.0, 1e-9):
+        singular = [[escala * x for x in f] for f in datos]
+        singular[-1] = [a + b for a, b in zip(singular[0], singular[1])]
+        persistencia.guardar_matriz_binaria("singular", singular, n, n + 1)
+        assert matrices.resolver_fuera_de_memoria(persistencia.cargar_matriz_binaria("singular")["archivo"],
+                                                  n, tam_panel=7)["x"] is None
+        assert matrices._resolver_numerico([f[:-1] for f in singular], [f[-1] for f in singular]) is None
+    # crud.resolver_matriz usa la copia binaria (o exporta los sistemas grandes) y la descarta al actualizar
+    monkeypatch.setattr(matrices, "UMBRAL_FUERA_DE_MEMORIA", n)
+    crud.crear_matriz("grande", n, n + 1, datos)
+    res = crud.resolver_matriz("grande")
+    assert "tam_panel" in res and persistencia.cargar_matriz_binaria("grande") is not None
+    assert _matrices_cerca([res["x"]], [matrices._resolver_numerico(A, [f[-1] for f in datos])], 1e-9)
+    crud.actualizar_matriz("grande", datos[:3], 3, n + 1)
+    assert persistencia.cargar_matriz_binaria("grande") is None
+    # Borrar desde persistencia (como la GUI), volver a crear con otros datos y resolver: nada de la
+    # copia binaria anterior sobrevive
+    persistencia.guardar_matriz("grande", {"nombre": "grande", "filas": n, "columnas": n + 1, "datos": datos})
+    archivo = crud.resolver_matriz("grande") and persistencia.cargar_matriz_binaria("grande")["archivo"]
+    assert persistencia.eliminar_matriz("grande")
+    assert persistencia.cargar_matriz_binaria("grande") is None and not (tmp_path / archivo).exists()
+    otros = [f[:-1] + [1.0] for f in datos]
+    crud.crear_matriz("grande", n, n + 1, otros)
+    res = crud.resolver_matriz("grande")
+    assert _matrices_cerca([res["x"]], [matrices._resolver_numerico(A, [1.0] * n)], 1e-9)
+    # guardar_matriz también descarta una copia binaria vieja aunque no se resuelva otra vez
+    persistencia.guardar_matriz("grande", {"nombre": "grande", "filas": n, "columnas": n + 1, "datos": datos})
+    assert persistencia.cargar_matriz_binaria("grande") is None
+
+
+# -------------------- ELIMINACIÓN PARALELA --------------------
+@requiere_numpy
+def test_lu_paralela_coincide_con_numpy_y_rechaza_singulares():
+    n = 150
+    A = _real(n, n, semilla=35, diagonal=3.0)
+    B = _real(n, 4, semilla=36)
+    X, F = matrices.resolver_paralelo(A, B, hilos=3, nb=16)
+    assert _matrices_cerca(X.tolist(), matrices.np.linalg.solve(A, B).tolist(), 1e-9)
+    assert _cerca(F["signo"] * float(matrices.np.prod(matrices.np.diag(F["LU"]))), float(matrices.np.linalg.det(A)), 1e-8)
+    for escala in (1.0, 1e-9):
+        singular = [[escala * x for x in f] for f in A]
+        singular[-1] = [a - b for a, b in zip(singular[0], singular[1])]
+        assert matrices.resolver_paralelo(singular, B, hilos=3, nb=16) == (None, None)
+
+
+@requiere_numpy
+def test_gauss_jordan_elige_una_sola_ruta_para_sistemas_grandes():
+    n = max(matrices.UMBRAL_ELIMINACION_PARALELA, matrices.UMBRAL_PRECISION_MIXTA)
+    datos = [f + [1.0] for f in _real(n, n, semilla=37, diagonal=float(n))]
+    M = matrices.Matriz(datos)
+    paralela = M.gauss_jordan(especializado=False, precision="auto", hilos=2)
+    assert paralela["metodo"].startswith("LU paralela")
+    assert M.gauss_jordan(especializado=False, hilos=2)["metodo"] == paralela["metodo"]
+    assert M.gauss_jordan(especializado=False, precision="auto")["precision"] == "mixta"
+    assert M.gauss_jordan(especializado=False, precision="mixta", hilos=2)["precision"] == "mixta"
+    x = matrices.np.linalg.solve([f[:-1] for f in datos], [1.0] * n)
+    assert paralela["solucion"] == {v: M._format_number(xi) for v, xi in zip(M.variables, x)}
+
+
+# -------------------- VARIOS LADOS DERECHOS --------------------
+def test_resolver_multiple_coincide_con_cada_columna_por_separado(monkeypatch):
+    n = 8
+    A = _real(n, n, semilla=38, diagonal=3.0)
+    B = _real(n, 3, semilla=39)
+    por_columna = [matrices._resolver_numerico(A, [f[j] for f in B]) for j in range(3)]
+    M = matrices.Matriz(A)
+    for mostrar_pasos in (False, True):
+        res = M.resolver_multiple(B, mostrar_pasos=mostrar_pasos)
+        assert _matrices_cerca([list(c) for c in zip(*res["valores"])], por_columna, 1e-9)
+        assert res["soluciones"] == [matrices.Matriz([f + [f2[j]] for f, f2 in zip(A, B)]).gauss_jordan(
+            especializado=False)["solucion"] for j in range(3)]
+    monkeypatch.setattr(matrices, "np", None)
+    aumentada = matrices.Matriz([fa + fb for fa, fb in zip(A, B)])
+    assert _matrices_cerca([list(c) for c in zip(*aumentada.resolver_multiple()["valores"])], por_columna, 1e-9)
+    # A singular: cada columna se clasifica por separado (compatible con infinitas soluciones o sin solución)
+    singular = [f[:] for f in A]
+    singular[-1] = [a + b for a, b in zip(singular[0], singular[1])]
+    compatible = [f[:] for f in B]
+    compatible[-1] = [a + b for a, b in zip(compatible[0], compatible[1])]
+    Bmix = [[c[0], b[1]] for c, b in zip(compatible, B)]
+    res = matrices.Matriz(singular).resolver_multiple(Bmix)
+    assert res["valores"] is None
+    for j, sol in enumerate(res["soluciones"]):
+        esperado = matrices.Matriz([f + [b[j]] for f, b in zip(singular, Bmix)]).gauss_jordan(especializado=False)
+        assert sol == esperado["solucion"]